@@ -0,0 +1,97 @@
+"""Memory benchmark for per-room runtime state.
+
+Compares the bytes per room held by the old layout (three dicts keyed by
+entity_id plus a role map) with the slotted DeviceRuntime records.
+
+Usage:
+    python benchmarks/bench_memory.py [--rooms 1000] [--ac 1] [--fh 1]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib.util
+import json
+from pathlib import Path
+import tracemalloc
+
+RUNTIME_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "room_hvac" / "runtime.py"
+
+
+def _load_runtime():
+    """Load runtime.py without importing the integration package (and HA)."""
+    spec = importlib.util.spec_from_file_location("room_hvac_runtime", RUNTIME_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _noop() -> None:
+    """Stand-in for a state listener unsubscribe callback."""
+
+
+def _entry_data(rooms: int, ac: int, fh: int) -> list[dict]:
+    """Build entry data the way HA does: decoded from JSON, one string per field."""
+    entries = [
+        {
+            "ac_entity_ids": [f"climate.room_{room}_ac_{i}" for i in range(ac)],
+            "fh_entity_ids": [f"climate.room_{room}_fh_{i}" for i in range(fh)],
+        }
+        for room in range(rooms)
+    ]
+    return json.loads(json.dumps(entries))
+
+
+def _legacy_state(data: dict) -> tuple:
+    """Per-room state as held before DeviceRuntime."""
+    ac_ids = list(data["ac_entity_ids"])
+    fh_ids = list(data["fh_entity_ids"])
+    role_by_entity = {**{e: "ac" for e in ac_ids}, **{e: "fh" for e in fh_ids}}
+    listeners = {e: _noop for e in role_by_entity}
+    last_internal_update = {e: 0.0 for e in role_by_entity}
+    correction_in_progress = {e: False for e in role_by_entity}
+    return ac_ids, fh_ids, role_by_entity, listeners, last_internal_update, correction_in_progress
+
+
+def _compact_state(runtime, data: dict) -> tuple:
+    """Per-room state as held with DeviceRuntime."""
+    devices = runtime.build_devices({"ac": data["ac_entity_ids"], "fh": data["fh_entity_ids"]})
+    for device in devices.values():
+        device.unsubscribe = _noop
+    ac_ids = tuple(d.entity_id for d in devices.values() if d.role == "ac")
+    fh_ids = tuple(d.entity_id for d in devices.values() if d.role == "fh")
+    return devices, ac_ids, fh_ids
+
+
+def _measure(build, entries: list[dict]) -> int:
+    """Return bytes allocated (and still held) while building every room."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rooms = [build(data) for data in entries]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rooms
+    return after - before
+
+
+def main() -> None:
+    """Run the benchmark and print bytes per room."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=1000)
+    parser.add_argument("--ac", type=int, default=1, help="AC devices per room")
+    parser.add_argument("--fh", type=int, default=1, help="FH devices per room")
+    args = parser.parse_args()
+
+    runtime = _load_runtime()
+    legacy = _measure(_legacy_state, _entry_data(args.rooms, args.ac, args.fh))
+    compact = _measure(lambda data: _compact_state(runtime, data), _entry_data(args.rooms, args.ac, args.fh))
+
+    print(f"rooms: {args.rooms}, devices per room: {args.ac} AC + {args.fh} FH")
+    print(f"legacy dicts:   {legacy / args.rooms:8.1f} bytes/room ({legacy} total)")
+    print(f"DeviceRuntime:  {compact / args.rooms:8.1f} bytes/room ({compact} total)")
+    print(f"saved:          {(legacy - compact) / args.rooms:8.1f} bytes/room ({1 - compact / legacy:.0%})")
+
+
+if __name__ == "__main__":
+    main()
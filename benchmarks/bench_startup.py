@@ -0,0 +1,148 @@
+"""Startup benchmark for the room_hvac integration.
+
+Reports how long importing the runtime modules takes (and whether any
+config-flow-only module came along), then starts a bare Home Assistant
+core with N room entries and measures the time until every room entity is
+available, plus the slowest per-entry setup phases:
+
+    climate_platform     building the room entity, handing it to the
+                         platform and registering its entity services
+    room_ready           the platform adding the entity, until its
+                         listeners, schedule, shared devices and control
+                         loop are set up
+    remaining_platforms  the other platforms of the entry
+
+Usage:
+    python benchmarks/bench_startup.py [--rooms 50] [--ac 1] [--fh 1]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = Path(__file__).resolve().parent.parent
+DOMAIN = "room_hvac"
+
+# Runs in a fresh interpreter, so the numbers are not skewed by this process.
+# Home Assistant modules any integration would find already loaded are
+# imported first; only the integration's own import cost is measured.
+_IMPORT_PROBE = """
+import json, sys, time
+import homeassistant.core, homeassistant.helpers.config_validation
+import homeassistant.helpers.entity_platform, homeassistant.helpers.storage
+import homeassistant.components.climate, homeassistant.components.sensor
+started = time.perf_counter()
+import custom_components.room_hvac
+import custom_components.room_hvac.climate
+import custom_components.room_hvac.sensor
+runtime = time.perf_counter() - started
+loaded = sorted(m for m in sys.modules if m.startswith("custom_components.room_hvac"))
+flow_loaded = "custom_components.room_hvac.config_flow" in sys.modules
+started = time.perf_counter()
+import custom_components.room_hvac.config_flow
+flow = time.perf_counter() - started
+print(json.dumps({"runtime_ms": runtime * 1000, "config_flow_ms": flow * 1000,
+                  "modules": loaded, "config_flow_loaded": flow_loaded}))
+"""
+
+
+def measure_import() -> dict:
+    """Return the import cost of the runtime path and of the config flow."""
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE],
+        cwd=REPO,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _entry_data(room: int, ac: int, fh: int) -> dict:
+    """Build v2 entry data for one room."""
+    return {
+        "ac_entity_ids": [f"climate.bench_{room}_ac_{i}" for i in range(ac)],
+        "fh_entity_ids": [f"climate.bench_{room}_fh_{i}" for i in range(fh)],
+        "force_mode": False,
+        "ac_presets": [],
+        "fh_presets": [],
+        "tuning": {},
+    }
+
+
+async def measure_startup(rooms: int, ac: int, fh: int) -> dict:
+    """Start a bare core with N entries and time until all rooms are available."""
+    from homeassistant import bootstrap, config_entries, loader
+    from homeassistant.core import HomeAssistant
+    from homeassistant.setup import async_setup_component
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.symlink(REPO / "custom_components", Path(config_dir) / "custom_components")
+        hass = HomeAssistant(config_dir)
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        # Registries, translations and config entries, as bootstrap loads them
+        await bootstrap.async_load_base_functionality(hass)
+
+        for room in range(rooms):
+            data = _entry_data(room, ac, fh)
+            for entity_id in data["ac_entity_ids"] + data["fh_entity_ids"]:
+                hass.states.async_set(entity_id, "off", {"current_temperature": 21.0})
+            hass.config_entries._entries[f"bench_{room}"] = config_entries.ConfigEntry(
+                version=2,
+                minor_version=1,
+                domain=DOMAIN,
+                title=f"Bench room {room}",
+                data=data,
+                source="user",
+                entry_id=f"bench_{room}",
+            )
+
+        started = time.perf_counter()
+        await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+        elapsed = time.perf_counter() - started
+
+        available = sum(
+            1 for state in hass.states.async_all("climate") if state.entity_id.startswith("climate.room_hvac")
+        )
+        timings = [timer.as_dict() for timer in hass.data[f"{DOMAIN}_hub"].setup_timings.values()]
+        await hass.async_stop(force=True)
+
+    slowest = max(timings, key=lambda phases: phases["total"], default={})
+    return {"elapsed_ms": elapsed * 1000, "available": available, "slowest_entry": slowest}
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--ac", type=int, default=1, help="AC devices per room")
+    parser.add_argument("--fh", type=int, default=1, help="FH devices per room")
+    args = parser.parse_args()
+    # Keep core warnings about the test devices out of the report
+    logging.basicConfig(level=logging.ERROR)
+
+    sys.path.insert(0, str(REPO))
+    imports = measure_import()
+    print(f"runtime import:   {imports['runtime_ms']:8.1f} ms ({len(imports['modules'])} modules)")
+    on_demand = "imported by the runtime path" if imports["config_flow_loaded"] else "loaded on demand"
+    print(f"config_flow:      {imports['config_flow_ms']:8.1f} ms ({on_demand})")
+
+    startup = asyncio.run(measure_startup(args.rooms, args.ac, args.fh))
+    print(f"rooms: {args.rooms}, devices per room: {args.ac} AC + {args.fh} FH")
+    print(f"all rooms available: {startup['elapsed_ms']:8.1f} ms ({startup['available']}/{args.rooms} available)")
+    print(f"per room:            {startup['elapsed_ms'] / max(args.rooms, 1):8.2f} ms")
+    print("slowest entry phases (ms):", json.dumps(startup["slowest_entry"]))
+
+
+if __name__ == "__main__":
+    main()
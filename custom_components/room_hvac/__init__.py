@@ -4,18 +4,61 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_HUB, CONFIG_ENTRY_VERSION
+from .hub import RoomHVACHub
+from .services import async_setup_services
+from .timing import SetupTimer
+from .websocket import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.CLIMATE]
+PLATFORMS = [Platform.CLIMATE, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up domain-wide resources and services."""
+    hub = hass.data[DATA_HUB] = RoomHVACHub(hass)
+    await hub.runtime.async_load()
+    await hub.budget.async_load()
+    await hub.arbiter.async_load()
+    await hub.outbox.async_load()
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, hub.async_shutdown)
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Upgrade a config entry to the current schema before it is set up."""
+    if entry.version > CONFIG_ENTRY_VERSION:
+        # Downgraded integration - refuse rather than guess
+        _LOGGER.error(
+            "Cannot migrate entry %s from future version %s", entry.entry_id, entry.version
+        )
+        return False
+    
+    if entry.version == 1:
+        from .migration import migrate_v1_to_v2
+        
+        hass.config_entries.async_update_entry(
+            entry, data=migrate_v1_to_v2(dict(entry.data)), version=2
+        )
+        _LOGGER.info("Migrated entry %s to version 2", entry.entry_id)
+    
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up room_hvac from a config entry."""
+    # Platforms mark their own phases on the same timer
+    timer = hass.data[DATA_HUB].setup_timings[entry.entry_id] = SetupTimer()
     
     # Initialize domain data structure
     hass.data.setdefault(DOMAIN, {})
@@ -23,8 +66,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # Forward setup to climate platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    timer.mark("remaining_platforms")
     
     _LOGGER.info("Room HVAC integration setup complete for entry: %s", entry.entry_id)
+    _LOGGER.debug("Setup phases of %s (ms): %s", entry.entry_id, timer.as_dict())
     return True
 
 
@@ -38,4 +83,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id, None)
         _LOGGER.info("Room HVAC integration unloaded for entry: %s", entry.entry_id)
     
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the stored runtime counters of a deleted room."""
+    hass.data[DATA_HUB].runtime.async_remove(entry.entry_id)
+    hass.data[DATA_HUB].setup_timings.pop(entry.entry_id, None)
\ No newline at end of file
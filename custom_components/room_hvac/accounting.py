@@ -0,0 +1,127 @@
+"""Runtime accounting per room, device role and HVAC mode."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    AC_HVAC_MODES,
+    FH_HVAC_MODES,
+    ROLE_AC,
+    ROLE_FH,
+    RUNTIME_STORAGE_VERSION,
+    RUNTIME_SAVE_DELAY,
+)
+
+
+def runtime_key(hvac_mode: str | None) -> str | None:
+    """Return the counter a committed HVAC mode runs under (e.g. "ac_cool")."""
+    if hvac_mode in AC_HVAC_MODES:
+        return f"{ROLE_AC}_{hvac_mode}"
+    if hvac_mode in FH_HVAC_MODES:
+        return f"{ROLE_FH}_{hvac_mode}"
+    return None
+
+
+class RoomRuntime:
+    """Runtime counters of one room.
+
+    Totals are seconds per counter key; at most one segment is open at a
+    time. Switching modes closes the open segment and opens the next one,
+    so every update is O(1) regardless of how long the room has run.
+    """
+
+    __slots__ = ("totals", "key", "since")
+
+    def __init__(self, totals: dict[str, float] | None = None) -> None:
+        """Initialize the counters."""
+        self.totals: dict[str, float] = dict(totals or {})
+        self.key: str | None = None
+        self.since = 0.0
+
+    def switch(self, key: str | None, now: float) -> bool:
+        """Close the open segment and start one for key; return True if it changed."""
+        if key == self.key:
+            return False
+        self.flush(now)
+        self.key = key
+        return True
+
+    def flush(self, now: float) -> None:
+        """Add the open segment's time to its total and restart it at now."""
+        if self.key is not None:
+            self.totals[self.key] = self.totals.get(self.key, 0.0) + (now - self.since)
+        self.since = now
+
+    def total(self, key: str, now: float) -> float:
+        """Return the seconds counted for key, including the open segment."""
+        total = self.totals.get(key, 0.0)
+        if key == self.key:
+            total += now - self.since
+        return total
+
+
+class RuntimeLedger:
+    """Runtime counters of all rooms, persisted in one debounced Store.
+
+    Rooms only mark the ledger dirty; the Store coalesces the saves of every
+    room into a single write at most once per RUNTIME_SAVE_DELAY, and flushes
+    on shutdown.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the ledger."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, float]]] = Store(
+            hass, RUNTIME_STORAGE_VERSION, f"{DOMAIN}.runtime"
+        )
+        self._rooms: dict[str, RoomRuntime] = {}
+        self._loaded: dict[str, dict[str, float]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored totals."""
+        self._loaded = await self._store.async_load() or {}
+
+    def room(self, entry_id: str) -> RoomRuntime:
+        """Return the counters of a room, creating them from storage if needed."""
+        room = self._rooms.get(entry_id)
+        if room is None:
+            room = self._rooms[entry_id] = RoomRuntime(self._loaded.get(entry_id))
+        return room
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Mark the ledger dirty; the Store batches the write."""
+        self._store.async_delay_save(self._data_to_save, RUNTIME_SAVE_DELAY)
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Forget the counters of a removed room."""
+        self._rooms.pop(entry_id, None)
+        self._loaded.pop(entry_id, None)
+        self.async_schedule_save()
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, float]]:
+        """Return the totals of every room with open segments folded in."""
+        now = self.hass.loop.time()
+        data = dict(self._loaded)
+        for entry_id, room in self._rooms.items():
+            room.flush(now)
+            data[entry_id] = dict(room.totals)
+        self._loaded = data
+        return data
+
+    def as_dict(self, entry_id: str) -> dict[str, Any]:
+        """Return a room's totals in seconds, for diagnostics."""
+        room = self._rooms.get(entry_id)
+        if room is None:
+            return dict(self._loaded.get(entry_id, {}))
+        keys = set(room.totals)
+        if room.key is not None:
+            keys.add(room.key)
+        now = self.hass.loop.time()
+        return {key: round(room.total(key, now), 1) for key in sorted(keys)}
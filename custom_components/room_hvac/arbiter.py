@@ -0,0 +1,262 @@
+"""Arbitration of downstream devices shared by several rooms."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from itertools import count
+import logging
+from typing import Any
+
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    SHARED_POLICY_COMFORT,
+    SHARED_POLICY_PRIORITY,
+    DEFAULT_SHARED_POLICY,
+    SHARED_STORAGE_VERSION,
+    SHARED_CONTEXT_MEMORY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Heating demands combine upwards under comfort, everything else downwards
+_HEATING_MODES = {HVACMode.HEAT}
+
+# A room's own (hvac_mode, temperature) demand on one of its devices
+DemandSource = Callable[[str], tuple[str, "float | None"]]
+
+
+class _SharedDevice:
+    """Demands of the rooms sharing one device, and what it was last sent."""
+
+    __slots__ = (
+        "rooms",
+        "modes",
+        "temperatures",
+        "active_since",
+        "sent_mode",
+        "sent_temperature",
+        "contexts",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the record."""
+        self.rooms: dict[str, int] = {}
+        self.modes: dict[str, str] = {}
+        self.temperatures: dict[str, float] = {}
+        # Order in which rooms turned their demand on; breaks priority ties
+        self.active_since: dict[str, int] = {}
+        self.sent_mode: str | None = None
+        self.sent_temperature: float | None = None
+        self.contexts: deque[str] = deque(maxlen=SHARED_CONTEXT_MEMORY)
+
+
+class SharedDeviceArbiter:
+    """Merges the demands of rooms that drive the same downstream device.
+
+    Every room keeps issuing its own commands; for a shared device they
+    update that room's demand instead, and only a change of the merged
+    demand is sent, once. The policy decides the merge:
+
+    - comfort: the highest-priority active room picks the mode (among
+      equals, the one that has been active longest); heating takes the
+      highest target, cooling/drying the lowest.
+    - eco: as comfort, but heating takes the lowest target and cooling the
+      highest.
+    - priority: the highest-priority active room's demand wins outright.
+
+    The contexts of merged commands are remembered so that no room treats
+    the resulting device updates as external edits. When a device becomes
+    shared, or shared again after a room was reloaded, every room's demand
+    is seeded from that room's current state, so a demand is never lost.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the arbiter."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SHARED_STORAGE_VERSION, f"{DOMAIN}.shared"
+        )
+        self.policy = DEFAULT_SHARED_POLICY
+        self._users: dict[str, set[str]] = {}
+        self._sources: dict[str, DemandSource] = {}
+        # Priority of every registered room, shared devices or not
+        self._priorities: dict[str, int] = {}
+        self._shared: dict[str, _SharedDevice] = {}
+        self._sequence = count()
+
+    async def async_load(self) -> None:
+        """Load the stored policy."""
+        stored = await self._store.async_load()
+        if stored:
+            self.policy = stored.get("policy", DEFAULT_SHARED_POLICY)
+
+    @callback
+    def async_set_policy(self, policy: str) -> None:
+        """Change and store the merge policy."""
+        self.policy = policy
+        self._store.async_delay_save(lambda: {"policy": self.policy}, 0)
+
+    @callback
+    def async_register(
+        self, entry_id: str, entity_ids: list[str], priority: int, source: DemandSource
+    ) -> None:
+        """Record which devices a room drives; devices with 2+ rooms become shared.
+
+        The source returns the room's own demand on a device; it seeds the
+        demand of every room of a shared device that has none recorded.
+        """
+        self._sources[entry_id] = source
+        self._priorities[entry_id] = priority
+        for entity_id in entity_ids:
+            users = self._users.setdefault(entity_id, set())
+            users.add(entry_id)
+            if len(users) > 1:
+                device = self._shared.get(entity_id)
+                if device is None:
+                    device = self._shared[entity_id] = _SharedDevice()
+                    _LOGGER.info("Device %s is shared by rooms %s", entity_id, sorted(users))
+                for user in users:
+                    device.rooms[user] = self._priorities.get(user, 0)
+                for user in sorted(users):
+                    if user not in device.modes:
+                        self._seed(device, entity_id, user)
+
+    def _seed(self, device: _SharedDevice, entity_id: str, entry_id: str) -> None:
+        """Record a room's current demand on a device as if it had just sent it."""
+        mode, temperature = self._sources[entry_id](entity_id)
+        self._set_mode(device, entry_id, mode)
+        if temperature is not None:
+            device.temperatures[entry_id] = temperature
+
+    def _set_mode(self, device: _SharedDevice, entry_id: str, mode: str) -> None:
+        """Record a room's mode demand and when its demand turned on."""
+        if mode == HVACMode.OFF:
+            device.active_since.pop(entry_id, None)
+        elif device.modes.get(entry_id, HVACMode.OFF) == HVACMode.OFF:
+            device.active_since[entry_id] = next(self._sequence)
+        device.modes[entry_id] = mode
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        """Forget a room and its demands."""
+        self._sources.pop(entry_id, None)
+        self._priorities.pop(entry_id, None)
+        for entity_id, users in list(self._users.items()):
+            users.discard(entry_id)
+            device = self._shared.get(entity_id)
+            if device is not None:
+                device.rooms.pop(entry_id, None)
+                device.modes.pop(entry_id, None)
+                device.temperatures.pop(entry_id, None)
+                device.active_since.pop(entry_id, None)
+                if len(users) < 2:
+                    del self._shared[entity_id]
+            if not users:
+                del self._users[entity_id]
+
+    def is_shared(self, entity_id: str) -> bool:
+        """Return True if more than one room drives the device."""
+        return entity_id in self._shared
+
+    def shared_entity_ids(self, entity_ids: tuple[str, ...]) -> list[str]:
+        """Return which of a room's devices are shared."""
+        return [entity_id for entity_id in entity_ids if entity_id in self._shared]
+
+    def _lead_room(self, device: _SharedDevice) -> str | None:
+        """Return the highest-priority room with an active demand.
+
+        Among rooms of equal priority the one active longest leads, so a
+        room joining with the same priority does not take the device over.
+        """
+        active = [room for room, mode in device.modes.items() if mode != HVACMode.OFF]
+        if not active:
+            return None
+        return max(
+            active, key=lambda room: (device.rooms.get(room, 0), -device.active_since.get(room, 0))
+        )
+
+    def merged(self, entity_id: str) -> tuple[str, float | None]:
+        """Return the merged (hvac_mode, temperature) demand of a shared device."""
+        device = self._shared[entity_id]
+        lead = self._lead_room(device)
+        if lead is None:
+            return HVACMode.OFF, None
+        mode = device.modes[lead]
+        if self.policy == SHARED_POLICY_PRIORITY:
+            return mode, device.temperatures.get(lead)
+
+        targets = [
+            device.temperatures[room]
+            for room, room_mode in device.modes.items()
+            if room_mode == mode and room in device.temperatures
+        ]
+        if not targets:
+            return mode, None
+        upwards = (mode in _HEATING_MODES) == (self.policy == SHARED_POLICY_COMFORT)
+        return mode, max(targets) if upwards else min(targets)
+
+    def demand_of(self, entity_id: str, entry_id: str) -> tuple[str | None, float | None]:
+        """Return the (hvac_mode, temperature) a room last asked of a shared device."""
+        device = self._shared[entity_id]
+        return device.modes.get(entry_id), device.temperatures.get(entry_id)
+
+    def demand(
+        self, entity_id: str, entry_id: str, service: str, service_data: dict[str, Any]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Fold a room's command into its demand; return the merged commands to send.
+
+        Only the parts of the merged demand that differ from what the device
+        was last sent are returned, so the list is empty when nothing changed.
+        A mode change may also move the merged target (a room dropping out),
+        in which case the new target follows. Commands other than mode and
+        temperature pass through.
+        """
+        device = self._shared[entity_id]
+        if service == "set_hvac_mode":
+            self._set_mode(device, entry_id, service_data["hvac_mode"])
+        elif service == "set_temperature":
+            device.temperatures[entry_id] = service_data[ATTR_TEMPERATURE]
+        else:
+            return [(service, service_data)]
+
+        mode, temperature = self.merged(entity_id)
+        commands = []
+        if mode != device.sent_mode and service == "set_hvac_mode":
+            commands.append(("set_hvac_mode", {"hvac_mode": mode}))
+        if temperature is not None and temperature != device.sent_temperature:
+            commands.append(("set_temperature", {ATTR_TEMPERATURE: temperature}))
+        return commands
+
+    def sent(self, entity_id: str, service: str, service_data: dict[str, Any]) -> None:
+        """Record a merged command the device accepted."""
+        device = self._shared[entity_id]
+        if service == "set_hvac_mode":
+            device.sent_mode = service_data["hvac_mode"]
+        elif service == "set_temperature":
+            device.sent_temperature = service_data[ATTR_TEMPERATURE]
+
+    def note_context(self, entity_id: str, context_id: str) -> None:
+        """Remember the context of a command sent to a shared device."""
+        self._shared[entity_id].contexts.append(context_id)
+
+    def is_own_update(self, entity_id: str, context_id: str | None) -> bool:
+        """Return True if a device update was caused by any room's merged command."""
+        device = self._shared.get(entity_id)
+        return device is not None and context_id in device.contexts
+
+    def stats(self) -> dict[str, Any]:
+        """Return the policy and the merged demand of every shared device."""
+        devices = {}
+        for entity_id, device in self._shared.items():
+            mode, temperature = self.merged(entity_id)
+            devices[entity_id] = {
+                "rooms": sorted(device.rooms),
+                "hvac_mode": mode,
+                "temperature": temperature,
+            }
+        return {"policy": self.policy, "devices": devices}
@@ -0,0 +1,231 @@
+"""Building-wide power budget for concurrently active room_hvac devices."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+from itertools import count
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    ROLE_AC,
+    ROLE_FH,
+    BUDGET_STORAGE_VERSION,
+    BUDGET_MAX_AC,
+    BUDGET_MAX_FH,
+    BUDGET_MAX_POWER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BudgetExceeded(HomeAssistantError):
+    """Raised when a room could not be admitted within its maximum wait."""
+
+
+class _Request:
+    """One room group asking to start, held while queued and while granted."""
+
+    __slots__ = ("key", "role", "units", "power", "priority", "enqueued", "future")
+
+    def __init__(
+        self, key: tuple[str, str], units: int, power: float, priority: int, now: float
+    ) -> None:
+        """Initialize the request."""
+        self.key = key
+        self.role = key[1]
+        self.units = units
+        self.power = power
+        self.priority = priority
+        self.enqueued = now
+        self.future: asyncio.Future[None] | None = None
+
+
+class PowerBudget:
+    """Admission control for starting device groups across all rooms.
+
+    Limits are a maximum number of running AC devices, of running FH
+    devices, and a maximum weighted power sum; any of them may be unset.
+    Starts that do not fit wait in a priority queue (higher priority
+    first, FIFO within a priority). The head of the queue is never
+    overtaken, so large groups are not starved by small ones; a request
+    that waits longer than its maximum wait is rejected.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the budget."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, BUDGET_STORAGE_VERSION, f"{DOMAIN}.budget"
+        )
+        self.limits: dict[str, float | None] = {
+            BUDGET_MAX_AC: None,
+            BUDGET_MAX_FH: None,
+            BUDGET_MAX_POWER: None,
+        }
+
+        self._granted: dict[tuple[str, str], _Request] = {}
+        self._queue: list[tuple[int, int, _Request]] = []
+        self._seq = count()
+        self._units = {ROLE_AC: 0, ROLE_FH: 0}
+        self._power = 0.0
+
+        # Queue statistics
+        self.admitted = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.longest_wait = 0.0
+
+    async def async_load(self) -> None:
+        """Load the stored limits."""
+        stored = await self._store.async_load()
+        if stored:
+            self.limits.update(stored)
+
+    @callback
+    def async_set_limits(self, limits: dict[str, float | None]) -> None:
+        """Change the limits, store them and admit whatever now fits."""
+        self.limits.update(limits)
+        self._store.async_delay_save(lambda: dict(self.limits), 0)
+        self._admit()
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if any limit is set."""
+        return any(limit is not None for limit in self.limits.values())
+
+    def _fits(self, request: _Request) -> bool:
+        """Return True if granting the request keeps every limit."""
+        limit = self.limits[BUDGET_MAX_AC if request.role == ROLE_AC else BUDGET_MAX_FH]
+        if limit is not None and self._units[request.role] + request.units > limit:
+            # A group larger than the limit may still run alone
+            if self._units[request.role]:
+                return False
+        limit = self.limits[BUDGET_MAX_POWER]
+        if limit is not None and self._power + request.power > limit:
+            if self._power:
+                return False
+        return True
+
+    def _grant(self, request: _Request) -> None:
+        """Count a request against the budget."""
+        self._granted[request.key] = request
+        self._units[request.role] += request.units
+        self._power += request.power
+        self.admitted += 1
+
+    async def async_acquire(
+        self,
+        entry_id: str,
+        role: str,
+        units: int,
+        power: float,
+        priority: int,
+        max_wait: float,
+    ) -> float:
+        """Wait until a room's group may start; return the seconds waited.
+
+        Re-acquiring a group that is already granted is a no-op.
+        """
+        key = (entry_id, role)
+        if key in self._granted:
+            return 0.0
+
+        now = self.hass.loop.time()
+        request = _Request(key, units, power, priority, now)
+        if not self._queue and self._fits(request):
+            self._grant(request)
+            return 0.0
+
+        request.future = self.hass.loop.create_future()
+        heapq.heappush(self._queue, (-priority, next(self._seq), request))
+        self.delayed += 1
+        _LOGGER.debug("Room %s %s queued for power budget (%d waiting)", entry_id, role, len(self._queue))
+        admitted = False
+        try:
+            async with asyncio.timeout(max_wait):
+                await request.future
+            admitted = True
+        except TimeoutError:
+            self.rejected += 1
+            raise BudgetExceeded(
+                f"{role.upper()} start for {entry_id} not admitted within {max_wait:g} s"
+            ) from None
+        finally:
+            if not admitted:
+                # Timed out or cancelled: leave the queue (or hand back a grant
+                # that raced with the timeout) and let the next one in
+                if request.future.done() and not request.future.cancelled():
+                    self._revoke(request)
+                else:
+                    request.future.cancel()
+                self._admit()
+
+        waited = self.hass.loop.time() - now
+        self.longest_wait = max(self.longest_wait, waited)
+        return waited
+
+    def _revoke(self, request: _Request) -> bool:
+        """Take a granted request off the budget; return True if it was granted."""
+        if self._granted.get(request.key) is not request:
+            return False
+        del self._granted[request.key]
+        self._units[request.role] -= request.units
+        self._power -= request.power
+        return True
+
+    @callback
+    def async_release(self, entry_id: str, role: str | None = None) -> None:
+        """Return a room's granted group (or all of its groups) to the budget."""
+        roles = (role,) if role is not None else (ROLE_AC, ROLE_FH)
+        released = False
+        for item in roles:
+            request = self._granted.get((entry_id, item))
+            if request is not None:
+                released |= self._revoke(request)
+        if released:
+            self._admit()
+
+    def is_granted(self, entry_id: str, role: str) -> bool:
+        """Return True if a room's group currently holds budget."""
+        return (entry_id, role) in self._granted
+
+    def is_waiting(self, entry_id: str) -> bool:
+        """Return True if a room has a start waiting in the queue."""
+        return any(
+            request.key[0] == entry_id and not request.future.done()
+            for _, _, request in self._queue
+        )
+
+    @callback
+    def _admit(self) -> None:
+        """Grant queued requests in order for as long as the head fits."""
+        while self._queue:
+            request = self._queue[0][2]
+            if request.future.done():
+                heapq.heappop(self._queue)
+                continue
+            if not self._fits(request):
+                break
+            heapq.heappop(self._queue)
+            self._grant(request)
+            request.future.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return usage and queue statistics."""
+        return {
+            "limits": dict(self.limits),
+            "active_ac": self._units[ROLE_AC],
+            "active_fh": self._units[ROLE_FH],
+            "power": self._power,
+            "waiting": sum(1 for _, _, r in self._queue if not r.future.done()),
+            "admitted": self.admitted,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "longest_wait_s": round(self.longest_wait, 1),
+        }
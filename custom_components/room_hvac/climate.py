@@ -1,21 +1,148 @@
 """Climate platform for room_hvac integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
+from functools import partial
 import logging
+from statistics import fmean
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
-from homeassistant.components.climate.const import HVACMode
+from homeassistant.components.climate.const import (
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_TARGET_TEMP_LOW,
+    HVACAction,
+    HVACMode,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant, Event, CALLBACK_TYPE
+from homeassistant.const import ATTR_TEMPERATURE, STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfTemperature
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, Event, Context, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SUPPORTED_HVAC_MODES, AC_HVAC_MODES, FH_HVAC_MODES
+from .const import (
+    DOMAIN,
+    DATA_HUB,
+    SUPPORTED_HVAC_MODES,
+    AC_HVAC_MODES,
+    FH_HVAC_MODES,
+    ROLE_AC,
+    ROLE_FH,
+    CONF_AC_ENTITY_IDS,
+    CONF_FH_ENTITY_IDS,
+    CONF_TEMPERATURE_AGGREGATE,
+    CONF_TEMPERATURE_SENSORS,
+    CONF_SCHEDULE,
+    CONF_HYBRID_BOOST,
+    CONF_DEADBAND_CONTROL,
+    CONF_FORCE_MODE,
+    CONF_AC_PRESETS,
+    CONF_FH_PRESETS,
+    CONF_TUNING,
+    CONF_INTERNAL_UPDATE_WINDOW,
+    CONF_TRANSITION_CONFIRM_TIMEOUT,
+    CONF_MAX_STATE_AGE,
+    CONF_SENSOR_SMOOTHING,
+    CONF_PUBLISH_MIN_DELTA,
+    CONF_PUBLISH_MIN_INTERVAL,
+    CONF_PRIORITY,
+    CONF_BUDGET_MAX_WAIT,
+    CONF_AC_DEVICE_POWER,
+    CONF_FH_DEVICE_POWER,
+    CONF_BOOST_START_GAP,
+    CONF_BOOST_STOP_GAP,
+    CONF_CONTROL_DEADBAND,
+    CONF_MIN_ON_TIME,
+    CONF_MIN_OFF_TIME,
+    CONF_AUTO_HYSTERESIS,
+    CONF_AUTO_MIN_DWELL,
+    REFRESH_WAIT_TIMEOUT,
+    TEMPERATURE_AGGREGATE_MIN,
+    TEMPERATURE_AGGREGATE_MAX,
+    DEFAULT_TUNING,
+    SERVICE_SET_PRESET,
+    SERVICE_SET_SCHEDULE,
+    SERVICE_CLAIM,
+    SERVICE_RELEASE,
+    ATTR_PRESET_ID,
+    ATTR_SCHEDULE,
+    ATTR_SOURCE,
+    ATTR_LEASE_PRIORITY,
+    ATTR_TTL,
+    DEFAULT_LEASE_PRIORITY,
+    MAX_LEASE_PRIORITY,
+    DEFAULT_LEASE_TTL,
+    MAX_LEASE_TTL,
+    SCHEDULE_DAYS,
+    SCHEDULE_TIME,
+    SCHEDULE_HVAC_MODE,
+    SCHEDULE_PRESET_ID,
+    SCHEDULE_TEMPERATURE,
+    SCHEDULE_PRESTART,
+    SCHEDULE_DUE_IN,
+    THERMAL_WINDOW,
+    THERMAL_MIN_SAMPLE_INTERVAL,
+    THERMAL_DEADBAND,
+    PRESTART_MAX_LEAD,
+    PRESTART_STEP,
+    PRESET_ID,
+    PRESET_NAME,
+    PRESET_FAN_MODE,
+    PRESET_TEMPERATURE,
+    PRESET_HVAC_MODE,
+    PRESET_SWING_MODE,
+)
+from .accounting import RoomRuntime, runtime_key
+from .budget import BudgetExceeded
+from .lease import Lease, RoomLeases
+from .outbox import replay_batch
+from .refresh import state_age
+from .runtime import DeviceRuntime, build_devices
+from .scheduler import compile_prestart, compile_schedule
+from .smoothing import SmoothedReading
+from .thermal import ThermalModel
+from .tasks import TaskRegistry
+from .trace import RoutingTrace
+from .transition import ModeTransition, TransitionPhase
 
 _LOGGER = logging.getLogger(__name__)
 
+SCHEDULE_RECORD_SCHEMA = vol.All(
+    {
+        vol.Required(SCHEDULE_DAYS): cv.weekdays,
+        vol.Required(SCHEDULE_TIME): cv.time,
+        vol.Optional(SCHEDULE_HVAC_MODE): vol.In(SUPPORTED_HVAC_MODES),
+        vol.Optional(SCHEDULE_PRESET_ID): cv.string,
+        vol.Optional(SCHEDULE_TEMPERATURE): vol.Coerce(float),
+    },
+    cv.has_at_least_one_key(SCHEDULE_HVAC_MODE, SCHEDULE_PRESET_ID, SCHEDULE_TEMPERATURE),
+)
+
+# A lease command uses the fields of a schedule record, all optional
+CLAIM_SCHEMA = {
+    vol.Required(ATTR_SOURCE): cv.string,
+    vol.Optional(ATTR_LEASE_PRIORITY, default=DEFAULT_LEASE_PRIORITY): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_LEASE_PRIORITY)
+    ),
+    vol.Optional(ATTR_TTL, default=DEFAULT_LEASE_TTL): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_LEASE_TTL)
+    ),
+    vol.Optional(SCHEDULE_HVAC_MODE): vol.In(SUPPORTED_HVAC_MODES),
+    vol.Optional(SCHEDULE_PRESET_ID): cv.string,
+    vol.Optional(SCHEDULE_TEMPERATURE): vol.Coerce(float),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,7 +151,48 @@ async def async_setup_entry(
 ) -> None:
     """Set up the room_hvac climate platform."""
     data = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([RoomHVACClimateEntity(entry.entry_id, data)])
+    entity = RoomHVACClimateEntity(entry.entry_id, data)
+    async_add_entities([entity])
+    
+    # Apply a preset by its stable id, which survives display-name renames
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SET_PRESET,
+        {vol.Required(ATTR_PRESET_ID): cv.string},
+        "async_set_preset_id",
+    )
+    
+    # Replace the room's native comfort schedule (stored in the entry)
+    platform.async_register_entity_service(
+        SERVICE_SET_SCHEDULE,
+        {vol.Required(ATTR_SCHEDULE): vol.All(cv.ensure_list, [SCHEDULE_RECORD_SCHEMA])},
+        "async_set_schedule",
+    )
+    
+    # Claim the room for a command source, or give a claim up
+    platform.async_register_entity_service(SERVICE_CLAIM, CLAIM_SCHEMA, "async_claim")
+    platform.async_register_entity_service(
+        SERVICE_RELEASE, {vol.Required(ATTR_SOURCE): cv.string}, "async_release"
+    )
+    
+    # The platform phase covers building the entity, handing it to the platform
+    # and registering its services; the add itself finishes in room_ready
+    timer = hass.data[DATA_HUB].setup_timings.get(entry.entry_id)
+    if timer is not None:
+        timer.mark("climate_platform")
+
+
+def _aggregate(values: list[float], method: str) -> float | None:
+    """Combine readings from a device group into one value."""
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    if method == TEMPERATURE_AGGREGATE_MIN:
+        return min(values)
+    if method == TEMPERATURE_AGGREGATE_MAX:
+        return max(values)
+    return round(fmean(values), 2)
 
 
 class RoomHVACClimateEntity(ClimateEntity):
@@ -32,14 +200,17 @@ class RoomHVACClimateEntity(ClimateEntity):
     
     # Core entity properties - using constants from const.py
     _attr_hvac_modes = SUPPORTED_HVAC_MODES
-    _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+        | ClimateEntityFeature.PRESET_MODE
+    )
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_target_temperature_step = 1.0
     
     def __init__(self, entry_id: str, data: dict[str, Any]) -> None:
         """Initialize the room_hvac climate entity."""
         self._entry_id = entry_id
-        self._data = data
         
         # Entity identity
         self._attr_name = "Room HVAC"
@@ -49,78 +220,389 @@ class RoomHVACClimateEntity(ClimateEntity):
         self._attr_hvac_mode = HVACMode.OFF
         self._attr_preset_mode = None
         self._attr_target_temperature = None
+        self._attr_target_temperature_low = None
+        self._attr_target_temperature_high = None
         self._attr_current_temperature = None
         
-        # State change listeners and tracking
-        self._listeners: dict[str, CALLBACK_TYPE] = {}
-        self._last_internal_update: dict[str, float] = {}  # timestamp of last internal update
+        # Configuration is read once here; the raw entry dict is not kept around.
+        # Entries are migrated to the v2 schema before setup, so presets are
+        # already typed and ordered - they are indexed here, never re-parsed.
+        self._force_mode: bool = data.get(CONF_FORCE_MODE, False)
+        self._ac_presets: dict[str, dict[str, Any]] = {
+            preset[PRESET_NAME]: preset for preset in data.get(CONF_AC_PRESETS, [])
+        }
+        self._fh_presets: dict[str, dict[str, Any]] = {
+            preset[PRESET_NAME]: preset for preset in data.get(CONF_FH_PRESETS, [])
+        }
+        self._ac_preset_names = list(self._ac_presets)
+        self._fh_preset_names = list(self._fh_presets)
+        
+        tuning = {**DEFAULT_TUNING, **data.get(CONF_TUNING, {})}
+        self._temperature_aggregate: str = tuning[CONF_TEMPERATURE_AGGREGATE]
+        self._internal_update_window: float = tuning[CONF_INTERNAL_UPDATE_WINDOW]
+        self._transition_confirm_timeout: float = tuning[CONF_TRANSITION_CONFIRM_TIMEOUT]
+        self._max_state_age: float = tuning[CONF_MAX_STATE_AGE]
+        self._priority: int = tuning[CONF_PRIORITY]
+        self._budget_max_wait: float = tuning[CONF_BUDGET_MAX_WAIT]
+        self._device_power: dict[str, float] = {
+            ROLE_AC: tuning[CONF_AC_DEVICE_POWER],
+            ROLE_FH: tuning[CONF_FH_DEVICE_POWER],
+        }
+        self._budget_wait: float | None = None
+        
+        # Hybrid boost: AC heat alongside FH while far below target
+        self._hybrid_boost: bool = data.get(CONF_HYBRID_BOOST, False)
+        self._boost_start_gap: float = tuning[CONF_BOOST_START_GAP]
+        self._boost_stop_gap: float = tuning[CONF_BOOST_STOP_GAP]
+        self._boost_active = False
+        self._boost_task: asyncio.Task[None] | None = None
+        
+        # Deadband control: the hub's shared tick cycles the active group
+        # while the room holds heat or cool
+        self._deadband_control: bool = data.get(CONF_DEADBAND_CONTROL, False)
+        self._control_deadband: float = tuning[CONF_CONTROL_DEADBAND]
+        self._min_on_time: float = tuning[CONF_MIN_ON_TIME]
+        self._min_off_time: float = tuning[CONF_MIN_OFF_TIME]
+        self._control_idle = False
+        
+        # heat_cool: the side (heat on FH or cool on AC) the room currently
+        # runs, chosen with hysteresis and held for a minimum dwell
+        self._auto_hysteresis: float = tuning[CONF_AUTO_HYSTERESIS]
+        self._auto_min_dwell: float = tuning[CONF_AUTO_MIN_DWELL]
+        self._auto_side: str | None = None
+        self._auto_since = 0.0
+        # The last side switch failed; the retry waits for the dwell as well
+        self._auto_failed = False
+        self._auto_switches = 0
+        self._auto_task: asyncio.Task[None] | None = None
+        self._auto_timer: CALLBACK_TYPE | None = None
+        
+        # Command-source leases (see lease.py) and the timer of the first expiry
+        self._leases = RoomLeases()
+        self._lease_timer: CALLBACK_TYPE | None = None
+        
+        # Optional external sensors; when set they are the room's temperature
+        # in every mode, smoothed and gated before each state write
+        self._temperature_sensors: tuple[str, ...] = tuple(data.get(CONF_TEMPERATURE_SENSORS, []))
+        self._sensor_reading = SmoothedReading(
+            tuning[CONF_SENSOR_SMOOTHING],
+            tuning[CONF_PUBLISH_MIN_DELTA],
+            tuning[CONF_PUBLISH_MIN_INTERVAL],
+        )
+        self._sensor_unsubscribe: CALLBACK_TYPE | None = None
+        self._sensor_publish_timer: CALLBACK_TYPE | None = None
+        
+        # Comfort schedule records; run by the hub's schedule wheel
+        self._schedule: list[dict[str, Any]] = list(data.get(CONF_SCHEDULE, []))
+        
+        # Heat-up/cool-down rates learned from observed temperatures, used to
+        # start scheduled heating or cooling early enough to be on time
+        self._thermal = ThermalModel(THERMAL_WINDOW, THERMAL_MIN_SAMPLE_INTERVAL)
+        
+        # Runtime counters, bound to the hub's ledger once added to hass
+        self._runtime: RoomRuntime | None = None
+        
+        # Per-device runtime state (listener, internal update time, correction
+        # flag) in one slotted record per device - see runtime.py
+        self._devices: dict[str, DeviceRuntime] = build_devices({
+            ROLE_AC: data.get(CONF_AC_ENTITY_IDS, []),
+            ROLE_FH: data.get(CONF_FH_ENTITY_IDS, []),
+        })
+        
+        # Downstream device groups - every role may hold several devices
+        self._ac_entity_ids: tuple[str, ...] = tuple(
+            d.entity_id for d in self._devices.values() if d.role == ROLE_AC
+        )
+        self._fh_entity_ids: tuple[str, ...] = tuple(
+            d.entity_id for d in self._devices.values() if d.role == ROLE_FH
+        )
+        
         self._is_external_update = False  # Flag to detect external modifications
-        self._correction_in_progress: dict[str, bool] = {}  # Prevent recursive corrections
+        
+        # Structured record of recent routing decisions (see trace.py)
+        self._trace = RoutingTrace()
+        
+        # Every background task this room starts (see tasks.py); bound to
+        # hass once added
+        self._tasks: TaskRegistry | None = None
+        
+        # In-flight mode switch (see transition.py) and the mode whose group a
+        # cancelled transition may have left running
+        self._transition: ModeTransition | None = None
+        self._energized_mode: str | None = None
     
     async def async_added_to_hass(self) -> None:
         """Set up state change listeners when entity is added to Home Assistant."""
         await super().async_added_to_hass()
         
-        # Get AC and FH entity IDs from config
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
+        # Register with the domain hub so domain services can reach this room
+        self.hass.data[DATA_HUB].entities[self._entry_id] = self
+        self._tasks = TaskRegistry(self.hass, self._entry_id)
+        self._runtime = self.hass.data[DATA_HUB].runtime.room(self._entry_id)
+        self.hass.data[DATA_HUB].arbiter.async_register(
+            self._entry_id, list(self._devices), self._priority, self._own_demand
+        )
         
-        # Set up state change listeners for both devices
-        if ac_entity_id:
-            self._listeners[ac_entity_id] = async_track_state_change_event(
-                self.hass,
-                [ac_entity_id],
-                self._handle_state_change,
+        self._subscribe_devices()
+        self._register_schedule()
+        
+        # Commands queued before a restart go out to devices that are already back
+        for entity_id in self._devices:
+            state = self.hass.states.get(entity_id)
+            if state is not None and self._outbox_ready(entity_id, state.state):
+                self._tasks.create(self._async_replay_outbox(entity_id), f"outbox_replay {entity_id}")
+        if self._deadband_control:
+            self.hass.data[DATA_HUB].controller.async_register(
+                self._entry_id,
+                self._control_dispatch,
+                self._control_deadband,
+                self._min_on_time,
+                self._min_off_time,
             )
-            _LOGGER.debug("Setup state listener for AC: %s", ac_entity_id)
         
-        if fh_entity_id:
-            self._listeners[fh_entity_id] = async_track_state_change_event(
+        _LOGGER.info("State change listeners initialized for entry: %s", self._entry_id)
+        timer = self.hass.data[DATA_HUB].setup_timings.get(self._entry_id)
+        if timer is not None and "room_ready" not in timer.phases:
+            timer.mark("room_ready")
+    
+    def _subscribe_devices(self) -> None:
+        """Set up state change listeners for the AC and FH devices.
+        
+        Safe to call again: existing listeners are replaced, which lets the
+        profiler rebind them to instrumented callbacks without a restart.
+        """
+        self._unsubscribe_devices()
+        
+        # Set up state change listeners for every device in both groups
+        for device in self._devices.values():
+            device.unsubscribe = async_track_state_change_event(
                 self.hass,
-                [fh_entity_id],
+                [device.entity_id],
                 self._handle_state_change,
             )
-            _LOGGER.debug("Setup state listener for FH: %s", fh_entity_id)
+            state = self.hass.states.get(device.entity_id)
+            self._cache_reading(device, state)
+            if state is not None and device.last_seen is None:
+                device.last_seen = self.hass.loop.time() - state_age(state, dt_util.utcnow())
+                device.available = state.state != STATE_UNAVAILABLE
+            _LOGGER.debug("Setup state listener for %s: %s", device.role.upper(), device.entity_id)
+        
+        if self._temperature_sensors:
+            self._sensor_unsubscribe = async_track_state_change_event(
+                self.hass,
+                list(self._temperature_sensors),
+                self._handle_sensor_change,
+            )
+            self._update_sensor_reading()
+    
+    def _unsubscribe_devices(self) -> None:
+        """Remove all downstream state change listeners."""
+        for device in self._devices.values():
+            if device.unsubscribe is not None:
+                device.unsubscribe()
+                device.unsubscribe = None
+                _LOGGER.debug("Removed state listener for: %s", device.entity_id)
+        if self._sensor_unsubscribe is not None:
+            self._sensor_unsubscribe()
+            self._sensor_unsubscribe = None
+        if self._sensor_publish_timer is not None:
+            self._sensor_publish_timer()
+            self._sensor_publish_timer = None
+    
+    @callback
+    def _handle_sensor_change(self, event: Event) -> None:
+        """Fold an external sensor update into the room temperature."""
+        if self._update_sensor_reading():
+            self._observe_temperature()
+            self._schedule_boost_update()
+            self._update_control()
+            self._schedule_auto_update()
+            self._write_sensor_reading()
+            return
+        
+        # A real change held back by the min interval is published when it ends,
+        # so the last reading is not lost if the sensor goes quiet
+        held_for = self._sensor_reading.held_for(self.hass.loop.time())
+        if held_for is not None and self._sensor_publish_timer is None:
+            self._sensor_publish_timer = async_call_later(
+                self.hass, held_for, self._publish_held_sensor_reading
+            )
+    
+    @callback
+    def _publish_held_sensor_reading(self, _now: Any) -> None:
+        """Publish a sensor reading that was held back by the min interval."""
+        self._sensor_publish_timer = None
+        if self._sensor_reading.publish(self.hass.loop.time()):
+            self._write_sensor_reading()
+    
+    def _observe_temperature(self) -> None:
+        """Feed the thermal model while the room is actively heating or cooling.
+        
+        Readings only count while the room is clearly short of its target in
+        heat or cool; anything else (other modes, mid-transition, holding at
+        target) breaks the series so idle periods never dilute the rates.
+        """
+        mode = self._attr_hvac_mode
+        current = self.current_temperature
+        target = self._attr_target_temperature
+        if (
+            self._transition is not None
+            or mode not in (HVACMode.HEAT, HVACMode.COOL)
+            or current is None
+            or target is None
+        ):
+            self._thermal.break_series()
+            return
         
-        _LOGGER.info("State change listeners initialized for entry: %s", self._entry_id)
+        if mode == HVACMode.HEAT:
+            driving = current < target - THERMAL_DEADBAND
+        else:
+            driving = current > target + THERMAL_DEADBAND
+        if not driving:
+            self._thermal.break_series()
+            return
+        self._thermal.observe(mode, current, self.hass.loop.time())
+    
+    def _write_sensor_reading(self) -> None:
+        """Write state for a new published sensor reading."""
+        # Mid-transition the commit writes state anyway
+        if self._transition is None:
+            self.async_write_ha_state()
+    
+    def _update_sensor_reading(self) -> bool:
+        """Aggregate the external sensors and feed the smoothed reading.
+        
+        Returns True when the published temperature changed.
+        """
+        readings = []
+        for entity_id in self._temperature_sensors:
+            state = self.hass.states.get(entity_id)
+            if state is None:
+                continue
+            try:
+                readings.append(float(state.state))
+            except ValueError:
+                # unavailable / unknown
+                continue
+        
+        value = _aggregate(readings, self._temperature_aggregate)
+        if value is None:
+            changed = self._sensor_reading.published is not None
+            self._sensor_reading.reset()
+            return changed
+        return self._sensor_reading.add(value, self.hass.loop.time())
     
+    @callback
     def _handle_state_change(self, event: Event) -> None:
-        """Handle state changes from downstream AC/FH devices."""
+        """Handle state changes from downstream AC/FH devices.
+        
+        Runs on the event loop; anything that has to wait on a device (a
+        force-mode correction) is started as a tracked task.
+        """
         entity_id = event.data.get("entity_id")
         old_state = event.data.get("old_state")
         new_state = event.data.get("new_state")
         
-        if not entity_id or not new_state:
+        device = self._devices.get(entity_id)
+        if device is None or not new_state:
+            return
+        device.last_seen = self.hass.loop.time()
+        device.available = new_state.state != STATE_UNAVAILABLE
+        reading_moved = self._cache_reading(device, new_state)
+        self._refresh_stale_readings()
+        
+        active = self._active_entity_ids()
+        if entity_id in active:
+            self._observe_temperature()
+            self._schedule_boost_update()
+            self._update_control()
+        # heat_cool reads the room from both groups
+        self._schedule_auto_update()
+        
+        # Without an active group the room shows the readings of all devices,
+        # which no other path writes
+        if reading_moved and not active and not self._temperature_sensors and self._transition is None:
+            self.async_write_ha_state()
+        
+        # Updates caused by merged commands on a shared device are ours, whichever room sent them
+        if self.hass.data[DATA_HUB].arbiter.is_own_update(entity_id, event.context.id):
+            self._trace.record(
+                "state_change", entity_id, outcome="ignored_shared",
+                context_id=event.context.id,
+            )
+            return
+        
+        # Mid-switch events are classified by the transition, never against half-updated state
+        if self._transition is not None:
+            self._absorb_transition_event(entity_id, new_state.state, event)
+            return
+        
+        # A device dropping out is not an edit; commands for it wait in the outbox
+        if new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._trace.record(
+                "state_change", entity_id, args={"to": new_state.state},
+                outcome="unavailable", context_id=event.context.id,
+            )
+            # Only the health attribute changes
+            self.async_write_ha_state()
+            return
+        
+        # A device that is back gets what it missed; its return is not an external edit
+        if self._outbox_ready(entity_id, new_state.state):
+            self._trace.record(
+                "state_change", entity_id, args={"to": new_state.state},
+                outcome="back_online", context_id=event.context.id,
+            )
+            self._tasks.create(self._async_replay_outbox(entity_id), f"outbox_replay {entity_id}")
+            self.async_write_ha_state()
             return
         
         # Loop protection: Check if a correction is already in progress for this device
-        if self._correction_in_progress.get(entity_id, False):
+        if device.correcting:
             _LOGGER.debug(
                 "Ignoring state change from %s - correction already in progress", 
                 entity_id
             )
+            self._trace.record(
+                "state_change", entity_id, outcome="ignored_correcting",
+                context_id=event.context.id,
+            )
             return
         
         # Check if this is an internal update (from our entity)
         current_time = self.hass.loop.time()
-        last_update = self._last_internal_update.get(entity_id, 0)
         
-        # If update happened very recently (within 2 seconds), it's likely internal
-        if current_time - last_update < 2.0:
+        # If update happened very recently (within the tuning window), it's likely internal;
+        # a command that outlived its timeout is recognised by its context instead
+        if (
+            current_time - device.last_internal_update < self._internal_update_window
+            or event.context.id == device.late_context
+        ):
             _LOGGER.debug(
                 "Ignoring state change from %s - recent internal update detected", 
                 entity_id
             )
+            self._trace.record(
+                "state_change", entity_id, outcome="ignored_internal",
+                context_id=event.context.id,
+            )
             return
         
         # External modification detected
         self._is_external_update = True
-        _LOGGER.info(
+        _LOGGER.debug(
             "External modification detected on %s: %s -> %s",
             entity_id,
             old_state.state if old_state else "None",
             new_state.state
         )
+        self._trace.record(
+            "state_change",
+            entity_id,
+            args={"from": old_state.state if old_state else None, "to": new_state.state},
+            outcome="external",
+            context_id=event.context.id,
+        )
         
         # Check if force mode is enabled and enforce consistency
         if self._is_force_mode_enabled():
@@ -133,11 +615,8 @@ class RoomHVACClimateEntity(ClimateEntity):
                 )
                 # Reset flags before raising
                 self._is_external_update = False
-                self._correction_in_progress[entity_id] = False
+                device.correcting = False
                 raise
-            finally:
-                # Ensure flag is reset even if correction succeeds
-                self._correction_in_progress[entity_id] = False
         else:
             # Normal mode: just sync our state
             self._sync_from_device(entity_id, new_state)
@@ -145,25 +624,44 @@ class RoomHVACClimateEntity(ClimateEntity):
         # Reset flag after processing
         self._is_external_update = False
     
+    def _absorb_transition_event(self, entity_id: str, state: str, event: Event) -> None:
+        """Absorb or queue a downstream event that arrives during a mode transition."""
+        transition = self._transition
+        
+        if transition.phase == TransitionPhase.CONFIRMING:
+            transition.confirm(entity_id, state)
+        
+        # Echoes from the devices being switched carry no information for us
+        if entity_id in self._transition_entity_ids:
+            transition.absorbed += 1
+            self._trace.record(
+                "state_change", entity_id, args={"to": state},
+                outcome=f"absorbed_{transition.phase}", context_id=event.context.id,
+            )
+            return
+        
+        # Anything else is kept (latest per device) and replayed after the commit
+        transition.queued[entity_id] = event
+        self._trace.record(
+            "state_change", entity_id, args={"to": state},
+            outcome=f"queued_{transition.phase}", context_id=event.context.id,
+        )
+    
     def _is_force_mode_enabled(self) -> bool:
         """Check if force mode is enabled in config."""
-        return self._data.get("force_mode", False)
+        return self._force_mode
     
+    @callback
     def _enforce_force_mode_consistency(self, entity_id: str, state) -> None:
         """Enforce strict consistency when force mode is enabled."""
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
-        
-        # Determine which device this is
-        is_ac = entity_id == ac_entity_id
-        is_fh = entity_id == fh_entity_id
-        
-        if not (is_ac or is_fh):
+        # Only devices that belong to one of our groups are checked
+        device = self._devices.get(entity_id)
+        if device is None:
             return
         
         # Get expected state based on our current mode
         expected_hvac_mode = self._get_expected_device_mode_for(entity_id)
-        expected_target_temp = self._get_expected_target_temperature()
+        expected_target_temp = self._get_expected_target_temperature(entity_id)
         
         # Check for inconsistencies
         inconsistencies = []
@@ -191,10 +689,13 @@ class RoomHVACClimateEntity(ClimateEntity):
                 entity_id,
                 "; ".join(inconsistencies)
             )
-            # Set correction flag to prevent recursive calls
-            self._correction_in_progress[entity_id] = True
-            # Immediately correct the inconsistency
-            self._correct_inconsistency(entity_id, expected_hvac_mode, expected_target_temp)
+            # Set correction flag to prevent recursive calls; the correction clears it
+            device.correcting = True
+            # Correct the inconsistency right away, in a tracked task
+            self._tasks.create(
+                self._async_correct_inconsistency(entity_id, expected_hvac_mode, expected_target_temp),
+                f"force_mode_correction {entity_id}",
+            )
         else:
             _LOGGER.debug(
                 "Force mode consistency check passed for %s",
@@ -203,62 +704,94 @@ class RoomHVACClimateEntity(ClimateEntity):
     
     def _get_expected_device_mode_for(self, entity_id: str) -> str:
         """Get the expected HVAC mode for a specific device based on our current state."""
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
+        # A shared device should hold what the rooms' merged demand says
+        arbiter = self.hass.data[DATA_HUB].arbiter
+        if arbiter.is_shared(entity_id):
+            return arbiter.merged(entity_id)[0]
+        return self._own_device_mode(entity_id)
+    
+    def _own_device_mode(self, entity_id: str) -> str:
+        """Return the mode this room alone wants a device in."""
+        device = self._devices.get(entity_id)
+        role = device.role if device else None
+        
+        # Deadband control lets the active group idle between cycles
+        if self._control_idle and entity_id in self._active_entity_ids():
+            return HVACMode.OFF
         
         # If this device should not be active, it should be OFF
-        if entity_id == ac_entity_id:
-            if self._attr_hvac_mode in AC_HVAC_MODES:
-                return self._attr_hvac_mode
-        elif entity_id == fh_entity_id:
-            if self._attr_hvac_mode in FH_HVAC_MODES:
-                return self._attr_hvac_mode
+        mode = self._routed_mode()
+        if role == ROLE_AC:
+            if mode in AC_HVAC_MODES:
+                return mode
+            if self._boost_active and entity_id in self._boost_entity_ids():
+                return HVACMode.HEAT
+        elif role == ROLE_FH:
+            if mode in FH_HVAC_MODES:
+                return mode
         
         return HVACMode.OFF
     
-    def _get_expected_target_temperature(self) -> float | None:
+    def _get_expected_target_temperature(self, entity_id: str | None = None) -> float | None:
         """Get the expected target temperature for the active device."""
+        arbiter = self.hass.data[DATA_HUB].arbiter
+        if entity_id is not None and arbiter.is_shared(entity_id):
+            return arbiter.merged(entity_id)[1]
+        return self._own_target_temperature()
+    
+    def _own_target_temperature(self) -> float | None:
+        """Return the target this room alone wants its active devices at."""
+        if self._attr_hvac_mode == HVACMode.HEAT_COOL:
+            return self._auto_setpoint(self._auto_side)
+        
         # Only return if we have a target temperature and are in a temperature-supporting mode
         if (self._attr_hvac_mode in [HVACMode.COOL, HVACMode.DRY, HVACMode.HEAT] and 
             self._attr_target_temperature is not None):
             return self._attr_target_temperature
         return None
     
-    def _correct_inconsistency(self, entity_id: str, expected_mode: str, expected_temp: float | None) -> None:
-        """Immediately correct an inconsistency in force mode."""
-        _LOGGER.info(
+    def _own_demand(self, entity_id: str) -> tuple[str, float | None]:
+        """Return this room's own (mode, target) demand on a device, before merging."""
+        mode = self._own_device_mode(entity_id)
+        return mode, self._own_target_temperature() if mode != HVACMode.OFF else None
+    
+    async def _async_correct_inconsistency(
+        self, entity_id: str, expected_mode: str, expected_temp: float | None
+    ) -> None:
+        """Correct an inconsistency in force mode.
+        
+        The device stays flagged as correcting until the commands are done.
+        Corrections restore the state already decided (the merged one for a
+        shared device), so they are sent as is rather than as a new demand.
+        """
+        _LOGGER.debug(
             "Force mode: correcting %s to mode=%s, temp=%s",
             entity_id,
             expected_mode,
             expected_temp
         )
         
-        # Record this as an internal update to prevent feedback loops
-        self._record_internal_update(entity_id, "force_mode_correction")
-        
+        device = self._devices[entity_id]
+        device.correcting = True
         try:
             # First, set the HVAC mode
-            self.hass.services.async_call(
-                "climate",
-                "set_hvac_mode",
-                {"entity_id": entity_id, "hvac_mode": expected_mode},
-                blocking=True,
+            await self._async_send_device(
+                entity_id, "set_hvac_mode", {"hvac_mode": expected_mode}, "force_mode_correction"
             )
             
             # Then, if needed, set the temperature
             if expected_temp is not None and expected_mode != HVACMode.FAN_ONLY:
-                self.hass.services.async_call(
-                    "climate",
-                    "set_temperature",
-                    {"entity_id": entity_id, "temperature": expected_temp},
-                    blocking=True,
+                await self._async_send_device(
+                    entity_id, "set_temperature", {ATTR_TEMPERATURE: expected_temp}, "force_mode_correction"
                 )
             
-            _LOGGER.info(
+            _LOGGER.debug(
                 "Force mode correction successful for %s",
                 entity_id
             )
             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             _LOGGER.error(
                 "Force mode correction FAILED for %s: %s",
@@ -267,68 +800,300 @@ class RoomHVACClimateEntity(ClimateEntity):
             )
             # Re-raise to propagate the error
             raise
+        finally:
+            device.correcting = False
     
     async def _validate_force_mode_consistency_after_change(self) -> None:
         """Validate that all devices are in correct state after a mode change in force mode."""
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
-        
-        # Check AC device if it should be active
-        if ac_entity_id:
-            ac_state = self.hass.states.get(ac_entity_id)
-            if ac_state:
-                expected_ac_mode = self._get_expected_device_mode_for(ac_entity_id)
-                actual_ac_mode = ac_state.state
-                
-                if actual_ac_mode != expected_ac_mode:
-                    _LOGGER.warning(
-                        "Force mode: AC state inconsistency after mode change - expected %s, got %s",
-                        expected_ac_mode,
-                        actual_ac_mode
-                    )
-                    # Set correction flag to prevent listener feedback during self-validation
-                    self._correction_in_progress[ac_entity_id] = True
-                    try:
-                        self._correct_inconsistency(ac_entity_id, expected_ac_mode, self._get_expected_target_temperature())
-                    finally:
-                        self._correction_in_progress[ac_entity_id] = False
-        
-        # Check FH device if it should be active
-        if fh_entity_id:
-            fh_state = self.hass.states.get(fh_entity_id)
-            if fh_state:
-                expected_fh_mode = self._get_expected_device_mode_for(fh_entity_id)
-                actual_fh_mode = fh_state.state
-                
-                if actual_fh_mode != expected_fh_mode:
-                    _LOGGER.warning(
-                        "Force mode: FH state inconsistency after mode change - expected %s, got %s",
-                        expected_fh_mode,
-                        actual_fh_mode
-                    )
-                    # Set correction flag to prevent listener feedback during self-validation
-                    self._correction_in_progress[fh_entity_id] = True
-                    try:
-                        self._correct_inconsistency(fh_entity_id, expected_fh_mode, self._get_expected_target_temperature())
-                    finally:
-                        self._correction_in_progress[fh_entity_id] = False
-    
-    async def async_will_remove_hass(self) -> None:
-        """Clean up listeners when entity is removed."""
-        for entity_id, remove_listener in self._listeners.items():
-            remove_listener()
-            _LOGGER.debug("Removed state listener for: %s", entity_id)
-        self._listeners.clear()
-        self._last_internal_update.clear()
-        self._correction_in_progress.clear()
+        # Never correct a device based on a reading it gave hours ago
+        await self._async_ensure_fresh(tuple(self._devices), "force_mode_validation")
+        
+        # Check every device in both groups against the mode it should be in
+        for entity_id, device in self._devices.items():
+            state = self.hass.states.get(entity_id)
+            if not state:
+                continue
+            
+            expected_mode = self._get_expected_device_mode_for(entity_id)
+            actual_mode = state.state
+            
+            if actual_mode != expected_mode:
+                _LOGGER.warning(
+                    "Force mode: %s state inconsistency on %s after mode change - expected %s, got %s",
+                    device.role.upper(),
+                    entity_id,
+                    expected_mode,
+                    actual_mode
+                )
+                # The correction flags the device to prevent listener feedback during self-validation
+                await self._async_correct_inconsistency(
+                    entity_id, expected_mode, self._get_expected_target_temperature(entity_id)
+                )
+    
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop background work and clean up listeners when entity is removed."""
+        await super().async_will_remove_from_hass()
+        if self._transition is not None:
+            self._transition.superseded = True
+        # No new scheduled actions; the ones already running are room tasks
+        self.hass.data[DATA_HUB].scheduler.async_remove(self._entry_id)
+        # Cancels and awaits the transition, boost, scheduled actions and any running corrections
+        await self._tasks.async_shutdown()
+        self._cancel_auto_timer()
+        if self._lease_timer is not None:
+            self._lease_timer()
+            self._lease_timer = None
+        self.hass.data[DATA_HUB].entities.pop(self._entry_id, None)
+        self._account_runtime(None)
+        self.hass.data[DATA_HUB].budget.async_release(self._entry_id)
+        self.hass.data[DATA_HUB].arbiter.async_unregister(self._entry_id)
+        if self._deadband_control:
+            self.hass.data[DATA_HUB].controller.async_unregister(self._entry_id)
+        self._unsubscribe_devices()
+        for device in self._devices.values():
+            device.reset()
         _LOGGER.info("State change listeners cleaned up for entry: %s", self._entry_id)
     
+    def _account_runtime(self, hvac_mode: str | None) -> None:
+        """Move the room's runtime counters to a newly committed mode (O(1))."""
+        if self._runtime is None:
+            return
+        if self._runtime.switch(runtime_key(hvac_mode), self.hass.loop.time()):
+            self.hass.data[DATA_HUB].runtime.async_schedule_save()
+    
     def _record_internal_update(self, entity_id: str, context: str = "unknown") -> None:
         """Record that we're about to update a device internally."""
         current_time = self.hass.loop.time()
-        self._last_internal_update[entity_id] = current_time
+        device = self._devices.get(entity_id)
+        if device is not None:
+            device.last_internal_update = current_time
         _LOGGER.debug("Recorded internal update for: %s (context: %s, time: %.2f)", entity_id, context, current_time)
     
+    async def _async_call_device(
+        self, entity_id: str, service: str, service_data: dict[str, Any], trigger: str
+    ) -> None:
+        """Call a climate service on a downstream device and trace the outcome.
+        
+        Every command room_hvac sends goes through here, so the routing trace
+        holds the full forensic record even with logging at INFO or above.
+        Commands for a device shared with other rooms only update this room's
+        demand; the merged commands are sent when the merge changes.
+        """
+        arbiter = self.hass.data[DATA_HUB].arbiter
+        if not arbiter.is_shared(entity_id):
+            await self._async_send_device(entity_id, service, service_data, trigger)
+            return
+        
+        commands = arbiter.demand(entity_id, self._entry_id, service, service_data)
+        if not commands:
+            self._trace.record(trigger, entity_id, service, service_data, "merged_unchanged")
+        for merged_service, merged_data in commands:
+            await self._async_send_device(entity_id, merged_service, merged_data, trigger)
+    
+    async def _async_send_device(
+        self, entity_id: str, service: str, service_data: dict[str, Any], trigger: str
+    ) -> None:
+        """Send one climate service call to a downstream device and trace it.
+        
+        Commands for an unavailable device (or one that drops out during the
+        call) are kept in the hub's outbox instead of failing, and sent when
+        it is back. The caller waits at most the timeout derived from the
+        latency of the device's platform; a call still running then carries
+        on as a tracked task and its outcome is traced when it ends.
+        """
+        if self._device_unavailable(entity_id):
+            self._queue_command(entity_id, service, service_data, trigger)
+            return
+        
+        hub = self.hass.data[DATA_HUB]
+        self._record_internal_update(entity_id, trigger)
+        context = Context(parent_id=self._context.id if self._context else None)
+        if hub.arbiter.is_shared(entity_id):
+            hub.arbiter.note_context(entity_id, context.id)
+        start = self.hass.loop.time()
+        call = self._tasks.create(
+            self.hass.services.async_call(
+                "climate",
+                service,
+                {"entity_id": entity_id, **service_data},
+                blocking=True,
+                context=context,
+            ),
+            f"{service} {entity_id}",
+        )
+        if call is None:
+            # Entity is being removed
+            return
+        try:
+            done, _ = await asyncio.wait([call], timeout=hub.latency.timeout(entity_id))
+            if not done:
+                self._continue_late_call(call, entity_id, service, service_data, trigger, start, context.id)
+                return
+            hub.latency.observe(entity_id, self.hass.loop.time() - start)
+            call.result()
+        except asyncio.CancelledError:
+            call.cancel()
+            self._trace.record(
+                trigger, entity_id, service, service_data,
+                "cancelled", self.hass.loop.time() - start, context.id,
+            )
+            raise
+        except Exception as e:
+            self._trace.record(
+                trigger, entity_id, service, service_data,
+                f"error: {e}", self.hass.loop.time() - start, context.id,
+            )
+            if self._device_unavailable(entity_id):
+                self._queue_command(entity_id, service, service_data, trigger)
+                return
+            raise
+        self._call_delivered(entity_id, service, service_data, trigger, start, context.id, "ok")
+    
+    def _call_delivered(
+        self,
+        entity_id: str,
+        service: str,
+        service_data: dict[str, Any],
+        trigger: str,
+        start: float,
+        context_id: str,
+        outcome: str,
+    ) -> None:
+        """Book a command the device accepted."""
+        self.hass.data[DATA_HUB].outbox.async_discard(entity_id, service)
+        arbiter = self.hass.data[DATA_HUB].arbiter
+        if arbiter.is_shared(entity_id):
+            arbiter.sent(entity_id, service, service_data)
+        self._trace.record(
+            trigger, entity_id, service, service_data,
+            outcome, self.hass.loop.time() - start, context_id,
+        )
+    
+    def _continue_late_call(
+        self,
+        call: asyncio.Task[Any],
+        entity_id: str,
+        service: str,
+        service_data: dict[str, Any],
+        trigger: str,
+        start: float,
+        context_id: str,
+    ) -> None:
+        """Stop waiting for a slow call; it finishes in the background."""
+        elapsed = self.hass.loop.time() - start
+        self.hass.data[DATA_HUB].latency.timed_out(entity_id)
+        self._devices[entity_id].late_context = context_id
+        self._trace.record(trigger, entity_id, service, service_data, "timeout_continuing", elapsed, context_id)
+        _LOGGER.warning(
+            "%s on %s did not answer within %.1f s, continuing in the background", service, entity_id, elapsed
+        )
+        call.add_done_callback(
+            partial(self._finish_late_call, entity_id, service, service_data, trigger, start, context_id)
+        )
+    
+    @callback
+    def _finish_late_call(
+        self,
+        entity_id: str,
+        service: str,
+        service_data: dict[str, Any],
+        trigger: str,
+        start: float,
+        context_id: str,
+        call: asyncio.Task[Any],
+    ) -> None:
+        """Trace the outcome of a call that outlived its timeout."""
+        elapsed = self.hass.loop.time() - start
+        if call.cancelled():
+            self._trace.record(trigger, entity_id, service, service_data, "cancelled", elapsed, context_id)
+            return
+        # Late answers are what teach the estimate about the platform's tail
+        self.hass.data[DATA_HUB].latency.observe(entity_id, elapsed)
+        error = call.exception()
+        if error is None:
+            self._call_delivered(entity_id, service, service_data, trigger, start, context_id, "late_ok")
+            return
+        self._trace.record(trigger, entity_id, service, service_data, f"late_error: {error}", elapsed, context_id)
+        if self._device_unavailable(entity_id):
+            self._queue_command(entity_id, service, service_data, trigger)
+        else:
+            _LOGGER.error("%s on %s failed after %.1f s: %s", service, entity_id, elapsed, error)
+    
+    def _device_unavailable(self, entity_id: str) -> bool:
+        """Return True if a device is known to be unavailable."""
+        state = self.hass.states.get(entity_id)
+        return state is not None and state.state == STATE_UNAVAILABLE
+    
+    def _queue_command(
+        self, entity_id: str, service: str, service_data: dict[str, Any], trigger: str
+    ) -> None:
+        """Keep a command for an unavailable device in the outbox."""
+        self.hass.data[DATA_HUB].outbox.async_queue(entity_id, service, service_data)
+        self._trace.record(trigger, entity_id, service, service_data, "queued_unavailable")
+        _LOGGER.debug("%s is unavailable, queued %s %s", entity_id, service, service_data)
+    
+    def _outbox_ready(self, entity_id: str, state: str) -> bool:
+        """Return True if a device has queued commands and is back to take them."""
+        return (
+            state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+            and self.hass.data[DATA_HUB].outbox.has_pending(entity_id)
+        )
+    
+    async def _async_replay_outbox(self, entity_id: str) -> None:
+        """Send a device that is back what it missed, as one minimal batch.
+        
+        The queued commands are already collapsed to one per attribute; the
+        ones the device already matches are dropped. The mode is the one the
+        room expects of the device now, so a command overtaken while the
+        device was away (or by a restart) never starts a device the room
+        does not run. The mode goes first, the rest concurrently.
+        """
+        commands = self.hass.data[DATA_HUB].outbox.async_take(entity_id)
+        state = self.hass.states.get(entity_id)
+        if not commands or state is None:
+            return
+        if "set_hvac_mode" in commands:
+            commands["set_hvac_mode"] = {"hvac_mode": self._get_expected_device_mode_for(entity_id)}
+        batch = replay_batch(commands, state)
+        self._trace.record(
+            "outbox_replay", entity_id, args={"commands": [service for service, _ in batch]}, outcome="replaying"
+        )
+        if not batch:
+            return
+        
+        try:
+            if batch[0][0] == "set_hvac_mode":
+                service, service_data = batch.pop(0)
+                await self._async_send_device(entity_id, service, service_data, "outbox_replay")
+            results = await asyncio.gather(
+                *(
+                    self._async_send_device(entity_id, service, service_data, "outbox_replay")
+                    for service, service_data in batch
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.error("Replaying queued commands to %s failed: %s", entity_id, e)
+    
+    async def async_resync_shared(self) -> None:
+        """Re-send this room's temperature demands so a new merge policy applies."""
+        arbiter = self.hass.data[DATA_HUB].arbiter
+        for entity_id in arbiter.shared_entity_ids(tuple(self._devices)):
+            temperature = arbiter.demand_of(entity_id, self._entry_id)[1]
+            if temperature is None:
+                continue
+            try:
+                await self._async_call_device(
+                    entity_id, "set_temperature", {ATTR_TEMPERATURE: temperature}, "shared_policy"
+                )
+            except Exception as e:
+                _LOGGER.error("Failed to apply shared policy to %s: %s", entity_id, e)
+    
     def _sync_from_device(self, entity_id: str, state) -> None:
         """Sync our entity state from the downstream device state."""
         # Force mode disables automatic syncing - corrections are handled separately
@@ -339,26 +1104,37 @@ class RoomHVACClimateEntity(ClimateEntity):
             )
             return
         
-        # Only sync if this device is currently active
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
-        
-        is_ac_active = self._attr_hvac_mode in AC_HVAC_MODES and entity_id == ac_entity_id
-        is_fh_active = self._attr_hvac_mode in FH_HVAC_MODES and entity_id == fh_entity_id
-        
-        if not (is_ac_active or is_fh_active):
+        # Only sync if this device belongs to the currently active group
+        if entity_id not in self._active_entity_ids():
             # Device is not currently active, no need to sync
             return
         
-        # Sync HVAC mode if it changed
+        # Sync HVAC mode if it changed; a group idled by deadband control
+        # reports off without the room being off
         new_hvac_mode = state.state
-        if new_hvac_mode != self._attr_hvac_mode:
-            _LOGGER.info(
+        idling = self._control_idle and new_hvac_mode == HVACMode.OFF
+        if self._control_idle and new_hvac_mode == self._attr_hvac_mode:
+            # Switched back on from outside - the cycle is running again
+            self._set_control_running(True)
+        elif new_hvac_mode != self._routed_mode() and not idling:
+            # In heat_cool the running side's mode is expected, anything else is a takeover
+            _LOGGER.debug(
                 "Syncing HVAC mode from %s to %s",
                 self._attr_hvac_mode,
                 new_hvac_mode
             )
+            old_ids = self._active_entity_ids()
             self._attr_hvac_mode = new_hvac_mode
+            self._auto_side = None
+            self._account_runtime(new_hvac_mode)
+            
+            # A group switched off, or over to the other group's modes, no
+            # longer runs for the room; its power budget goes back to the pool
+            kept_ids = self._entity_ids_for_mode(new_hvac_mode)
+            released = [eid for eid in old_ids if eid not in kept_ids]
+            if released:
+                self._release_budget(released)
+                self._energized_mode = None
         
         # Sync temperature attributes
         if state.attributes:
@@ -370,7 +1146,9 @@ class RoomHVACClimateEntity(ClimateEntity):
             # Target temperature (only if not in fan_only mode)
             if self._attr_hvac_mode != HVACMode.FAN_ONLY:
                 target_temp = state.attributes.get("temperature")
-                if target_temp is not None:
+                if target_temp is not None and self._attr_hvac_mode == HVACMode.HEAT_COOL:
+                    self._set_auto_setpoint(self._auto_side, target_temp)
+                elif target_temp is not None:
                     self._attr_target_temperature = target_temp
             
             # Preset mode
@@ -381,50 +1159,201 @@ class RoomHVACClimateEntity(ClimateEntity):
         # Update HA state
         self.async_write_ha_state()
     
+    def _stale_entity_ids(self, entity_ids: Sequence[str]) -> list[str]:
+        """Return the devices whose cached state is older than the tuning limit.
+        
+        A device is current when it sent an event or answered a refresh
+        within the limit; a device that never had a state is not stale.
+        """
+        now = self.hass.loop.time()
+        refresher = self.hass.data[DATA_HUB].refresher
+        stale = []
+        for entity_id in entity_ids:
+            seen = self._devices[entity_id].last_seen
+            if seen is None:
+                continue
+            seen = max(seen, refresher.refreshed_at(entity_id) or seen)
+            if now - seen > self._max_state_age:
+                stale.append(entity_id)
+        return stale
+    
+    @callback
+    def _refresh_stale_readings(self) -> None:
+        """Queue a background refresh of the stale devices the room temperature reads.
+        
+        Stale readings are still shown; the refresh makes the next state
+        write carry a current value. Idle devices are not refreshed.
+        """
+        if self._temperature_sensors:
+            return
+        stale = self._stale_entity_ids(self._reading_entity_ids())
+        if stale:
+            self.hass.data[DATA_HUB].refresher.async_request(stale)
+    
+    def _reading_entity_ids(self) -> tuple[str, ...]:
+        """Return the devices whose readings make up the room temperature."""
+        # heat_cool picks its side from the room, so it reads both groups
+        if self._attr_hvac_mode == HVACMode.HEAT_COOL:
+            return tuple(self._devices)
+        return self._active_entity_ids()
+    
+    async def _async_ensure_fresh(self, entity_ids: Sequence[str], trigger: str) -> None:
+        """Refresh stale devices before a routing decision reads their state.
+        
+        Refreshes are coalesced and rate-limited across rooms by the hub, and
+        the wait is bounded: if a device does not answer in time the decision
+        goes ahead on the cached state.
+        """
+        stale = self._stale_entity_ids(entity_ids)
+        if not stale:
+            return
+        self._trace.record(trigger, service="update_entity", args={"devices": stale}, outcome="refresh")
+        await self.hass.data[DATA_HUB].refresher.async_refresh(stale, REFRESH_WAIT_TIMEOUT)
+    
+    @staticmethod
+    def _cache_reading(device: DeviceRuntime, state) -> bool:
+        """Keep a device's latest temperature; return True if it moved.
+        
+        An unavailable device keeps its last reading, so the room
+        temperature does not jump or vanish while it is away.
+        """
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return False
+        value = state.attributes.get("current_temperature")
+        if value is None or value == device.temperature:
+            return False
+        device.temperature = value
+        return True
+    
+    def _group_readings(self, entity_ids: Sequence[str]) -> list[float]:
+        """Return the cached temperatures of a device group."""
+        readings = []
+        for entity_id in entity_ids:
+            value = self._devices[entity_id].temperature
+            if value is not None:
+                readings.append(value)
+        return readings
+    
     @property
     def current_temperature(self) -> float | None:
-        """Return the current temperature from the active device."""
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
-        
-        if self._attr_hvac_mode in AC_HVAC_MODES and ac_entity_id:
-            ac_state = self.hass.states.get(ac_entity_id)
-            if ac_state:
-                return ac_state.attributes.get("current_temperature")
-        
-        elif self._attr_hvac_mode in FH_HVAC_MODES and fh_entity_id:
-            fh_state = self.hass.states.get(fh_entity_id)
-            if fh_state:
-                return fh_state.attributes.get("current_temperature")
-        
-        # Off mode or no active device
-        return None
+        """Return the aggregated current temperature of the active device group."""
+        if self._temperature_sensors:
+            return self._sensor_reading.published
+        
+        # Off mode (or no device for the mode): the room still has a
+        # temperature, merged from the last readings of both groups
+        entity_ids = self._reading_entity_ids() or tuple(self._devices)
+        return _aggregate(self._group_readings(entity_ids), self._temperature_aggregate)
     
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes for debugging."""
-        # Get correction status for debugging
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
-        ac_correcting = self._correction_in_progress.get(ac_entity_id, False) if ac_entity_id else False
-        fh_correcting = self._correction_in_progress.get(fh_entity_id, False) if fh_entity_id else False
+        # Get correction status for debugging - a group is correcting if any member is
+        ac_correcting = any(d.correcting for d in self._devices.values() if d.role == ROLE_AC)
+        fh_correcting = any(d.correcting for d in self._devices.values() if d.role == ROLE_FH)
+        stale = self._stale_entity_ids(tuple(self._devices))
+        now = dt_util.utcnow()
+        holder = self._leases.holder(now)
         
         return {
             "entry_id": self._entry_id,
-            "force_mode": self._data.get("force_mode", False),
-            "ac_entity_id": ac_entity_id,
-            "fh_entity_id": fh_entity_id,
+            "force_mode": self._force_mode,
+            "ac_entity_ids": list(self._ac_entity_ids),
+            "fh_entity_ids": list(self._fh_entity_ids),
+            "temperature_aggregate": self._temperature_aggregate,
+            "temperature_sensors": list(self._temperature_sensors),
             "active_device": self._get_active_device_name(),
             "ac_correcting": ac_correcting,
             "fh_correcting": fh_correcting,
-            "listener_count": len(self._listeners),
+            "preset_id": self._active_presets().get(self._attr_preset_mode, {}).get(PRESET_ID),
+            "listener_count": sum(1 for d in self._devices.values() if d.unsubscribe is not None),
+            "transition_phase": (
+                self._transition.phase if self._transition else TransitionPhase.IDLE
+            ),
+            "stale_devices": stale,
+            "next_schedule": self._next_schedule(),
+            "boost_active": self._boost_active,
+            "budget_state": self._budget_state(),
+            "background_tasks": len(self._tasks) if self._tasks is not None else 0,
+            "shared_devices": self.hass.data[DATA_HUB].arbiter.shared_entity_ids(tuple(self._devices)),
+            "budget_wait": self._budget_wait,
+            "heating_rate": self._rounded_rate(HVACMode.HEAT),
+            "cooling_rate": self._rounded_rate(HVACMode.COOL),
+            "queued_commands": self.hass.data[DATA_HUB].outbox.pending_count(tuple(self._devices)),
+            "auto_side": self._auto_side,
+            "auto_switches": self._auto_switches,
+            "health": self._health(stale, ac_correcting or fh_correcting),
+            "lease": holder.as_dict() if holder is not None else None,
+            "lease_waiting": self._leases.waiting(now),
+            "lease_rejected": self._leases.rejected,
         }
     
+    def _health(self, stale: list[str], correcting: bool) -> str:
+        """Return a one-word summary of the room's devices, from their cached events."""
+        if not all(device.available for device in self._devices.values()):
+            return "unavailable"
+        if stale:
+            return "stale"
+        if correcting:
+            return "correcting"
+        return "ok"
+    
+    def _budget_state(self) -> str | None:
+        """Return whether the room holds, or waits for, power budget."""
+        budget = self.hass.data[DATA_HUB].budget
+        if budget.is_waiting(self._entry_id):
+            return "waiting"
+        if any(budget.is_granted(self._entry_id, role) for role in (ROLE_AC, ROLE_FH)):
+            return "granted"
+        return None
+    
+    def _rounded_rate(self, mode: str) -> float | None:
+        """Return a learned thermal rate in degrees per hour, for display."""
+        rate = self._thermal.rate(mode)
+        return round(rate, 2) if rate is not None else None
+    
+    def _active_presets(self) -> dict[str, dict[str, Any]]:
+        """Return the presets of the device group serving the current mode."""
+        if self._attr_hvac_mode in AC_HVAC_MODES:
+            return self._ac_presets
+        if self._attr_hvac_mode in FH_HVAC_MODES:
+            return self._fh_presets
+        return {}
+    
+    @property
+    def trace(self) -> RoutingTrace:
+        """Return the routing trace for this room."""
+        return self._trace
+    
+    @property
+    def tasks(self) -> TaskRegistry | None:
+        """Return the registry of this room's background tasks."""
+        return self._tasks
+    
+    def _entity_ids_for_mode(self, hvac_mode: str | None) -> tuple[str, ...]:
+        """Return the device group that serves an HVAC mode."""
+        if hvac_mode in AC_HVAC_MODES:
+            return self._ac_entity_ids
+        if hvac_mode in FH_HVAC_MODES:
+            return self._fh_entity_ids
+        return ()
+    
+    def _routed_mode(self) -> str | None:
+        """Return the mode the devices run in: the heat_cool side, or the room's mode."""
+        if self._attr_hvac_mode == HVACMode.HEAT_COOL:
+            return self._auto_side
+        return self._attr_hvac_mode
+    
+    def _active_entity_ids(self) -> tuple[str, ...]:
+        """Return the device group serving the current HVAC mode."""
+        return self._entity_ids_for_mode(self._routed_mode())
+    
     def _get_active_device_name(self) -> str | None:
         """Get the name of the currently active device."""
-        if self._attr_hvac_mode in AC_HVAC_MODES:
+        mode = self._routed_mode()
+        if mode in AC_HVAC_MODES:
             return "AC"
-        elif self._attr_hvac_mode in FH_HVAC_MODES:
+        elif mode in FH_HVAC_MODES:
             return "FH"
         return None
     
@@ -437,269 +1366,1034 @@ class RoomHVACClimateEntity(ClimateEntity):
         
         # AC modes - return AC presets
         if self._attr_hvac_mode in AC_HVAC_MODES:
-            ac_presets = self._data.get("ac_presets", {})
-            return list(ac_presets.keys())
+            return self._ac_preset_names
         
         # Heat mode - return FH presets
         if self._attr_hvac_mode in FH_HVAC_MODES:
-            fh_presets = self._data.get("fh_presets", {})
-            return list(fh_presets.keys())
+            return self._fh_preset_names
         
         return []
     
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
-        """Set new hvac mode with routing logic to AC/FH devices."""
-        _LOGGER.info("Setting HVAC mode to %s", hvac_mode)
-        
-        # Step 1: Turn off current device if switching modes
-        if self._attr_hvac_mode != HVACMode.OFF:
-            await self._turn_off_current_device()
-        
-        # Step 2: Update local mode
-        self._attr_hvac_mode = hvac_mode
+        """Set new hvac mode with routing logic to AC/FH devices.
+        
+        The switch runs as an explicit transition (idle -> stopping_old ->
+        starting_new -> confirming -> idle). A newer request cancels one still
+        in flight; the superseded caller returns quietly.
+        """
+        self._check_lease("set_hvac_mode")
+        _LOGGER.debug("Setting HVAC mode to %s", hvac_mode)
+        await self._async_switch_mode(hvac_mode)
+    
+    async def _async_switch_mode(self, hvac_mode: str, publish: bool = True) -> None:
+        """Run a mode transition; with publish False the caller writes state."""
+        previous = self._transition
+        if previous is not None:
+            _LOGGER.debug("Superseding transition to %s with %s", previous.target, hvac_mode)
+            previous.superseded = True
+            previous.task.cancel()
+        
+        transition = ModeTransition(hvac_mode, self._entity_ids_for_mode(hvac_mode), publish)
+        self._transition = transition
+        transition.task = self._tasks.create(
+            self._async_run_transition(transition, previous), f"transition {hvac_mode}"
+        )
+        if transition.task is None:
+            # Entity is being removed
+            self._transition = None
+            return
+        try:
+            await transition.task
+        except asyncio.CancelledError:
+            if transition.superseded:
+                return
+            raise
+    
+    @property
+    def _transition_entity_ids(self) -> set[str]:
+        """Return the devices touched by the running transition."""
+        transition = self._transition
+        if transition is None:
+            return set()
+        return {
+            *self._active_entity_ids(),
+            *self._entity_ids_for_mode(self._energized_mode),
+            *(self._boost_entity_ids() if self._boost_active else ()),
+            *transition.start_ids,
+        }
+    
+    async def _async_run_transition(
+        self, transition: ModeTransition, previous: ModeTransition | None
+    ) -> None:
+        """Drive one mode transition and commit it with a single state write."""
+        # Let a superseded transition unwind before touching the devices
+        if previous is not None and previous.task is not None:
+            await asyncio.wait([previous.task])
+            self._trace.record("transition", args={"target": previous.target}, outcome="superseded")
+        
+        hvac_mode = transition.target
+        stopped = False
+        try:
+            # Entering heat_cool keeps a running heat or cool group that is already the right side
+            kept_side = None
+            if hvac_mode == HVACMode.HEAT_COOL:
+                self._init_auto_range()
+                kept_side = self._auto_kept_side()
+            kept_ids = self._entity_ids_for_mode(kept_side)
+            
+            # Step 1: Turn off the committed group and anything a cancelled switch left on
+            transition.phase = TransitionPhase.STOPPING_OLD
+            if self._boost_task is not None:
+                self._boost_task.cancel()
+            if self._auto_task is not None:
+                self._auto_task.cancel()
+            self._cancel_auto_timer()
+            stop_ids = [
+                entity_id
+                for entity_id in dict.fromkeys(
+                    self._active_entity_ids()
+                    + self._entity_ids_for_mode(self._energized_mode)
+                    + (self._boost_entity_ids() if self._boost_active else ())
+                )
+                if entity_id not in kept_ids
+            ]
+            if stop_ids:
+                await self._turn_off_devices(stop_ids)
+            self._energized_mode = None
+            self._boost_active = False
+            if not kept_ids:
+                self._auto_side = None
+            stopped = True
+            
+            # Step 2: Route to appropriate device group
+            if hvac_mode in AC_HVAC_MODES or hvac_mode in FH_HVAC_MODES:
+                transition.phase = TransitionPhase.STARTING_NEW
+                self._energized_mode = hvac_mode
+                if hvac_mode in AC_HVAC_MODES:
+                    await self._route_to_ac(hvac_mode)
+                else:
+                    await self._route_to_fh(hvac_mode)
+                
+                # Step 3: Wait for the new group to report the target mode
+                transition.phase = TransitionPhase.CONFIRMING
+                await self._async_confirm_transition(transition)
+            elif kept_ids:
+                # The kept group only needs its side's setpoint
+                transition.phase = TransitionPhase.STARTING_NEW
+                setpoint = self._auto_setpoint(kept_side)
+                if setpoint is not None and any(
+                    self._device_target(entity_id) != setpoint for entity_id in kept_ids
+                ):
+                    await self._async_call_group(
+                        kept_ids, "set_temperature", {ATTR_TEMPERATURE: setpoint}, "auto_keep"
+                    )
+            
+            # Step 4: Commit local mode
+            self._attr_hvac_mode = hvac_mode
+            self._energized_mode = None
+            self._auto_side = kept_side
+            self._auto_since = self.hass.loop.time()
+            self._auto_failed = False
+            self._account_runtime(self._routed_mode())
+            self._set_control_running(True)
+            if hvac_mode == HVACMode.OFF:
+                # Off mode - ensure all devices are off (already done in step 1)
+                self._attr_target_temperature = None
+                self._attr_current_temperature = None
+                self._attr_preset_mode = None
+                _LOGGER.debug("All devices turned off")
+            await self._update_active_device_state()
+            self._trace.record("transition", args={"target": hvac_mode}, outcome="committed")
+        except asyncio.CancelledError:
+            # Superseded - the next transition takes over the queue and the write
+            self._hand_over_queue(transition)
+            raise
+        except Exception:
+            # A failed start was rolled back and the old group is already off
+            if stopped:
+                self._attr_hvac_mode = HVACMode.OFF
+                self._energized_mode = None
+                self._auto_side = None
+                self._account_runtime(HVACMode.OFF)
+            self._trace.record("transition", args={"target": hvac_mode}, outcome="failed")
+            transition.publish = True
+            self._finish_transition(transition)
+            raise
         
-        # Step 3: Route to appropriate device
-        if hvac_mode in AC_HVAC_MODES:
-            await self._route_to_ac(hvac_mode)
-        elif hvac_mode in FH_HVAC_MODES:
-            await self._route_to_fh(hvac_mode)
-        elif hvac_mode == HVACMode.OFF:
-            # Off mode - ensure all devices are off (already done in step 1)
-            self._attr_target_temperature = None
-            self._attr_current_temperature = None
-            self._attr_preset_mode = None
-            _LOGGER.info("All devices turned off")
-        
-        # Step 4: Update state
-        await self._update_active_device_state()
-        self.async_write_ha_state()
+        self._finish_transition(transition)
+        self._schedule_boost_update()
+        self._update_control()
+        self._schedule_auto_update()
         
         # Step 5: Force mode validation (if enabled)
-        if self._is_force_mode_enabled():
+        if transition.publish and self._is_force_mode_enabled():
             await self._validate_force_mode_consistency_after_change()
     
-    async def _turn_off_current_device(self) -> None:
-        """Turn off the currently active device."""
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
+    async def _async_confirm_transition(self, transition: ModeTransition) -> None:
+        """Wait until every device of the new group reports the target mode."""
+        for entity_id in transition.start_ids:
+            state = self.hass.states.get(entity_id)
+            if state is not None and state.state == STATE_UNAVAILABLE:
+                # Its start waits in the outbox
+                continue
+            if state is None or state.state != transition.target:
+                transition.pending.add(entity_id)
+        if not transition.pending:
+            return
+        
+        try:
+            async with asyncio.timeout(self._transition_confirm_timeout):
+                await transition.confirmed.wait()
+        except TimeoutError:
+            _LOGGER.warning(
+                "Devices %s did not confirm %s within %s s, committing anyway",
+                sorted(transition.pending), transition.target, self._transition_confirm_timeout,
+            )
+    
+    def _hand_over_queue(self, transition: ModeTransition) -> None:
+        """Pass events queued by a superseded transition to its successor."""
+        successor = self._transition
+        if successor is not None and successor is not transition:
+            successor.queued = {**transition.queued, **successor.queued}
+    
+    def _finish_transition(self, transition: ModeTransition) -> None:
+        """Return to idle, publish the outcome once and replay queued events."""
+        transition.phase = TransitionPhase.IDLE
+        if self._transition is transition:
+            self._transition = None
+        if transition.publish:
+            self.async_write_ha_state()
+        
+        for event in transition.queued.values():
+            self._handle_state_change(event)
+    
+    async def _async_wait_for_transition(self) -> None:
+        """Let a running mode transition finish before acting on the room."""
+        transition = self._transition
+        if transition is not None and transition.task is not None:
+            await asyncio.wait([transition.task])
+    
+    async def _async_call_group(
+        self, entity_ids: Sequence[str], service: str, service_data: dict[str, Any], trigger: str
+    ) -> list[str]:
+        """Send the same command to every device in a group concurrently.
+        
+        Waits for all members before raising, so one slow or failing device
+        never leaves the others half-commanded. Returns the members that
+        succeeded; raises the first failure if any member failed.
+        """
+        results = await asyncio.gather(
+            *(
+                self._async_call_device(entity_id, service, service_data, trigger)
+                for entity_id in entity_ids
+            ),
+            return_exceptions=True,
+        )
+        succeeded = []
+        first_error: BaseException | None = None
+        for entity_id, result in zip(entity_ids, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error("%s failed on %s: %s", service, entity_id, result)
+                first_error = first_error or result
+            else:
+                succeeded.append(entity_id)
+        if first_error is not None:
+            raise first_error
+        return succeeded
+    
+    async def _async_admit_group(self, entity_ids: Sequence[str], trigger: str) -> None:
+        """Wait for the building-wide power budget to admit a group start."""
+        role = self._devices[entity_ids[0]].role
+        budget = self.hass.data[DATA_HUB].budget
+        try:
+            waited = await budget.async_acquire(
+                self._entry_id,
+                role,
+                len(entity_ids),
+                self._device_power[role] * len(entity_ids),
+                self._priority,
+                self._budget_max_wait,
+            )
+        except BudgetExceeded as e:
+            self._trace.record(trigger, service="budget", args={"role": role}, outcome=f"rejected: {e}")
+            raise
+        
+        self._budget_wait = round(waited, 1)
+        if waited:
+            self._trace.record(
+                trigger, service="budget", args={"role": role}, outcome="admitted", latency=waited
+            )
+    
+    async def _async_activate_group(self, entity_ids: Sequence[str], hvac_mode: str, trigger: str) -> None:
+        """Turn a device group on as a unit.
+        
+        The start waits for power budget first. If any member fails to
+        start, the members that did start are turned off again (and the
+        budget returned) so the room never runs on a partial group.
+        """
+        await self._async_admit_group(entity_ids, trigger)
+        
+        results = await asyncio.gather(
+            *(
+                self._async_call_device(entity_id, "set_hvac_mode", {"hvac_mode": hvac_mode}, trigger)
+                for entity_id in entity_ids
+            ),
+            return_exceptions=True,
+        )
+        started = [e for e, r in zip(entity_ids, results) if not isinstance(r, BaseException)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if not errors:
+            return
         
-        if self._attr_hvac_mode in AC_HVAC_MODES and ac_entity_id:
-            # Turn off AC
+        _LOGGER.error(
+            "%d of %d devices failed to start in %s, rolling back %s",
+            len(errors), len(entity_ids), hvac_mode, started,
+        )
+        if started:
             try:
-                self._record_internal_update(ac_entity_id, "turn_off_before_mode_switch")
-                await self.hass.services.async_call(
-                    "climate",
-                    "set_hvac_mode",
-                    {"entity_id": ac_entity_id, "hvac_mode": HVACMode.OFF},
-                    blocking=True,
+                await self._async_call_group(
+                    started, "set_hvac_mode", {"hvac_mode": HVACMode.OFF}, "rollback"
                 )
-                _LOGGER.info("Turned off AC device: %s", ac_entity_id)
             except Exception as e:
-                _LOGGER.error("Failed to turn off AC %s: %s", ac_entity_id, e)
-                raise
+                _LOGGER.error("Rollback after failed group start incomplete: %s", e)
+                raise errors[0]
+        self._release_budget(entity_ids)
+        raise errors[0]
+    
+    def _boost_entity_ids(self) -> tuple[str, ...]:
+        """Return the ACs that can heat, i.e. the members a boost may start."""
+        boost_ids = []
+        for entity_id in self._ac_entity_ids:
+            state = self.hass.states.get(entity_id)
+            if state is not None and HVACMode.HEAT in state.attributes.get("hvac_modes", ()):
+                boost_ids.append(entity_id)
+        return tuple(boost_ids)
+    
+    def _boost_wanted(self) -> bool:
+        """Return whether the AC boost should run, with start/stop hysteresis."""
+        if not self._hybrid_boost or self._attr_hvac_mode != HVACMode.HEAT or self._transition is not None:
+            return False
+        current = self.current_temperature
+        target = self._attr_target_temperature
+        if current is None or target is None:
+            return False
+        gap = target - current
+        return gap > (self._boost_stop_gap if self._boost_active else self._boost_start_gap)
+    
+    @property
+    def hvac_action(self) -> HVACAction | None:
+        """Return whether a heat_cool or deadband-controlled room is running or idling."""
+        if self._attr_hvac_mode == HVACMode.HEAT_COOL:
+            return {
+                HVACMode.HEAT: HVACAction.HEATING,
+                HVACMode.COOL: HVACAction.COOLING,
+            }.get(self._auto_side, HVACAction.IDLE)
+        if not self._deadband_control or self._attr_hvac_mode not in (HVACMode.HEAT, HVACMode.COOL):
+            return None
+        if self._control_idle:
+            return HVACAction.IDLE
+        return HVACAction.HEATING if self._attr_hvac_mode == HVACMode.HEAT else HVACAction.COOLING
+    
+    @callback
+    def _update_control(self) -> None:
+        """Hand the room's direction and readings to the shared deadband tick."""
+        if not self._deadband_control:
+            return
+        direction = 0
+        if self._transition is None:
+            direction = {HVACMode.HEAT: 1, HVACMode.COOL: -1}.get(self._attr_hvac_mode, 0)
+        self.hass.data[DATA_HUB].controller.async_update(
+            self._entry_id, direction, self.current_temperature, self._attr_target_temperature
+        )
+    
+    def _set_control_running(self, running: bool) -> None:
+        """Record whether deadband control has the active group running or idle."""
+        if not self._deadband_control:
+            return
+        self._control_idle = not running
+        # Idle time is not runtime
+        self._account_runtime(self._routed_mode() if running else None)
+        self.hass.data[DATA_HUB].controller.async_set_running(self._entry_id, running)
+    
+    @callback
+    def _control_dispatch(self, on: bool) -> None:
+        """Start the switch the deadband controller decided on."""
+        self._tasks.create(self._async_control_switch(on), "deadband_control")
+    
+    async def _async_control_switch(self, on: bool) -> None:
+        """Switch the active group on or off for the deadband controller."""
+        mode = self._attr_hvac_mode
+        await self._async_wait_for_transition()
+        running = not self._control_idle
+        if self._attr_hvac_mode != mode:
+            # A mode switch got there first and decided for itself
+            self._set_control_running(running)
+            return
         
-        elif self._attr_hvac_mode in FH_HVAC_MODES and fh_entity_id:
-            # Turn off FH
-            try:
-                self._record_internal_update(fh_entity_id, "turn_off_before_mode_switch")
-                await self.hass.services.async_call(
-                    "climate",
-                    "set_hvac_mode",
-                    {"entity_id": fh_entity_id, "hvac_mode": HVACMode.OFF},
-                    blocking=True,
+        entity_ids = self._active_entity_ids()
+        try:
+            if mode in (HVACMode.HEAT, HVACMode.COOL) and entity_ids and on != running:
+                if on:
+                    await self._async_activate_group(entity_ids, mode, "control_on")
+                else:
+                    await self._async_call_group(
+                        entity_ids, "set_hvac_mode", {"hvac_mode": HVACMode.OFF}, "control_off"
+                    )
+                    self._release_budget(entity_ids)
+                running = on
+                _LOGGER.debug("Deadband control switched %s %s", entity_ids, "on" if on else "off")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.error("Deadband control could not switch %s %s: %s", entity_ids, "on" if on else "off", e)
+        finally:
+            self._set_control_running(running)
+        
+        self.async_write_ha_state()
+    
+    @callback
+    def _schedule_boost_update(self) -> None:
+        """Re-evaluate the boost in the background if it may need to change."""
+        # A running transition stops the boost itself
+        if not self._hybrid_boost or self._transition is not None:
+            return
+        if self._boost_wanted() == self._boost_active:
+            return
+        if self._boost_task is None or self._boost_task.done():
+            self._boost_task = self._tasks.create(self._async_update_boost(), "boost")
+    
+    async def _async_update_boost(self) -> None:
+        """Start the AC boost alongside FH, or hand off to FH alone."""
+        want = self._boost_wanted()
+        boost_ids = self._boost_entity_ids()
+        if want == self._boost_active or not boost_ids:
+            return
+        
+        try:
+            if want:
+                # Counted as running before the start so a cancel still stops it
+                self._boost_active = True
+                await self._async_activate_group(boost_ids, HVACMode.HEAT, "boost_start")
+                _LOGGER.debug("Boost started on %s", boost_ids)
+            else:
+                await self._async_call_group(
+                    boost_ids, "set_hvac_mode", {"hvac_mode": HVACMode.OFF}, "boost_handoff"
                 )
-                _LOGGER.info("Turned off FH device: %s", fh_entity_id)
-            except Exception as e:
-                _LOGGER.error("Failed to turn off FH %s: %s", fh_entity_id, e)
-                raise
+                self._release_budget(boost_ids)
+                self._boost_active = False
+                _LOGGER.debug("Boost handed off to FH, stopped %s", boost_ids)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.error("Boost %s failed: %s", "start" if want else "hand-off", e)
+            if want:
+                self._boost_active = False
+            return
+        
+        self.async_write_ha_state()
+    
+    def _auto_setpoint(self, side: str | None) -> float | None:
+        """Return the setpoint a heat_cool side runs at: low for heat, high for cool."""
+        if side == HVACMode.HEAT:
+            return self._attr_target_temperature_low
+        if side == HVACMode.COOL:
+            return self._attr_target_temperature_high
+        return None
+    
+    def _set_auto_setpoint(self, side: str | None, value: float) -> None:
+        """Take a heat_cool side's setpoint reported by its group."""
+        if side == HVACMode.HEAT:
+            self._attr_target_temperature_low = value
+        elif side == HVACMode.COOL:
+            self._attr_target_temperature_high = value
+    
+    def _device_target(self, entity_id: str) -> float | None:
+        """Return the target temperature a device reports."""
+        state = self.hass.states.get(entity_id)
+        return state.attributes.get("temperature") if state else None
+    
+    def _init_auto_range(self) -> None:
+        """Fill in missing heat_cool setpoints from the groups' own targets."""
+        if self._attr_target_temperature_low is None:
+            self._attr_target_temperature_low = next(
+                (t for t in map(self._device_target, self._fh_entity_ids) if t is not None),
+                self._attr_target_temperature,
+            )
+        if self._attr_target_temperature_high is None:
+            self._attr_target_temperature_high = next(
+                (t for t in map(self._device_target, self._ac_entity_ids) if t is not None),
+                self._attr_target_temperature,
+            )
+        low, high = self._attr_target_temperature_low, self._attr_target_temperature_high
+        if low is not None and high is not None and low > high:
+            self._attr_target_temperature_low, self._attr_target_temperature_high = high, low
+    
+    def _auto_kept_side(self) -> str | None:
+        """Return the running heat or cool side a switch to heat_cool can keep."""
+        side = self._routed_mode()
+        if (
+            side not in (HVACMode.HEAT, HVACMode.COOL)
+            or self._energized_mode not in (None, side)
+            or self._control_idle
+        ):
+            return None
+        return side if self._auto_side_wanted(side) == side else None
+    
+    def _auto_side_wanted(self, side: str | None) -> str | None:
+        """Return the side heat_cool should run, given the one it runs now.
+        
+        The room changes sides only once it is more than the hysteresis past
+        the other side's setpoint; inside the range the running side (or
+        none) is kept, and its group's own thermostat holds its setpoint.
+        """
+        current = self.current_temperature
+        low = self._attr_target_temperature_low
+        high = self._attr_target_temperature_high
+        if current is None or low is None or high is None:
+            return side
+        if side != HVACMode.HEAT and self._fh_entity_ids and current < low - self._auto_hysteresis:
+            return HVACMode.HEAT
+        if side != HVACMode.COOL and self._ac_entity_ids and current > high + self._auto_hysteresis:
+            return HVACMode.COOL
+        return side
+    
+    @callback
+    def _schedule_auto_update(self) -> None:
+        """Switch heat_cool sides in the background once the dwell allows it."""
+        # A running transition decides the side itself
+        if self._attr_hvac_mode != HVACMode.HEAT_COOL or self._transition is not None:
+            return
+        if self._auto_side_wanted(self._auto_side) == self._auto_side:
+            return
+        
+        # Leaving a side early is what makes devices flap, and retrying a failed
+        # switch at once hammers the devices; either waits for the dwell
+        wait = self._auto_since + self._auto_min_dwell - self.hass.loop.time()
+        if (self._auto_side is not None or self._auto_failed) and wait > 0:
+            if self._auto_timer is None:
+                self._auto_timer = async_call_later(self.hass, wait, self._auto_dwell_over)
+            return
+        if self._auto_task is None or self._auto_task.done():
+            self._auto_task = self._tasks.create(self._async_update_auto(), "auto_switch")
+    
+    @callback
+    def _auto_dwell_over(self, _now: Any) -> None:
+        """Re-evaluate a side switch that waited for the minimum dwell."""
+        self._auto_timer = None
+        self._schedule_auto_update()
+    
+    def _cancel_auto_timer(self) -> None:
+        """Drop a pending dwell re-evaluation."""
+        if self._auto_timer is not None:
+            self._auto_timer()
+            self._auto_timer = None
+    
+    async def _async_update_auto(self) -> None:
+        """Hand heat_cool over from the running side's group to the other one."""
+        old_side = self._auto_side
+        side = self._auto_side_wanted(old_side)
+        if side == old_side:
+            return
+        old_ids = self._entity_ids_for_mode(old_side)
+        new_ids = self._entity_ids_for_mode(side)
+        setpoint = self._auto_setpoint(side)
+        started = False
+        
+        try:
+            if old_ids:
+                await self._async_call_group(
+                    old_ids, "set_hvac_mode", {"hvac_mode": HVACMode.OFF}, "auto_switch_off"
+                )
+                self._release_budget(old_ids)
+            # Counted as running before the start so a cancel still stops it
+            self._auto_side = side
+            await self._async_activate_group(new_ids, side, "auto_switch_on")
+            started = True
+            if setpoint is not None:
+                await self._async_call_group(
+                    new_ids, "set_temperature", {ATTR_TEMPERATURE: setpoint}, "auto_switch_on"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.error("heat_cool switch from %s to %s failed: %s", old_side, side, e)
+            if self._auto_side == side and not started:
+                # The failed start was rolled back, nothing runs
+                self._auto_side = None
+            self._auto_failed = True
+            return
+        finally:
+            self._auto_since = self.hass.loop.time()
+            self._account_runtime(self._routed_mode())
+        
+        self._auto_failed = False
+        self._auto_switches += 1
+        self._trace.record(
+            "auto_switch", args={"from": old_side, "to": side, "setpoint": setpoint}, outcome="switched"
+        )
+        _LOGGER.debug("heat_cool switched from %s to %s at %s", old_side, side, setpoint)
+        self.async_write_ha_state()
+    
+    def _release_budget(self, entity_ids: Sequence[str]) -> None:
+        """Return the power budget held by the groups these devices belong to."""
+        budget = self.hass.data[DATA_HUB].budget
+        for role in {self._devices[entity_id].role for entity_id in entity_ids}:
+            budget.async_release(self._entry_id, role)
+    
+    async def _turn_off_devices(self, entity_ids: Sequence[str]) -> None:
+        """Turn off the given devices (the outgoing group) together."""
+        try:
+            await self._async_call_group(
+                entity_ids,
+                "set_hvac_mode",
+                {"hvac_mode": HVACMode.OFF},
+                "turn_off_before_mode_switch",
+            )
+            _LOGGER.debug("Turned off devices: %s", entity_ids)
+            self._release_budget(entity_ids)
+        except Exception as e:
+            _LOGGER.error("Failed to turn off %s: %s", entity_ids, e)
+            raise
     
     async def _route_to_ac(self, hvac_mode: str) -> None:
-        """Route to AC device with specified mode."""
-        ac_entity_id = self._data.get("ac_entity_id")
-        if not ac_entity_id:
+        """Route to all AC devices with specified mode."""
+        if not self._ac_entity_ids:
             _LOGGER.error("AC entity not configured")
             raise ValueError("AC entity not configured")
         
         try:
-            self._record_internal_update(ac_entity_id, "route_to_ac")
-            await self.hass.services.async_call(
-                "climate",
-                "set_hvac_mode",
-                {"entity_id": ac_entity_id, "hvac_mode": hvac_mode},
-                blocking=True,
-            )
-            _LOGGER.info("Routed to AC with mode %s: %s", hvac_mode, ac_entity_id)
+            await self._async_activate_group(self._ac_entity_ids, hvac_mode, "route_to_ac")
+            _LOGGER.debug("Routed to AC with mode %s: %s", hvac_mode, self._ac_entity_ids)
         except Exception as e:
-            _LOGGER.error("Failed to route to AC %s: %s", ac_entity_id, e)
+            _LOGGER.error("Failed to route to AC %s: %s", self._ac_entity_ids, e)
             raise
     
     async def _route_to_fh(self, hvac_mode: str) -> None:
-        """Route to FH device with specified mode."""
-        fh_entity_id = self._data.get("fh_entity_id")
-        if not fh_entity_id:
+        """Route to all FH devices with specified mode."""
+        if not self._fh_entity_ids:
             _LOGGER.error("FH entity not configured")
             raise ValueError("FH entity not configured")
         
         try:
-            self._record_internal_update(fh_entity_id, "route_to_fh")
-            await self.hass.services.async_call(
-                "climate",
-                "set_hvac_mode",
-                {"entity_id": fh_entity_id, "hvac_mode": hvac_mode},
-                blocking=True,
-            )
-            _LOGGER.info("Routed to FH with mode %s: %s", hvac_mode, fh_entity_id)
+            await self._async_activate_group(self._fh_entity_ids, hvac_mode, "route_to_fh")
+            _LOGGER.debug("Routed to FH with mode %s: %s", hvac_mode, self._fh_entity_ids)
         except Exception as e:
-            _LOGGER.error("Failed to route to FH %s: %s", fh_entity_id, e)
+            _LOGGER.error("Failed to route to FH %s: %s", self._fh_entity_ids, e)
             raise
     
     async def _update_active_device_state(self) -> None:
-        """Update target temperature from active device (current temp is handled by property)."""
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
-        
-        if self._attr_hvac_mode in AC_HVAC_MODES and ac_entity_id:
-            # Get AC state
-            ac_state = self.hass.states.get(ac_entity_id)
-            if ac_state:
-                # Preserve target temperature if already set
-                if self._attr_target_temperature is None:
-                    self._attr_target_temperature = ac_state.attributes.get("temperature")
-                _LOGGER.debug("Updated AC target temp: %s", self._attr_target_temperature)
-        
-        elif self._attr_hvac_mode in FH_HVAC_MODES and fh_entity_id:
-            # Get FH state
-            fh_state = self.hass.states.get(fh_entity_id)
-            if fh_state:
-                # Preserve target temperature if already set
-                if self._attr_target_temperature is None:
-                    self._attr_target_temperature = fh_state.attributes.get("temperature")
-                _LOGGER.debug("Updated FH target temp: %s", self._attr_target_temperature)
+        """Update target temperature from active group (current temp is handled by property)."""
+        # Preserve target temperature if already set
+        if self._attr_target_temperature is not None:
+            return
+        
+        await self._async_ensure_fresh(self._active_entity_ids(), "update_active_device_state")
+        
+        # Take the target of the first member that reports one
+        for entity_id in self._active_entity_ids():
+            target = self._device_target(entity_id)
+            if target is not None:
+                self._attr_target_temperature = target
+                _LOGGER.debug(
+                    "Updated %s target temp: %s", self._get_active_device_name(), self._attr_target_temperature
+                )
+                break
     
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature to active device."""
+        self._check_lease("set_temperature")
+        await self._async_apply_temperature(**kwargs)
+    
+    async def _async_apply_temperature(self, **kwargs: Any) -> None:
+        """Route a target temperature, or the heat_cool range, to the active group."""
+        if ATTR_TARGET_TEMP_LOW in kwargs and ATTR_TARGET_TEMP_HIGH in kwargs:
+            await self._async_set_temperature_range(kwargs[ATTR_TARGET_TEMP_LOW], kwargs[ATTR_TARGET_TEMP_HIGH])
+            return
+        
         if ATTR_TEMPERATURE not in kwargs:
             return
         
         temperature = kwargs[ATTR_TEMPERATURE]
         
-        # Ignore for fan_only mode
-        if self._attr_hvac_mode == HVACMode.FAN_ONLY:
-            _LOGGER.info("Ignoring temperature set in fan_only mode")
-            return
+        # Apply against the mode the room is switching to, not the one it is leaving
+        await self._async_wait_for_transition()
         
-        # Route to active device
-        ac_entity_id = self._data.get("ac_entity_id")
-        fh_entity_id = self._data.get("fh_entity_id")
+        # Ignore for fan_only mode, and in heat_cool which runs on the range
+        if self._attr_hvac_mode in (HVACMode.FAN_ONLY, HVACMode.HEAT_COOL):
+            _LOGGER.debug("Ignoring temperature set in %s mode", self._attr_hvac_mode)
+            return
         
-        if self._attr_hvac_mode in AC_HVAC_MODES and ac_entity_id:
+        # Route to every device of the active group
+        entity_ids = self._active_entity_ids()
+        if entity_ids:
+            role = self._get_active_device_name()
             try:
-                self._record_internal_update(ac_entity_id, "set_temperature")
-                await self.hass.services.async_call(
-                    "climate",
-                    "set_temperature",
-                    {"entity_id": ac_entity_id, "temperature": temperature},
-                    blocking=True,
+                await self._async_call_group(
+                    entity_ids, "set_temperature", {"temperature": temperature}, "set_temperature"
                 )
                 self._attr_target_temperature = temperature
-                _LOGGER.info("Set AC temperature to %s", temperature)
+                _LOGGER.debug("Set %s temperature to %s", role, temperature)
+                self._schedule_boost_update()
+                self._update_control()
             except Exception as e:
-                _LOGGER.error("Failed to set AC temperature: %s", e)
+                _LOGGER.error("Failed to set %s temperature: %s", role, e)
                 raise
         
-        elif self._attr_hvac_mode in FH_HVAC_MODES and fh_entity_id:
+        self.async_write_ha_state()
+        
+        # Force mode validation after temperature change
+        if self._is_force_mode_enabled():
+            await self._validate_force_mode_consistency_after_change()
+    
+    async def _async_set_temperature_range(self, low: float, high: float) -> None:
+        """Set the heat_cool range; the running side's group gets its new setpoint."""
+        if low > high:
+            raise ServiceValidationError(
+                f"Low target {low} must not be above high target {high}"
+            )
+        
+        await self._async_wait_for_transition()
+        
+        # Outside heat_cool the range is only stored for the next switch to it
+        side = self._auto_side if self._attr_hvac_mode == HVACMode.HEAT_COOL else None
+        setpoint = {HVACMode.HEAT: low, HVACMode.COOL: high}.get(side)
+        if setpoint is not None and setpoint != self._auto_setpoint(side):
             try:
-                self._record_internal_update(fh_entity_id, "set_temperature")
-                await self.hass.services.async_call(
-                    "climate",
-                    "set_temperature",
-                    {"entity_id": fh_entity_id, "temperature": temperature},
-                    blocking=True,
+                await self._async_call_group(
+                    self._active_entity_ids(), "set_temperature", {ATTR_TEMPERATURE: setpoint}, "set_temperature_range"
                 )
-                self._attr_target_temperature = temperature
-                _LOGGER.info("Set FH temperature to %s", temperature)
             except Exception as e:
-                _LOGGER.error("Failed to set FH temperature: %s", e)
+                _LOGGER.error("Failed to set %s temperature: %s", self._get_active_device_name(), e)
                 raise
         
+        self._attr_target_temperature_low = low
+        self._attr_target_temperature_high = high
+        _LOGGER.debug("Set heat_cool range to %s - %s", low, high)
+        self._schedule_auto_update()
         self.async_write_ha_state()
         
-        # Force mode validation after temperature change
-        if self._is_force_mode_enabled():
+        if side is not None and self._is_force_mode_enabled():
             await self._validate_force_mode_consistency_after_change()
     
     async def async_set_preset_mode(self, preset_mode: str) -> None:
-        """Set new preset mode with proper routing based on current HVAC mode."""
-        _LOGGER.info("Setting preset mode to %s", preset_mode)
-        
-        # Get preset configurations
-        ac_presets = self._data.get("ac_presets", {})
-        fh_presets = self._data.get("fh_presets", {})
+        """Apply a preset of the active device group."""
+        self._check_lease("set_preset_mode")
+        await self._async_apply_preset(preset_mode)
+    
+    async def _async_apply_preset(self, preset_mode: str) -> None:
+        """Apply a preset of the active device group as one operation.
         
-        # Route preset based on current HVAC mode
-        if self._attr_hvac_mode in AC_HVAC_MODES:
-            # AC mode - apply fan_mode from AC preset
-            if preset_mode in ac_presets:
-                preset_data = ac_presets[preset_mode]
-                fan_mode = preset_data.get("fan_mode")
-                
-                if fan_mode:
-                    ac_entity_id = self._data.get("ac_entity_id")
-                    if ac_entity_id:
-                        try:
-                            self._record_internal_update(ac_entity_id, "set_preset_ac")
-                            await self.hass.services.async_call(
-                                "climate",
-                                "set_fan_mode",
-                                {"entity_id": ac_entity_id, "fan_mode": fan_mode},
-                                blocking=True,
-                            )
-                            self._attr_preset_mode = preset_mode
-                            _LOGGER.info("Applied AC preset %s with fan_mode %s", preset_mode, fan_mode)
-                        except Exception as e:
-                            _LOGGER.error("Failed to apply AC preset %s: %s", preset_mode, e)
-                            raise
-            else:
-                _LOGGER.warning("Preset %s not found in AC presets", preset_mode)
+        A preset may carry an HVAC mode, a target temperature, a fan mode and
+        a swing mode. The mode is switched first, since devices only take the
+        other attributes in the mode they belong to; those are independent
+        and sent concurrently. State is written once, at the end.
+        """
+        _LOGGER.debug("Setting preset mode to %s", preset_mode)
         
-        elif self._attr_hvac_mode in FH_HVAC_MODES:
-            # Heat mode - apply temperature from FH preset
-            if preset_mode in fh_presets:
-                preset_data = fh_presets[preset_mode]
-                temperature_str = preset_data.get("temperature")
-                
-                if temperature_str:
-                    try:
-                        temperature = float(temperature_str)
-                        fh_entity_id = self._data.get("fh_entity_id")
-                        if fh_entity_id:
-                            self._record_internal_update(fh_entity_id, "set_preset_fh")
-                            await self.hass.services.async_call(
-                                "climate",
-                                "set_temperature",
-                                {"entity_id": fh_entity_id, "temperature": temperature},
-                                blocking=True,
-                            )
-                            self._attr_preset_mode = preset_mode
-                            self._attr_target_temperature = temperature
-                            _LOGGER.info("Applied FH preset %s with temperature %s", preset_mode, temperature)
-                    except (ValueError, TypeError) as e:
-                        _LOGGER.error("Invalid temperature in preset %s: %s", preset_mode, e)
-                        raise
-                    except Exception as e:
-                        _LOGGER.error("Failed to apply FH preset %s: %s", preset_mode, e)
-                        raise
-            else:
-                _LOGGER.warning("Preset %s not found in FH presets", preset_mode)
+        await self._async_wait_for_transition()
         
-        elif self._attr_hvac_mode == HVACMode.OFF:
+        if self._attr_hvac_mode == HVACMode.OFF:
             # Off mode - no presets should be available
             _LOGGER.warning("Cannot set preset mode %s when HVAC mode is OFF", preset_mode)
             return
         
+        role = self._get_active_device_name()
+        preset_data = self._active_presets().get(preset_mode)
+        if preset_data is None:
+            _LOGGER.warning("Preset %s not found in %s presets", preset_mode, role)
+            return
+        
+        hvac_mode = preset_data.get(PRESET_HVAC_MODE)
+        switched = hvac_mode is not None and hvac_mode != self._attr_hvac_mode
+        try:
+            if switched:
+                await self._async_switch_mode(hvac_mode, publish=False)
+                if self._attr_hvac_mode != hvac_mode:
+                    # Superseded by a newer mode request, which owns the room now
+                    return
+                role = self._get_active_device_name()
+            temperature = await self._async_apply_preset_attributes(preset_data, f"set_preset_{role.lower()}")
+        except Exception as e:
+            _LOGGER.error("Failed to apply %s preset %s: %s", role, preset_mode, e)
+            if switched and self._attr_hvac_mode == hvac_mode:
+                # The mode change itself went through and must be published
+                self.async_write_ha_state()
+            raise
+        
+        self._attr_preset_mode = preset_mode
+        if temperature is not None:
+            self._attr_target_temperature = temperature
+            self._schedule_boost_update()
+            self._update_control()
+        _LOGGER.debug("Applied %s preset %s: %s", role, preset_mode, preset_data)
+        
         # Update state
         self.async_write_ha_state()
         
         # Force mode validation after preset change
         if self._is_force_mode_enabled():
-            await self._validate_force_mode_consistency_after_change()
\ No newline at end of file
+            await self._validate_force_mode_consistency_after_change()
+    
+    async def _async_apply_preset_attributes(self, preset_data: dict[str, Any], trigger: str) -> float | None:
+        """Send a preset's temperature, fan and swing modes to the active group concurrently.
+        
+        Returns the temperature that was applied, if any. Waits for every
+        command before raising the first failure, like a group call.
+        """
+        entity_ids = self._active_entity_ids()
+        if not entity_ids:
+            return None
+        
+        # Stored as a number since schema v2 - no parsing needed
+        temperature = preset_data.get(PRESET_TEMPERATURE)
+        if self._attr_hvac_mode == HVACMode.FAN_ONLY:
+            temperature = None
+        
+        calls = []
+        if temperature is not None:
+            calls.append(("set_temperature", {ATTR_TEMPERATURE: temperature}))
+        if preset_data.get(PRESET_FAN_MODE):
+            calls.append(("set_fan_mode", {"fan_mode": preset_data[PRESET_FAN_MODE]}))
+        if preset_data.get(PRESET_SWING_MODE):
+            calls.append(("set_swing_mode", {"swing_mode": preset_data[PRESET_SWING_MODE]}))
+        
+        results = await asyncio.gather(
+            *(self._async_call_group(entity_ids, service, data, trigger) for service, data in calls),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return temperature
+    
+    async def async_set_preset_id(self, preset_id: str) -> None:
+        """Apply a preset of the active device group by its stable id."""
+        self._check_lease("set_preset")
+        await self._async_apply_preset_id(preset_id)
+    
+    async def _async_apply_preset_id(self, preset_id: str) -> None:
+        """Look a preset up by its stable id and apply it."""
+        for preset in self._active_presets().values():
+            if preset[PRESET_ID] == preset_id:
+                await self._async_apply_preset(preset[PRESET_NAME])
+                return
+        raise ServiceValidationError(
+            f"Preset id {preset_id} is not available in HVAC mode {self._attr_hvac_mode}"
+        )
+    
+    def _register_schedule(self) -> None:
+        """Hand the room's compiled schedule to the domain-wide wheel.
+        
+        Records with a known heat or cool target, including ones that only
+        raise the target of the mode the room is in, also get early-start
+        checks in the hours before them; real records win any minute both
+        land on.
+        """
+        prestart = compile_prestart(
+            [r for r in self._schedule if self._prestart_candidate(r)],
+            PRESTART_MAX_LEAD,
+            PRESTART_STEP,
+        )
+        self.hass.data[DATA_HUB].scheduler.async_set(
+            self._entry_id,
+            {**prestart, **compile_schedule(self._schedule)},
+            self._async_apply_schedule,
+            self._tasks.create,
+        )
+    
+    def _next_schedule(self) -> str | None:
+        """Return when the room's schedule fires next, as an ISO timestamp."""
+        if not self._schedule:
+            return None
+        when = self.hass.data[DATA_HUB].scheduler.next_due(self._entry_id)
+        return when.isoformat() if when else None
+    
+    async def _async_apply_schedule(self, record: dict[str, Any]) -> None:
+        """Apply a due schedule record: mode first, then preset, then target."""
+        if SCHEDULE_PRESTART in record:
+            await self._async_prestart(record[SCHEDULE_PRESTART], record[SCHEDULE_DUE_IN] * 60)
+            return
+        
+        self._trace.record(
+            "schedule",
+            args={k: v for k, v in record.items() if k != SCHEDULE_DAYS},
+            outcome="due",
+        )
+        
+        # The schedule is a source without a lease; a held room skips it
+        holder = self._leases.holder(dt_util.utcnow())
+        if holder is not None:
+            self._leases.rejected += 1
+            self._trace.record("schedule", args={"holder": holder.source}, outcome="lease_rejected")
+            self.async_write_ha_state()
+            return
+        
+        await self._async_apply_command(record)
+    
+    async def _async_apply_command(self, command: dict[str, Any]) -> None:
+        """Apply a schedule record or lease command: mode, then preset, then target."""
+        hvac_mode = command.get(SCHEDULE_HVAC_MODE)
+        if hvac_mode is not None and hvac_mode != self._attr_hvac_mode:
+            _LOGGER.debug("Setting HVAC mode to %s", hvac_mode)
+            await self._async_switch_mode(hvac_mode)
+        
+        preset_id = command.get(SCHEDULE_PRESET_ID)
+        if preset_id is not None:
+            await self._async_apply_preset_id(preset_id)
+        
+        temperature = command.get(SCHEDULE_TEMPERATURE)
+        if temperature is not None:
+            await self._async_apply_temperature(**{ATTR_TEMPERATURE: temperature})
+    
+    def _check_lease(self, command: str) -> None:
+        """Refuse a command without the lease while a source holds the room."""
+        holder = self._leases.holder(dt_util.utcnow())
+        if holder is None:
+            return
+        self._leases.rejected += 1
+        self._trace.record("lease", args={"command": command, "holder": holder.source}, outcome="rejected")
+        self.async_write_ha_state()
+        raise ServiceValidationError(
+            f"{self.entity_id} is held by {holder.source} (priority {holder.priority}) "
+            f"until {holder.expires.isoformat()}"
+        )
+    
+    async def async_claim(self, source: str, priority: int, ttl: int, **command: Any) -> None:
+        """Claim the room for a command source and apply its command if it holds the room.
+        
+        A claim that does not win waits with its command; so does a holder
+        that a higher claim takes the room from.
+        """
+        now = dt_util.utcnow()
+        held = self._leases.claim(source, priority, ttl, command, now)
+        self._trace.record(
+            "lease", args={"source": source, "priority": priority, **command},
+            outcome="held" if held else "waiting",
+        )
+        self._schedule_lease_expiry()
+        if held:
+            if command:
+                await self._async_apply_command(command)
+            self.async_write_ha_state()
+            return
+        
+        # A holder that lowered its own priority may have handed the room on
+        await self._async_lease_handover(self._leases.handover(now))
+    
+    async def async_release(self, source: str) -> None:
+        """Give a source's claim up; the next waiting claim takes over."""
+        self._trace.record("lease", args={"source": source}, outcome="released")
+        promoted = self._leases.release(source, dt_util.utcnow())
+        self._schedule_lease_expiry()
+        await self._async_lease_handover(promoted)
+    
+    async def _async_lease_handover(self, lease: Lease | None) -> None:
+        """Apply the command of a claim that just took the room over."""
+        if lease is not None and lease.command:
+            self._trace.record(
+                "lease", args={"source": lease.source, **lease.command}, outcome="resumed"
+            )
+            await self._async_apply_command(lease.command)
+        self.async_write_ha_state()
+    
+    @callback
+    def _schedule_lease_expiry(self) -> None:
+        """Wake up when the first claim runs out."""
+        if self._lease_timer is not None:
+            self._lease_timer()
+            self._lease_timer = None
+        expires = self._leases.next_expiry()
+        if expires is not None:
+            self._lease_timer = async_track_point_in_utc_time(
+                self.hass, self._handle_lease_expiry, expires
+            )
+    
+    @callback
+    def _handle_lease_expiry(self, now: datetime) -> None:
+        """Hand the room to the next claim once the holder's lease ran out."""
+        self._lease_timer = None
+        promoted = self._leases.handover(now)
+        self._schedule_lease_expiry()
+        self._tasks.create(self._async_lease_handover(promoted), "lease_handover")
+    
+    def _prestart_candidate(self, record: dict[str, Any]) -> bool:
+        """Return True if a schedule record can have a heat or cool target.
+        
+        A record without a mode runs in whichever mode the room is in when
+        it is due, so either side counts.
+        """
+        hvac_mode = record.get(SCHEDULE_HVAC_MODE)
+        modes = (hvac_mode,) if hvac_mode else (HVACMode.HEAT, HVACMode.COOL)
+        return any(self._schedule_target(record, mode) is not None for mode in modes)
+    
+    def _schedule_mode(self, record: dict[str, Any]) -> str | None:
+        """Return the heat or cool mode a schedule record runs the room in.
+        
+        A record without a mode keeps the room's current one.
+        """
+        hvac_mode = record.get(SCHEDULE_HVAC_MODE) or self._attr_hvac_mode
+        return hvac_mode if hvac_mode in (HVACMode.HEAT, HVACMode.COOL) else None
+    
+    def _schedule_target(self, record: dict[str, Any], hvac_mode: str | None) -> float | None:
+        """Return the target a schedule record drives the room to in a heat or cool mode."""
+        if hvac_mode not in (HVACMode.HEAT, HVACMode.COOL):
+            return None
+        if record.get(SCHEDULE_TEMPERATURE) is not None:
+            return record[SCHEDULE_TEMPERATURE]
+        presets = self._fh_presets if hvac_mode == HVACMode.HEAT else self._ac_presets
+        for preset in presets.values():
+            if preset[PRESET_ID] == record.get(SCHEDULE_PRESET_ID):
+                return preset.get(PRESET_TEMPERATURE)
+        return None
+    
+    async def _async_prestart(self, record: dict[str, Any], due_in: float) -> None:
+        """Start a scheduled record early if the room would otherwise be late.
+        
+        Checks run every PRESTART_STEP minutes before the record; the room
+        starts at the last check that still leaves it the learned lead time.
+        A room already in the record's mode starts early by taking the
+        record's target, unless it already aims at least that far.
+        """
+        hvac_mode = self._schedule_mode(record)
+        current = self.current_temperature
+        target = self._schedule_target(record, hvac_mode)
+        if current is None or target is None:
+            return
+        heating = hvac_mode == HVACMode.HEAT
+        aim = self._attr_target_temperature
+        if self._attr_hvac_mode == hvac_mode and aim is not None and (
+            aim >= target if heating else aim <= target
+        ):
+            return
+        
+        lead = self._thermal.lead_time(hvac_mode, current, target, heating)
+        if not lead or lead + PRESTART_STEP * 60 < due_in:
+            return
+        
+        self._trace.record(
+            "schedule",
+            args={"target": target, "lead_s": round(lead), "due_in_s": due_in},
+            outcome="prestart",
+        )
+        _LOGGER.debug(
+            "Starting %s %d s early: %.1f -> %.1f needs %d s",
+            hvac_mode, due_in, current, target, lead,
+        )
+        await self._async_apply_schedule(record)
+    
+    async def async_set_schedule(self, schedule: list[dict[str, Any]]) -> None:
+        """Replace the room's comfort schedule and store it in the config entry."""
+        self._schedule = [
+            {**record, SCHEDULE_TIME: record[SCHEDULE_TIME].strftime("%H:%M")}
+            for record in schedule
+        ]
+        
+        entry = self.hass.config_entries.async_get_entry(self._entry_id)
+        if entry is not None:
+            self.hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_SCHEDULE: self._schedule}
+            )
+        
+        self._register_schedule()
+        _LOGGER.debug("Schedule for %s set to %d records", self.entity_id, len(self._schedule))
+        self.async_write_ha_state()
@@ -8,15 +8,84 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.components.climate.const import DOMAIN as CLIMATE_DOMAIN, HVACMode
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import selector
 
-from .const import DOMAIN, AC_HVAC_MODES, FH_HVAC_MODES, PRESET_SLOTS, AC_PRESET_DEFAULTS, FH_PRESET_DEFAULTS
+from .const import (
+    DOMAIN,
+    AC_HVAC_MODES,
+    FH_HVAC_MODES,
+    PRESET_SLOTS,
+    AC_PRESET_DEFAULTS,
+    FH_PRESET_DEFAULTS,
+    CONF_AC_ENTITY_IDS,
+    CONF_FH_ENTITY_IDS,
+    CONF_TEMPERATURE_AGGREGATE,
+    CONF_TEMPERATURE_SENSORS,
+    CONF_HYBRID_BOOST,
+    CONF_DEADBAND_CONTROL,
+    CONF_FORCE_MODE,
+    CONF_AC_PRESETS,
+    CONF_FH_PRESETS,
+    CONF_TUNING,
+    CONF_PRIORITY,
+    CONF_BUDGET_MAX_WAIT,
+    CONF_AC_DEVICE_POWER,
+    CONF_FH_DEVICE_POWER,
+    CONF_CONTROL_DEADBAND,
+    CONF_MIN_ON_TIME,
+    CONF_MIN_OFF_TIME,
+    CONFIG_ENTRY_VERSION,
+    DEFAULT_TUNING,
+    TEMPERATURE_AGGREGATES,
+    DEFAULT_TEMPERATURE_AGGREGATE,
+    PRESET_ID,
+    PRESET_NAME,
+    PRESET_ICON,
+    PRESET_FAN_MODE,
+    PRESET_TEMPERATURE,
+    PRESET_HVAC_MODE,
+    PRESET_SWING_MODE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _as_entity_list(value: str | list[str] | None) -> list[str]:
+    """Normalise an entity selector value to a list of entity ids."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def _has_preset(presets: list[dict[str, Any]], name: str) -> bool:
+    """Return True if a preset with this display name is already collected."""
+    return any(preset[PRESET_NAME] == name for preset in presets)
+
+
+def _tuning_overrides(tuning: dict[str, Any]) -> dict[str, Any]:
+    """Return the tuning values that differ from the defaults.
+    
+    Only these are stored, so rooms follow later changes of the defaults
+    for everything the user did not set.
+    """
+    return {key: value for key, value in tuning.items() if DEFAULT_TUNING.get(key) != value}
+
+
+# Tuning values the options flow edits: key, minimum, maximum, step, unit
+TUNING_OPTIONS = (
+    (CONF_PRIORITY, 0, 100, 1, None),
+    (CONF_BUDGET_MAX_WAIT, 0, 3600, 10, "s"),
+    (CONF_AC_DEVICE_POWER, 0, 20000, 10, "W"),
+    (CONF_FH_DEVICE_POWER, 0, 20000, 10, "W"),
+    (CONF_CONTROL_DEADBAND, 0.1, 5, 0.1, "°C"),
+    (CONF_MIN_ON_TIME, 0, 3600, 10, "s"),
+    (CONF_MIN_OFF_TIME, 0, 3600, 10, "s"),
+)
+
+
 class EntityValidationError(HomeAssistantError):
     """Exception for entity validation errors."""
     pass
@@ -25,18 +94,32 @@ class EntityValidationError(HomeAssistantError):
 class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for room_hvac."""
     
-    VERSION = 1
+    VERSION = CONFIG_ENTRY_VERSION
+    
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> RoomHVACOptionsFlow:
+        """Return the flow that edits a room's tuning."""
+        return RoomHVACOptionsFlow(config_entry)
     
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._ac_entity_id: str | None = None
-        self._fh_entity_id: str | None = None
+        self._ac_entity_ids: list[str] = []
+        self._fh_entity_ids: list[str] = []
         self._force_mode: bool = False
+        self._temperature_aggregate: str = DEFAULT_TEMPERATURE_AGGREGATE
+        self._temperature_sensors: list[str] = []
+        self._hybrid_boost: bool = False
+        self._deadband_control: bool = False
         self._ac_fan_modes: list[str] = []
-        self._ac_presets: dict[str, dict[str, str]] = {}
+        self._ac_swing_modes: list[str] = []
+        self._ac_hvac_modes: list[str] = []
+        self._ac_presets: list[dict[str, Any]] = []
         self._fh_min_temp: float | None = None
         self._fh_max_temp: float | None = None
-        self._fh_presets: dict[str, dict[str, str]] = {}
+        self._fh_presets: list[dict[str, Any]] = []
         self._hass: HomeAssistant | None = None
     
     
@@ -47,24 +130,24 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         
         if user_input is not None:
-            ac_entity_id = user_input.get("ac_entity_id")
-            fh_entity_id = user_input.get("fh_entity_id")
+            ac_entity_ids = _as_entity_list(user_input.get(CONF_AC_ENTITY_IDS))
+            fh_entity_ids = _as_entity_list(user_input.get(CONF_FH_ENTITY_IDS))
             
             try:
                 # Validate entities are provided
-                if not ac_entity_id:
-                    errors["ac_entity_id"] = "entity_required"
-                if not fh_entity_id:
-                    errors["fh_entity_id"] = "entity_required"
+                if not ac_entity_ids:
+                    errors[CONF_AC_ENTITY_IDS] = "entity_required"
+                if not fh_entity_ids:
+                    errors[CONF_FH_ENTITY_IDS] = "entity_required"
 
                 # If entities are provided, validate them
-                if ac_entity_id and fh_entity_id:
-                    # Validate entities are different
-                    if ac_entity_id == fh_entity_id:
-                        errors["fh_entity_id"] = "entities_must_be_different"
+                if ac_entity_ids and fh_entity_ids:
+                    # Validate no device is used for both roles
+                    if set(ac_entity_ids) & set(fh_entity_ids):
+                        errors[CONF_FH_ENTITY_IDS] = "entities_must_be_different"
 
                     # Validate entity domains
-                    if not self._validate_entity_domains(ac_entity_id, fh_entity_id):
+                    if not self._validate_entity_domains(ac_entity_ids + fh_entity_ids):
                         errors["general"] = "invalid_domain"
 
                     # If basic validation passed, check capabilities
@@ -74,33 +157,33 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             _LOGGER.error("[room_hvac] self.hass or self.hass.states is None during entity validation. self.hass type: %s", type(self.hass))
                             errors["general"] = "hass_not_ready"
                         else:
-                            # Get entity states from Home Assistant
-                            ac_state = self.hass.states.get(ac_entity_id)
-                            fh_state = self.hass.states.get(fh_entity_id)
-
-                            # Check if entities exist and are available
-                            if ac_state is None:
-                                _LOGGER.error("AC entity '%s' not found in Home Assistant states.", ac_entity_id)
-                                errors["ac_entity_id"] = "entity_not_found"
-                            if fh_state is None:
-                                _LOGGER.error("FH entity '%s' not found in Home Assistant states.", fh_entity_id)
-                                errors["fh_entity_id"] = "entity_not_found"
-                            # Proceed only if both states are valid
-                            if ac_state and fh_state:
-                                # Validate AC capabilities
+                            # Every member of each group must exist and be capable
+                            for ac_entity_id in ac_entity_ids:
+                                ac_state = self.hass.states.get(ac_entity_id)
+                                if ac_state is None:
+                                    _LOGGER.error("AC entity '%s' not found in Home Assistant states.", ac_entity_id)
+                                    errors[CONF_AC_ENTITY_IDS] = "entity_not_found"
+                                    break
                                 ac_capability_errors = self._validate_ac_capabilities(ac_state)
                                 if ac_capability_errors:
                                     errors.update(ac_capability_errors)
+                                    break
 
-                                # Validate FH capabilities
+                            for fh_entity_id in fh_entity_ids:
+                                fh_state = self.hass.states.get(fh_entity_id)
+                                if fh_state is None:
+                                    _LOGGER.error("FH entity '%s' not found in Home Assistant states.", fh_entity_id)
+                                    errors[CONF_FH_ENTITY_IDS] = "entity_not_found"
+                                    break
                                 fh_capability_errors = self._validate_fh_capabilities(fh_state)
                                 if fh_capability_errors:
                                     errors.update(fh_capability_errors)
+                                    break
 
                     # If all validations passed, store and proceed to next step
                     if not errors:
-                        self._ac_entity_id = ac_entity_id
-                        self._fh_entity_id = fh_entity_id
+                        self._ac_entity_ids = ac_entity_ids
+                        self._fh_entity_ids = fh_entity_ids
                         return await self.async_step_behavior()
 
             except Exception as ex:
@@ -120,6 +203,12 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Store force mode setting
             self._force_mode = user_input.get("force_mode", False)
+            self._temperature_aggregate = user_input.get(
+                CONF_TEMPERATURE_AGGREGATE, DEFAULT_TEMPERATURE_AGGREGATE
+            )
+            self._temperature_sensors = _as_entity_list(user_input.get(CONF_TEMPERATURE_SENSORS))
+            self._hybrid_boost = user_input.get(CONF_HYBRID_BOOST, False)
+            self._deadband_control = user_input.get(CONF_DEADBAND_CONTROL, False)
             
             # Proceed to AC preset configuration
             return await self.async_step_ac_presets()
@@ -136,32 +225,43 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the AC preset configuration step."""
         if user_input is not None:
             # Process preset configurations
-            self._ac_presets = {}
+            self._ac_presets = []
             
             for slot in PRESET_SLOTS:
                 # Extract data from section
                 section_data = user_input.get(f"ac_preset_{slot}", {})
                 name = section_data.get(f"ac_{slot}_name")
                 icon = section_data.get(f"ac_{slot}_icon")
-                fan_speed = section_data.get(f"ac_{slot}_fan_speed")
                 
-                # Only store if name and fan_speed are provided
-                if name and fan_speed:
-                    self._ac_presets[name] = {
-                        "fan_mode": fan_speed,
-                        "icon": icon or "",  # Optional icon
-                    }
+                # Any combination of mode, temperature, fan and swing may be set
+                attributes = {
+                    PRESET_HVAC_MODE: section_data.get(f"ac_{slot}_hvac_mode"),
+                    PRESET_TEMPERATURE: section_data.get(f"ac_{slot}_temp"),
+                    PRESET_FAN_MODE: section_data.get(f"ac_{slot}_fan_speed"),
+                    PRESET_SWING_MODE: section_data.get(f"ac_{slot}_swing_mode"),
+                }
+                attributes = {key: value for key, value in attributes.items() if value not in (None, "")}
+                if PRESET_TEMPERATURE in attributes:
+                    attributes[PRESET_TEMPERATURE] = float(attributes[PRESET_TEMPERATURE])
+                
+                # Only store if a name and at least one attribute are provided (first slot wins on duplicate names)
+                if name and attributes and not _has_preset(self._ac_presets, name):
+                    self._ac_presets.append({
+                        PRESET_ID: slot,  # Stable id, survives renames
+                        PRESET_NAME: name,
+                        PRESET_ICON: icon or "",  # Optional icon
+                        **attributes,
+                    })
             
             # Proceed to FH preset configuration
             return await self.async_step_fh_presets()
         
-        # Get AC fan modes for the selector
-        ac_state = self.hass.states.get(self._ac_entity_id)
-        if ac_state:
-            self._ac_fan_modes = ac_state.attributes.get("fan_modes", [])
-        else:
-            # Fallback - should not happen due to previous validation
-            self._ac_fan_modes = []
+        # Get AC fan, swing and HVAC modes for the selectors - only modes every AC in the group supports
+        self._ac_fan_modes = self._common_ac_modes("fan_modes")
+        self._ac_swing_modes = self._common_ac_modes("swing_modes")
+        self._ac_hvac_modes = [
+            mode for mode in self._common_ac_modes("hvac_modes") if mode in AC_HVAC_MODES
+        ]
         
         # Show the AC preset configuration form with default values
         return self.async_show_form(
@@ -176,7 +276,7 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the FH preset configuration step."""
         if user_input is not None:
             # Process preset configurations
-            self._fh_presets = {}
+            self._fh_presets = []
             
             for slot in PRESET_SLOTS:
                 # Extract data from section
@@ -185,8 +285,8 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 icon = section_data.get(f"fh_{slot}_icon")
                 temperature = section_data.get(f"fh_{slot}_temp")
                 
-                # Only store if name and temperature are provided
-                if name and temperature:
+                # Only store if name and temperature are provided (first slot wins on duplicate names)
+                if name and temperature and not _has_preset(self._fh_presets, name):
                     try:
                         temp_value = float(temperature)
                         
@@ -205,10 +305,12 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             )
                             temp_value = self._fh_max_temp
                         
-                        self._fh_presets[name] = {
-                            "temperature": str(temp_value),
-                            "icon": icon or "",  # Optional icon
-                        }
+                        self._fh_presets.append({
+                            PRESET_ID: slot,  # Stable id, survives renames
+                            PRESET_NAME: name,
+                            PRESET_ICON: icon or "",  # Optional icon
+                            PRESET_TEMPERATURE: temp_value,  # Stored as a number
+                        })
                     except (ValueError, TypeError):
                         _LOGGER.error(
                             "Invalid temperature value for FH preset %s: %s",
@@ -220,15 +322,20 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # All configuration complete - proceed to confirmation
             return await self.async_step_confirm()
         
-        # Get FH temperature range for validation
-        fh_state = self.hass.states.get(self._fh_entity_id)
-        if fh_state:
-            self._fh_min_temp = fh_state.attributes.get("min_temp")
-            self._fh_max_temp = fh_state.attributes.get("max_temp")
-        else:
-            # Fallback - should not happen due to previous validation
-            self._fh_min_temp = None
-            self._fh_max_temp = None
+        # Get FH temperature range for validation - the range every zone accepts
+        self._fh_min_temp = None
+        self._fh_max_temp = None
+        for fh_entity_id in self._fh_entity_ids:
+            fh_state = self.hass.states.get(fh_entity_id)
+            if not fh_state:
+                # Fallback - should not happen due to previous validation
+                continue
+            min_temp = fh_state.attributes.get("min_temp")
+            max_temp = fh_state.attributes.get("max_temp")
+            if min_temp is not None:
+                self._fh_min_temp = min_temp if self._fh_min_temp is None else max(self._fh_min_temp, min_temp)
+            if max_temp is not None:
+                self._fh_max_temp = max_temp if self._fh_max_temp is None else min(self._fh_max_temp, max_temp)
         
         # Show the FH preset configuration form with default values
         return self.async_show_form(
@@ -237,11 +344,23 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders=FH_PRESET_DEFAULTS,
         )
     
-    def _validate_entity_domains(self, ac_entity_id: str, fh_entity_id: str) -> bool:
-        """Validate that both entities belong to the climate domain."""
-        return (
-            ac_entity_id.startswith(f"{CLIMATE_DOMAIN}.") and
-            fh_entity_id.startswith(f"{CLIMATE_DOMAIN}.")
+    def _common_ac_modes(self, attribute: str) -> list[str]:
+        """Return the values of a modes attribute that every AC in the group lists."""
+        common: list[str] = []
+        for index, ac_entity_id in enumerate(self._ac_entity_ids):
+            ac_state = self.hass.states.get(ac_entity_id)
+            # Fallback - missing state should not happen due to previous validation
+            modes = ac_state.attributes.get(attribute) or [] if ac_state else []
+            if index == 0:
+                common = list(modes)
+            else:
+                common = [mode for mode in common if mode in modes]
+        return common
+    
+    def _validate_entity_domains(self, entity_ids: list[str]) -> bool:
+        """Validate that all entities belong to the climate domain."""
+        return all(
+            entity_id.startswith(f"{CLIMATE_DOMAIN}.") for entity_id in entity_ids
         )
     
     def _validate_ac_capabilities(self, ac_state: State) -> dict[str, str]:
@@ -251,7 +370,7 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Check if entity supports fan modes
         fan_modes = ac_state.attributes.get("fan_modes", [])
         if not fan_modes:
-            errors["ac_entity_id"] = "ac_no_fan_modes"
+            errors[CONF_AC_ENTITY_IDS] = "ac_no_fan_modes"
             return errors
         
         # Check if entity supports the required HVAC modes
@@ -260,7 +379,7 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         
         # Check if AC supports at least one of cool/dry/fan_only
         if not any(mode in supported_modes for mode in required_modes):
-            errors["ac_entity_id"] = "ac_missing_modes"
+            errors[CONF_AC_ENTITY_IDS] = "ac_missing_modes"
         
         # Check if entity supports target temperature (for cool/dry modes)
         if HVACMode.COOL not in supported_modes and HVACMode.DRY not in supported_modes:
@@ -278,13 +397,13 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Check if entity supports heat mode
         supported_modes = fh_state.attributes.get("hvac_modes", [])
         if HVACMode.HEAT not in supported_modes:
-            errors["fh_entity_id"] = "fh_no_heat_mode"
+            errors[CONF_FH_ENTITY_IDS] = "fh_no_heat_mode"
             return errors
         
         # Check if entity supports target temperature
         # This is critical for floor heating control
         if "target_temperature" not in fh_state.attributes and 'temperature' not in fh_state.attributes:
-            errors["fh_entity_id"] = "fh_no_target_temp"
+            errors[CONF_FH_ENTITY_IDS] = "fh_no_target_temp"
             return errors
         
         # Check for temperature range if available
@@ -297,16 +416,21 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     
     def _get_user_schema(self) -> vol.Schema:
         """Generate the user step schema."""
+        # Selector helpers are only needed when a form is shown
+        from homeassistant.helpers import selector
+        
         return vol.Schema(
             {
-                vol.Required("ac_entity_id"): selector.EntitySelector(
+                vol.Required(CONF_AC_ENTITY_IDS): selector.EntitySelector(
                     selector.EntitySelectorConfig(
-                        domain=CLIMATE_DOMAIN
+                        domain=CLIMATE_DOMAIN,
+                        multiple=True,
                     ),
                 ),
-                vol.Required("fh_entity_id"): selector.EntitySelector(
+                vol.Required(CONF_FH_ENTITY_IDS): selector.EntitySelector(
                     selector.EntitySelectorConfig(
-                        domain=CLIMATE_DOMAIN
+                        domain=CLIMATE_DOMAIN,
+                        multiple=True,
                     ),
                 ),
             }
@@ -314,15 +438,37 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     
     def _get_behavior_schema(self) -> vol.Schema:
         """Generate the behavior options step schema."""
+        # Selector helpers are only needed when a form is shown
+        from homeassistant.helpers import selector
+        
         return vol.Schema(
             {
                 vol.Required("force_mode", default=False): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_TEMPERATURE_AGGREGATE, default=DEFAULT_TEMPERATURE_AGGREGATE
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=TEMPERATURE_AGGREGATES,
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                        translation_key=CONF_TEMPERATURE_AGGREGATE,
+                    )
+                ),
+                vol.Required(CONF_HYBRID_BOOST, default=False): selector.BooleanSelector(),
+                vol.Required(CONF_DEADBAND_CONTROL, default=False): selector.BooleanSelector(),
+                vol.Optional(CONF_TEMPERATURE_SENSORS): selector.EntitySelector(
+                    selector.EntitySelectorConfig(
+                        domain="sensor",
+                        device_class="temperature",
+                        multiple=True,
+                    )
+                ),
             }
         )
     
     def _get_ac_presets_schema(self) -> vol.Schema:
         """Generate the AC preset configuration schema with 4 slots."""
         from homeassistant.data_entry_flow import section
+        from homeassistant.helpers import selector
         
         schema_dict = {}
         
@@ -333,13 +479,31 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Create a section for each preset
             preset_section = vol.Schema(
                 {
-                    # Preset name (optional, but required if fan_speed is provided)
+                    # Preset name (optional, but required if any setting is provided)
                     vol.Optional(f"ac_{slot}_name", default=default_name): str,
                     
                     # Preset icon (optional) - using HA native IconSelector
                     vol.Optional(f"ac_{slot}_icon", default=default_icon): selector.IconSelector(),
                     
-                    # Fan speed selector (optional, but required if name is provided)
+                    # HVAC mode the preset switches to (optional)
+                    vol.Optional(f"ac_{slot}_hvac_mode"): (
+                        selector.SelectSelector(
+                            selector.SelectSelectorConfig(
+                                options=self._ac_hvac_modes,
+                                mode=selector.SelectSelectorMode.DROPDOWN,
+                            )
+                        )
+                        if self._ac_hvac_modes
+                        else vol.In(sorted(AC_HVAC_MODES))
+                    ),
+                    
+                    # Target temperature (optional)
+                    vol.Optional(f"ac_{slot}_temp"): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(min=16, max=32)  # Reasonable defaults
+                    ),
+                    
+                    # Fan speed selector (optional; a preset needs at least one setting)
                     vol.Optional(f"ac_{slot}_fan_speed"): (
                         selector.SelectSelector(
                             selector.SelectSelectorConfig(
@@ -350,6 +514,18 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         if self._ac_fan_modes
                         else str
                     ),
+                    
+                    # Swing mode selector (optional)
+                    vol.Optional(f"ac_{slot}_swing_mode"): (
+                        selector.SelectSelector(
+                            selector.SelectSelectorConfig(
+                                options=self._ac_swing_modes,
+                                mode=selector.SelectSelectorMode.DROPDOWN,
+                            )
+                        )
+                        if self._ac_swing_modes
+                        else str
+                    ),
                 }
             )
             
@@ -364,6 +540,7 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def _get_fh_presets_schema(self) -> vol.Schema:
         """Generate the FH preset configuration schema with 4 slots."""
         from homeassistant.data_entry_flow import section
+        from homeassistant.helpers import selector
         
         schema_dict = {}
         
@@ -421,12 +598,14 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             config_data = self._build_config_data()
             
             # Create unique ID for this entry
-            await self.async_set_unique_id(f"{self._ac_entity_id}_{self._fh_entity_id}")
+            await self.async_set_unique_id(
+                "_".join(sorted(self._ac_entity_ids) + sorted(self._fh_entity_ids))
+            )
             self._abort_if_unique_id_configured()
             
             # Create the config entry
             return self.async_create_entry(
-                title=f"Room HVAC - {self._ac_entity_id.split('.')[-1]}",
+                title=f"Room HVAC - {self._ac_entity_ids[0].split('.')[-1]}",
                 data=config_data,
             )
         
@@ -446,21 +625,31 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         Returns a dictionary with all configuration data needed for the integration.
         """
         # Filter out empty presets (presets with missing required values)
-        ac_presets = {
-            k: v for k, v in self._ac_presets.items() 
-            if v.get("fan_mode")  # AC preset needs fan_mode
-        }
-        fh_presets = {
-            k: v for k, v in self._fh_presets.items() 
-            if v.get("temperature")  # FH preset needs temperature
-        }
+        ac_presets = [
+            p for p in self._ac_presets
+            if any(  # AC preset needs at least one setting
+                p.get(key) not in (None, "")
+                for key in (PRESET_HVAC_MODE, PRESET_TEMPERATURE, PRESET_FAN_MODE, PRESET_SWING_MODE)
+            )
+        ]
+        fh_presets = [
+            p for p in self._fh_presets
+            if p.get(PRESET_TEMPERATURE) is not None  # FH preset needs temperature
+        ]
+        
+        # Presets keep slot order; tuning only keeps what differs from the defaults
+        tuning = _tuning_overrides({CONF_TEMPERATURE_AGGREGATE: self._temperature_aggregate})
         
         return {
-            "ac_entity_id": self._ac_entity_id,
-            "fh_entity_id": self._fh_entity_id,
-            "force_mode": self._force_mode,
-            "ac_presets": ac_presets,
-            "fh_presets": fh_presets,
+            CONF_AC_ENTITY_IDS: self._ac_entity_ids,
+            CONF_FH_ENTITY_IDS: self._fh_entity_ids,
+            CONF_FORCE_MODE: self._force_mode,
+            CONF_TEMPERATURE_SENSORS: self._temperature_sensors,
+            CONF_HYBRID_BOOST: self._hybrid_boost,
+            CONF_DEADBAND_CONTROL: self._deadband_control,
+            CONF_AC_PRESETS: ac_presets,
+            CONF_FH_PRESETS: fh_presets,
+            CONF_TUNING: tuning,
         }
     
     def _build_configuration_summary(self) -> dict[str, str]:
@@ -469,31 +658,94 @@ class RoomHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         Returns a dictionary of placeholders for the confirmation form.
         """
         summary = {
-            "ac_entity": self._ac_entity_id or "Not selected",
-            "fh_entity": self._fh_entity_id or "Not selected",
+            "ac_entity": ", ".join(self._ac_entity_ids) or "Not selected",
+            "fh_entity": ", ".join(self._fh_entity_ids) or "Not selected",
             "force_mode": "Enabled" if self._force_mode else "Disabled",
+            "temperature_aggregate": self._temperature_aggregate,
+            "hybrid_boost": "Enabled" if self._hybrid_boost else "Disabled",
+            "deadband_control": "Enabled" if self._deadband_control else "Disabled",
+            "temperature_sensors": ", ".join(self._temperature_sensors) or "Device sensors",
         }
         
         # AC Presets summary
         ac_preset_lines = []
-        for preset_name, preset_data in self._ac_presets.items():
-            fan_mode = preset_data.get("fan_mode", "")
-            icon = preset_data.get("icon", "")
+        for preset_data in self._ac_presets:
+            preset_name = preset_data[PRESET_NAME]
+            settings = ", ".join(
+                f"{preset_data[key]}°C" if key == PRESET_TEMPERATURE else str(preset_data[key])
+                for key in (PRESET_HVAC_MODE, PRESET_TEMPERATURE, PRESET_FAN_MODE, PRESET_SWING_MODE)
+                if preset_data.get(key) not in (None, "")
+            )
+            icon = preset_data.get(PRESET_ICON, "")
             if icon:
-                ac_preset_lines.append(f"  • {icon} {preset_name}: {fan_mode}")
+                ac_preset_lines.append(f"  • {icon} {preset_name}: {settings}")
             else:
-                ac_preset_lines.append(f"  • {preset_name}: {fan_mode}")
+                ac_preset_lines.append(f"  • {preset_name}: {settings}")
         summary["ac_presets"] = "\n".join(ac_preset_lines) if ac_preset_lines else "  • No presets configured"
         
         # FH Presets summary
         fh_preset_lines = []
-        for preset_name, preset_data in self._fh_presets.items():
-            temperature = preset_data.get("temperature", "")
-            icon = preset_data.get("icon", "")
+        for preset_data in self._fh_presets:
+            preset_name = preset_data[PRESET_NAME]
+            temperature = preset_data.get(PRESET_TEMPERATURE, "")
+            icon = preset_data.get(PRESET_ICON, "")
             if icon:
                 fh_preset_lines.append(f"  • {icon} {preset_name}: {temperature}°C")
             else:
                 fh_preset_lines.append(f"  • {preset_name}: {temperature}°C")
         summary["fh_presets"] = "\n".join(fh_preset_lines) if fh_preset_lines else "  • No presets configured"
         
-        return summary
\ No newline at end of file
+        return summary
+
+
+class RoomHVACOptionsFlow(config_entries.OptionsFlow):
+    """Edit the tuning of an existing room.
+    
+    Devices and presets are fixed once the entry is created; the tuning
+    block is not. Values are written back to the entry's tuning, keeping
+    only those that differ from the defaults, and the room is reloaded.
+    """
+    
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+    
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Show the room's current tuning and store the changes."""
+        tuning = {**DEFAULT_TUNING, **self._entry.data.get(CONF_TUNING, {})}
+        if user_input is not None:
+            tuning.update(user_input)
+            tuning[CONF_PRIORITY] = int(tuning[CONF_PRIORITY])
+            self.hass.config_entries.async_update_entry(
+                self._entry,
+                data={**self._entry.data, CONF_TUNING: _tuning_overrides(tuning)},
+            )
+            self.hass.config_entries.async_schedule_reload(self._entry.entry_id)
+            return self.async_create_entry(title="", data={})
+        
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self._get_tuning_schema(tuning),
+        )
+    
+    @staticmethod
+    def _get_tuning_schema(tuning: dict[str, Any]) -> vol.Schema:
+        """Generate the tuning form, filled with the room's current values."""
+        from homeassistant.helpers import selector
+        
+        return vol.Schema(
+            {
+                vol.Required(key, default=tuning[key]): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=minimum,
+                        max=maximum,
+                        step=step,
+                        mode=selector.NumberSelectorMode.BOX,
+                        **({"unit_of_measurement": unit} if unit else {}),
+                    )
+                )
+                for key, minimum, maximum, step, unit in TUNING_OPTIONS
+            }
+        )
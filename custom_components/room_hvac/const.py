@@ -6,6 +6,9 @@ from homeassistant.components.climate.const import HVACMode
 # Domain identifier
 DOMAIN = "room_hvac"
 
+# hass.data key for the domain-wide hub shared by all entries
+DATA_HUB = f"{DOMAIN}_hub"
+
 # Supported HVAC modes list
 SUPPORTED_HVAC_MODES = [
     HVACMode.OFF,
@@ -13,6 +16,8 @@ SUPPORTED_HVAC_MODES = [
     HVACMode.DRY,
     HVACMode.FAN_ONLY,
     HVACMode.HEAT,
+    # Runs FH (heat) or AC (cool) against a low/high setpoint range
+    HVACMode.HEAT_COOL,
 ]
 
 # Air conditioner modes (cool / dry / fan_only) - route to AC device
@@ -21,6 +26,21 @@ AC_HVAC_MODES = {HVACMode.COOL, HVACMode.DRY, HVACMode.FAN_ONLY}
 # Floor heating modes (heat) - route to floor heating device
 FH_HVAC_MODES = {HVACMode.HEAT}
 
+# Device roles within a room
+ROLE_AC = "ac"
+ROLE_FH = "fh"
+
+# How the current temperature of a device group is combined
+TEMPERATURE_AGGREGATE_MEAN = "mean"
+TEMPERATURE_AGGREGATE_MIN = "min"
+TEMPERATURE_AGGREGATE_MAX = "max"
+TEMPERATURE_AGGREGATES = [
+    TEMPERATURE_AGGREGATE_MEAN,
+    TEMPERATURE_AGGREGATE_MIN,
+    TEMPERATURE_AGGREGATE_MAX,
+]
+DEFAULT_TEMPERATURE_AGGREGATE = TEMPERATURE_AGGREGATE_MEAN
+
 # Preset slot internal identifiers
 PRESET_SLOT_1 = "slot_1"
 PRESET_SLOT_2 = "slot_2"
@@ -31,9 +51,55 @@ PRESET_SLOT_4 = "slot_4"
 PRESET_SLOTS = [PRESET_SLOT_1, PRESET_SLOT_2, PRESET_SLOT_3, PRESET_SLOT_4]
 
 # Configuration keys
+CONF_AC_ENTITY_IDS = "ac_entity_ids"
+CONF_FH_ENTITY_IDS = "fh_entity_ids"
+CONF_FORCE_MODE = "force_mode"
+CONF_TEMPERATURE_AGGREGATE = "temperature_aggregate"
+# Optional external temperature sensors that replace the device readings
+CONF_TEMPERATURE_SENSORS = "temperature_sensors"
+# Native comfort schedule (list of schedule records)
+CONF_SCHEDULE = "schedule"
+# Opt-in hybrid boost: AC heat alongside FH while the room is far below target
+CONF_HYBRID_BOOST = "hybrid_boost"
+# Opt-in deadband control: cycle the active group against the room temperature
+CONF_DEADBAND_CONTROL = "deadband_control"
+
+CONF_TUNING = "tuning"
+
+# Room-level tuning parameters (stored under CONF_TUNING)
+CONF_INTERNAL_UPDATE_WINDOW = "internal_update_window"
+CONF_TRANSITION_CONFIRM_TIMEOUT = "transition_confirm_timeout"
+CONF_MAX_STATE_AGE = "max_state_age"
+CONF_SENSOR_SMOOTHING = "sensor_smoothing"
+CONF_PUBLISH_MIN_DELTA = "publish_min_delta"
+CONF_PUBLISH_MIN_INTERVAL = "publish_min_interval"
+CONF_PRIORITY = "priority"
+CONF_BUDGET_MAX_WAIT = "budget_max_wait"
+CONF_AC_DEVICE_POWER = "ac_device_power"
+CONF_FH_DEVICE_POWER = "fh_device_power"
+CONF_BOOST_START_GAP = "boost_start_gap"
+CONF_BOOST_STOP_GAP = "boost_stop_gap"
+CONF_CONTROL_DEADBAND = "control_deadband"
+CONF_MIN_ON_TIME = "min_on_time"
+CONF_MIN_OFF_TIME = "min_off_time"
+CONF_AUTO_HYSTERESIS = "auto_hysteresis"
+CONF_AUTO_MIN_DWELL = "auto_min_dwell"
+
+# Preset record fields (v2 entries store presets as an ordered list of records)
+PRESET_ID = "id"
+PRESET_NAME = "name"
+PRESET_ICON = "icon"
+PRESET_FAN_MODE = "fan_mode"
+PRESET_TEMPERATURE = "temperature"
+PRESET_HVAC_MODE = "hvac_mode"
+PRESET_SWING_MODE = "swing_mode"
+
+# Config entry schema version
+CONFIG_ENTRY_VERSION = 2
+
+# Legacy single-device keys of version 1 entries (migrated on startup)
 CONF_AC_ENTITY_ID = "ac_entity_id"
 CONF_FH_ENTITY_ID = "fh_entity_id"
-CONF_FORCE_MODE = "force_mode"
 CONF_AC_PRESETS = "ac_presets"
 CONF_FH_PRESETS = "fh_presets"
 
@@ -51,4 +117,174 @@ FH_PRESET_DEFAULTS = {
     PRESET_SLOT_2: {"name": "在家", "icon": "mdi:home"},
     PRESET_SLOT_3: {"name": "活动", "icon": "mdi:dumbbell"},
     PRESET_SLOT_4: {"name": "睡眠", "icon": "mdi:bed"},
-}
\ No newline at end of file
+}
+
+# Schedule record fields
+SCHEDULE_DAYS = "days"
+SCHEDULE_TIME = "time"
+SCHEDULE_HVAC_MODE = "hvac_mode"
+SCHEDULE_PRESET_ID = "preset_id"
+SCHEDULE_TEMPERATURE = "temperature"
+# Keys of the early-start checks the wheel runs ahead of a record
+SCHEDULE_PRESTART = "prestart"
+SCHEDULE_DUE_IN = "due_in"
+
+# Domain services
+SERVICE_PROFILE = "profile"
+SERVICE_DUMP_TRACE = "dump_trace"
+SERVICE_SET_PRESET = "set_preset"
+SERVICE_RELOAD_ALL = "reload_all"
+SERVICE_SET_SCHEDULE = "set_schedule"
+SERVICE_SET_POWER_BUDGET = "set_power_budget"
+
+# Service call attributes
+ATTR_DURATION = "duration"
+ATTR_PRESET_ID = "preset_id"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_SCHEDULE = "schedule"
+
+# Profiling defaults (seconds)
+DEFAULT_PROFILE_DURATION = 30
+MAX_PROFILE_DURATION = 600
+
+# Concurrent entry reloads for reload_all
+DEFAULT_RELOAD_PARALLELISM = 8
+MAX_RELOAD_PARALLELISM = 64
+
+# Routing trace ring buffer size (records per room)
+TRACE_BUFFER_SIZE = 128
+
+# Tuning defaults
+# Seconds after our own command during which device updates count as echoes
+DEFAULT_INTERNAL_UPDATE_WINDOW = 2.0
+# Seconds to wait for a new device group to confirm a mode switch
+DEFAULT_TRANSITION_CONFIRM_TIMEOUT = 10.0
+# Seconds after which a downstream reading is refreshed before it is acted on
+DEFAULT_MAX_STATE_AGE = 300.0
+# External sensor EMA weight of the newest sample (1.0 disables smoothing)
+DEFAULT_SENSOR_SMOOTHING = 0.3
+# Smallest change (degrees) and shortest gap (seconds) between published readings
+DEFAULT_PUBLISH_MIN_DELTA = 0.1
+DEFAULT_PUBLISH_MIN_INTERVAL = 30.0
+# Power budget: queue priority (higher starts first), longest wait for
+# admission in seconds, and nominal draw per device in watts
+DEFAULT_PRIORITY = 0
+DEFAULT_BUDGET_MAX_WAIT = 300.0
+DEFAULT_AC_DEVICE_POWER = 1000.0
+DEFAULT_FH_DEVICE_POWER = 500.0
+# Hybrid boost starts when the room is this far below target (degrees) and
+# hands off to FH alone once within the smaller stop gap
+DEFAULT_BOOST_START_GAP = 2.0
+DEFAULT_BOOST_STOP_GAP = 0.5
+# Deadband control keeps the room within target +/- the deadband (degrees);
+# the group stays on and off for at least the minimum times (seconds)
+DEFAULT_CONTROL_DEADBAND = 0.5
+DEFAULT_MIN_ON_TIME = 300.0
+DEFAULT_MIN_OFF_TIME = 300.0
+# heat_cool switches sides only once the room is this far (degrees) past the
+# other side's setpoint, and after running a side for at least the dwell (seconds)
+DEFAULT_AUTO_HYSTERESIS = 0.5
+DEFAULT_AUTO_MIN_DWELL = 900.0
+
+DEFAULT_TUNING = {
+    CONF_TEMPERATURE_AGGREGATE: DEFAULT_TEMPERATURE_AGGREGATE,
+    CONF_INTERNAL_UPDATE_WINDOW: DEFAULT_INTERNAL_UPDATE_WINDOW,
+    CONF_TRANSITION_CONFIRM_TIMEOUT: DEFAULT_TRANSITION_CONFIRM_TIMEOUT,
+    CONF_MAX_STATE_AGE: DEFAULT_MAX_STATE_AGE,
+    CONF_SENSOR_SMOOTHING: DEFAULT_SENSOR_SMOOTHING,
+    CONF_PUBLISH_MIN_DELTA: DEFAULT_PUBLISH_MIN_DELTA,
+    CONF_PUBLISH_MIN_INTERVAL: DEFAULT_PUBLISH_MIN_INTERVAL,
+    CONF_PRIORITY: DEFAULT_PRIORITY,
+    CONF_BUDGET_MAX_WAIT: DEFAULT_BUDGET_MAX_WAIT,
+    CONF_AC_DEVICE_POWER: DEFAULT_AC_DEVICE_POWER,
+    CONF_FH_DEVICE_POWER: DEFAULT_FH_DEVICE_POWER,
+    CONF_BOOST_START_GAP: DEFAULT_BOOST_START_GAP,
+    CONF_BOOST_STOP_GAP: DEFAULT_BOOST_STOP_GAP,
+    CONF_CONTROL_DEADBAND: DEFAULT_CONTROL_DEADBAND,
+    CONF_MIN_ON_TIME: DEFAULT_MIN_ON_TIME,
+    CONF_MIN_OFF_TIME: DEFAULT_MIN_OFF_TIME,
+    CONF_AUTO_HYSTERESIS: DEFAULT_AUTO_HYSTERESIS,
+    CONF_AUTO_MIN_DWELL: DEFAULT_AUTO_MIN_DWELL,
+}
+
+# On-demand downstream refresh (seconds)
+# Requests from all rooms within this window go out as one update_entity call
+REFRESH_COALESCE_DELAY = 0.2
+# A device is refreshed at most once per interval, whichever room asks
+REFRESH_MIN_INTERVAL = 60.0
+# Longest a routing decision waits for a refresh before using what it has
+REFRESH_WAIT_TIMEOUT = 5.0
+
+# Schedule dispatch: rooms started per second when a boundary fires, plus
+# up to this many seconds of random extra spacing between them
+SCHEDULE_DISPATCH_RATE = 10.0
+SCHEDULE_DISPATCH_JITTER = 0.5
+
+# Runtime counters, saved for all rooms in one store at most once per delay
+RUNTIME_STORAGE_VERSION = 1
+RUNTIME_SAVE_DELAY = 60
+
+# Thermal model: pairs per mode in the regression window, shortest gap
+# (seconds) between paired readings, and how close to target (degrees) a
+# room must stay below/above for its readings to count as heating/cooling
+THERMAL_WINDOW = 32
+THERMAL_MIN_SAMPLE_INTERVAL = 300.0
+THERMAL_DEADBAND = 0.3
+
+# Predictive pre-start: how far ahead of a scheduled target (minutes) the
+# room may start, checked every PRESTART_STEP minutes in that window
+PRESTART_MAX_LEAD = 180
+PRESTART_STEP = 15
+
+# Building-wide power budget (stored limits; unset means unlimited)
+BUDGET_STORAGE_VERSION = 1
+BUDGET_MAX_AC = "max_ac"
+BUDGET_MAX_FH = "max_fh"
+BUDGET_MAX_POWER = "max_power"
+
+# Devices shared by several rooms: how room demands are merged, and how
+# many recent command contexts per device are recognised as our own
+SERVICE_SET_SHARED_POLICY = "set_shared_policy"
+ATTR_POLICY = "policy"
+SHARED_POLICY_COMFORT = "comfort"
+SHARED_POLICY_ECO = "eco"
+SHARED_POLICY_PRIORITY = "priority"
+SHARED_POLICIES = [SHARED_POLICY_COMFORT, SHARED_POLICY_ECO, SHARED_POLICY_PRIORITY]
+DEFAULT_SHARED_POLICY = SHARED_POLICY_COMFORT
+SHARED_STORAGE_VERSION = 1
+SHARED_CONTEXT_MEMORY = 32
+
+# Commands kept for unavailable devices, in one store saved at most once
+# per delay (seconds)
+OUTBOX_STORAGE_VERSION = 1
+OUTBOX_SAVE_DELAY = 1
+
+# Downstream call timeouts: the p99 latency of the device's platform times
+# the factor, within the floor and ceiling (seconds); the ceiling applies
+# until the platform has answered this many calls
+CALL_TIMEOUT_QUANTILE = 0.99
+CALL_TIMEOUT_FACTOR = 3.0
+CALL_TIMEOUT_MIN = 2.0
+CALL_TIMEOUT_MAX = 30.0
+CALL_TIMEOUT_MIN_SAMPLES = 20
+
+# Websocket feed of compact room rows: changes are batched for this long
+# (seconds) before one delta message goes out to every subscriber
+WS_TYPE_SUBSCRIBE = f"{DOMAIN}/subscribe"
+FEED_BATCH_WINDOW = 0.5
+
+# Command-source leases: a source claims a room with a priority for a
+# number of seconds; while it holds the room, commands without the lease
+# are refused and lower-priority claims wait
+SERVICE_CLAIM = "claim"
+SERVICE_RELEASE = "release"
+ATTR_SOURCE = "source"
+ATTR_LEASE_PRIORITY = "priority"
+ATTR_TTL = "ttl"
+DEFAULT_LEASE_PRIORITY = 50
+MAX_LEASE_PRIORITY = 100
+DEFAULT_LEASE_TTL = 3600
+MAX_LEASE_TTL = 86400
+
+# Deadband control: seconds between the shared evaluation ticks of all rooms
+CONTROL_TICK_INTERVAL = 30
@@ -0,0 +1,176 @@
+"""Deadband control loop shared by all room_hvac rooms."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import CONTROL_TICK_INTERVAL
+
+# Called with True to switch a room's group on, False to let it idle
+ControlHandler = Callable[[bool], None]
+
+_NAN = float("nan")
+
+
+class DeadbandController:
+    """On/off decisions for every room under deadband control, in one tick.
+
+    Each room owns a row in a set of parallel arrays (direction, readings,
+    deadband, minimum times, running flag). Rooms only write their row when
+    their readings change; a single interval timer walks the rows, and only
+    rooms whose decision flips are handed to their handler. Rows of removed
+    rooms are reused, and the timer runs only while rooms are registered.
+    """
+
+    def __init__(self, hass: HomeAssistant, interval: float = CONTROL_TICK_INTERVAL) -> None:
+        """Initialize the controller."""
+        self.hass = hass
+        self._interval = timedelta(seconds=interval)
+
+        self._rows: dict[str, int] = {}
+        self._handlers: list[ControlHandler | None] = []
+        self._free: list[int] = []
+
+        # +1 heating, -1 cooling, 0 not regulating
+        self._direction = array("b")
+        # 1 while the group runs, and 1 while a switch is in flight
+        self._running = array("b")
+        self._pending = array("b")
+        # Readings (nan when unknown), band and minimum times
+        self._current = array("d")
+        self._target = array("d")
+        self._deadband = array("d")
+        self._min_on = array("d")
+        self._min_off = array("d")
+        # Loop time of the last switch
+        self._switched = array("d")
+
+        self._unsubscribe: CALLBACK_TYPE | None = None
+
+        # Loop statistics
+        self.ticks = 0
+        self.dispatched = 0
+
+    @callback
+    def async_register(
+        self,
+        key: str,
+        handler: ControlHandler,
+        deadband: float,
+        min_on: float,
+        min_off: float,
+    ) -> None:
+        """Give a room a row; it starts out running and not regulating."""
+        self.async_unregister(key)
+        if self._free:
+            row = self._free.pop()
+            self._handlers[row] = handler
+        else:
+            row = len(self._handlers)
+            self._handlers.append(handler)
+            for column in (self._direction, self._running, self._pending):
+                column.append(0)
+            for column in (
+                self._current, self._target, self._deadband,
+                self._min_on, self._min_off, self._switched,
+            ):
+                column.append(0.0)
+
+        self._rows[key] = row
+        self._direction[row] = 0
+        self._running[row] = 1
+        self._pending[row] = 0
+        self._current[row] = _NAN
+        self._target[row] = _NAN
+        self._deadband[row] = deadband
+        self._min_on[row] = min_on
+        self._min_off[row] = min_off
+        self._switched[row] = self.hass.loop.time()
+
+        if self._unsubscribe is None:
+            self._unsubscribe = async_track_time_interval(self.hass, self._tick, self._interval)
+
+    @callback
+    def async_unregister(self, key: str) -> None:
+        """Release a room's row."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        self._handlers[row] = None
+        self._direction[row] = 0
+        self._free.append(row)
+        if not self._rows and self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    @callback
+    def async_update(
+        self, key: str, direction: int, current: float | None, target: float | None
+    ) -> None:
+        """Store a room's regulation direction and latest readings."""
+        row = self._rows.get(key)
+        if row is None:
+            return
+        self._direction[row] = direction
+        self._current[row] = _NAN if current is None else current
+        self._target[row] = _NAN if target is None else target
+
+    @callback
+    def async_set_running(self, key: str, running: bool) -> None:
+        """Record that a room's group was switched (or a switch settled)."""
+        row = self._rows.get(key)
+        if row is None:
+            return
+        if self._running[row] != running:
+            self._switched[row] = self.hass.loop.time()
+        self._running[row] = running
+        self._pending[row] = 0
+
+    @callback
+    def _tick(self, _now: datetime) -> None:
+        """Evaluate every regulating room and dispatch the ones that flip."""
+        self.ticks += 1
+        now = self.hass.loop.time()
+        direction, running, pending = self._direction, self._running, self._pending
+        current, target, deadband = self._current, self._target, self._deadband
+
+        for row in range(len(direction)):
+            sign = direction[row]
+            if not sign or pending[row]:
+                continue
+            # Positive when the room needs the group, in either direction
+            error = (target[row] - current[row]) * sign
+            if math.isnan(error):
+                continue
+            elapsed = now - self._switched[row]
+            if running[row]:
+                flip = error < -deadband[row] and elapsed >= self._min_on[row]
+            else:
+                flip = error > deadband[row] and elapsed >= self._min_off[row]
+            if flip:
+                pending[row] = 1
+                self.dispatched += 1
+                self._handlers[row](not running[row])
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the tick."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return loop statistics."""
+        return {
+            "rooms": len(self._rows),
+            "regulating": sum(1 for row in self._rows.values() if self._direction[row]),
+            "idle": sum(1 for row in self._rows.values() if not self._running[row]),
+            "ticks": self.ticks,
+            "dispatched": self.dispatched,
+        }
@@ -0,0 +1,44 @@
+"""Diagnostics support for room_hvac integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_HUB
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry, including the routing trace."""
+    entity = hass.data[DATA_HUB].entities.get(entry.entry_id)
+
+    diagnostics: dict[str, Any] = {
+        "entry": {
+            "version": entry.version,
+            "data": dict(entry.data),
+        },
+    }
+
+    if entity is None:
+        diagnostics["entity"] = None
+        return diagnostics
+
+    diagnostics["entity"] = {
+        "entity_id": entity.entity_id,
+        "hvac_mode": entity.hvac_mode,
+        "target_temperature": entity.target_temperature,
+        "preset_mode": entity.preset_mode,
+        "attributes": entity.extra_state_attributes,
+    }
+    diagnostics["trace"] = entity.trace.as_list()
+    diagnostics["tasks"] = entity.tasks.stats() if entity.tasks is not None else None
+    diagnostics["runtime"] = hass.data[DATA_HUB].runtime.as_dict(entry.entry_id)
+    diagnostics["latency"] = hass.data[DATA_HUB].latency.stats()
+    diagnostics["outbox"] = hass.data[DATA_HUB].outbox.stats()
+    diagnostics["feed"] = hass.data[DATA_HUB].feed.stats()
+    timer = hass.data[DATA_HUB].setup_timings.get(entry.entry_id)
+    diagnostics["setup_timings_ms"] = timer.as_dict() if timer is not None else None
+    return diagnostics
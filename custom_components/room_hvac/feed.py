@@ -0,0 +1,189 @@
+"""Compact room rows for websocket subscribers, streamed as batched deltas."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.climate import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_PRESET_MODE,
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_TARGET_TEMP_LOW,
+)
+from homeassistant.const import ATTR_TEMPERATURE, EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_HUB, FEED_BATCH_WINDOW
+
+if TYPE_CHECKING:
+    from .hub import RoomHVACHub
+
+Row = dict[str, Any]
+
+
+def compact_row(state: State) -> Row:
+    """Return the fields of a room state that dashboards show."""
+    attributes = state.attributes
+    return {
+        "mode": state.state,
+        "target": attributes.get(ATTR_TEMPERATURE),
+        "low": attributes.get(ATTR_TARGET_TEMP_LOW),
+        "high": attributes.get(ATTR_TARGET_TEMP_HIGH),
+        "current": attributes.get(ATTR_CURRENT_TEMPERATURE),
+        "preset": attributes.get(ATTR_PRESET_MODE),
+        "device": attributes.get("active_device"),
+        "health": attributes.get("health"),
+    }
+
+
+class RoomFeed:
+    """Room rows as last sent to websocket subscribers, and what changed since.
+
+    Listens to state changes only while someone is subscribed. A changed
+    room is marked dirty; after a short window every dirty room is diffed
+    against its last sent row and only the fields that differ go out, in
+    one message per window shared by all subscribers. A room that went
+    away is sent as None.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the feed."""
+        self.hass = hass
+        self._rows: dict[str, Row] = {}
+        self._dirty: set[str] = set()
+        self._subscribers: dict[int, Callable[[dict[str, Any]], None]] = {}
+        self._next_key = 0
+        self._unsub_states: CALLBACK_TYPE | None = None
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+        # Lifetime counters
+        self.deltas_sent = 0
+        self.changes_batched = 0
+
+    @property
+    def _hub(self) -> RoomHVACHub:
+        """Return the domain hub, which knows the live rooms."""
+        return self.hass.data[DATA_HUB]
+
+    def snapshot(self) -> dict[str, Row]:
+        """Return the current row of every room, as the deltas build on it."""
+        return {entity_id: dict(row) for entity_id, row in self._rows.items()}
+
+    @callback
+    def async_subscribe(self, send: Callable[[dict[str, Any]], None]) -> CALLBACK_TYPE:
+        """Add a subscriber; the caller sends it the snapshot next.
+
+        Pending changes are flushed to the existing subscribers first, so
+        the snapshot and the baseline of the following deltas are the same.
+        """
+        if self._subscribers:
+            self._async_flush()
+        else:
+            self._rows = self._current_rows()
+            self._unsub_states = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed, event_filter=self._is_room
+            )
+
+        key = self._next_key
+        self._next_key += 1
+        self._subscribers[key] = send
+
+        @callback
+        def _unsubscribe() -> None:
+            self._subscribers.pop(key, None)
+            if not self._subscribers:
+                self._async_stop()
+
+        return _unsubscribe
+
+    def _current_rows(self) -> dict[str, Row]:
+        """Return the rows of all live rooms from their states."""
+        rows = {}
+        for entity in self._hub.entities.values():
+            state = self.hass.states.get(entity.entity_id) if entity.entity_id else None
+            if state is not None:
+                rows[entity.entity_id] = compact_row(state)
+        return rows
+
+    @callback
+    def _is_room(self, event: Event) -> bool:
+        """Return True for state changes of room entities."""
+        if event.data["entity_id"] in self._rows:
+            return True
+        state = event.data["new_state"]
+        return state is not None and state.attributes.get("entry_id") in self._hub.entities
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Mark a room dirty and start the batch window if none is open."""
+        self._dirty.add(event.data["entity_id"])
+        self.changes_batched += 1
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, FEED_BATCH_WINDOW, self._async_window_closed)
+
+    @callback
+    def _async_window_closed(self, _now: Any) -> None:
+        """Send the changes collected during the window."""
+        self._unsub_flush = None
+        self._async_flush()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Diff the dirty rooms against their last rows and send the changes."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        delta: dict[str, Row | None] = {}
+        for entity_id in self._dirty:
+            state = self.hass.states.get(entity_id)
+            old = self._rows.get(entity_id)
+            if state is None:
+                if old is not None:
+                    del self._rows[entity_id]
+                    delta[entity_id] = None
+                continue
+            row = compact_row(state)
+            self._rows[entity_id] = row
+            if old is None:
+                delta[entity_id] = row
+                continue
+            changed = {field: value for field, value in row.items() if old.get(field) != value}
+            if changed:
+                delta[entity_id] = changed
+        self._dirty.clear()
+
+        if not delta:
+            return
+        self.deltas_sent += 1
+        message = {"delta": delta}
+        for send in list(self._subscribers.values()):
+            send(message)
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop listening once the last subscriber is gone."""
+        if self._unsub_states is not None:
+            self._unsub_states()
+            self._unsub_states = None
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._rows.clear()
+        self._dirty.clear()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop all subscribers and listeners."""
+        self._subscribers.clear()
+        self._async_stop()
+
+    def stats(self) -> dict[str, Any]:
+        """Return subscriber count and lifetime counters."""
+        return {
+            "subscribers": len(self._subscribers),
+            "rooms": len(self._rows),
+            "deltas_sent": self.deltas_sent,
+            "changes_batched": self.changes_batched,
+        }
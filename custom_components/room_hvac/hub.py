@@ -0,0 +1,137 @@
+"""Domain-wide state shared by all room_hvac entries."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .accounting import RuntimeLedger
+from .arbiter import SharedDeviceArbiter
+from .budget import PowerBudget
+from .feed import RoomFeed
+from .latency import LatencyTracker
+from .outbox import CommandOutbox
+from .const import DOMAIN
+from .refresh import RefreshCoordinator
+from .scheduler import ScheduleWheel
+from .timing import SetupTimer
+
+if TYPE_CHECKING:
+    from .climate import RoomHVACClimateEntity
+    from .control import DeadbandController
+    from .profiler import IntegrationProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RoomHVACHub:
+    """Container for resources that outlive a single config entry.
+
+    Created once in async_setup and stored in hass.data[DATA_HUB]. Entries
+    come and go; the hub (and everything hanging off it) stays.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+
+        # Live room entities keyed by config entry id
+        self.entities: dict[str, RoomHVACClimateEntity] = {}
+
+        # Active profiling session, if any
+        self.profiler: IntegrationProfiler | None = None
+
+        # On-demand refresh of stale downstream states, shared by all rooms
+        self.refresher = RefreshCoordinator(hass)
+
+        # One timer wheel for the comfort schedules of all rooms
+        self.scheduler = ScheduleWheel(hass)
+
+        # Runtime counters of all rooms, persisted in one debounced store
+        self.runtime = RuntimeLedger(hass)
+
+        # Admission control for device starts across all rooms
+        self.budget = PowerBudget(hass)
+
+        # Merged commands for downstream devices driven by several rooms
+        self.arbiter = SharedDeviceArbiter(hass)
+
+        # Latest commands for devices that were unavailable, replayed on return
+        self.outbox = CommandOutbox(hass)
+
+        # Call latency per downstream platform, and the timeouts it allows
+        self.latency = LatencyTracker(hass)
+
+        # Compact room rows for websocket subscribers
+        self.feed = RoomFeed(hass)
+
+        # One periodic tick for the deadband control of all rooms; created
+        # (and its module imported) by the first room that uses it
+        self._controller: DeadbandController | None = None
+
+        # Phase timings of the latest setup of each entry
+        self.setup_timings: dict[str, SetupTimer] = {}
+
+    @property
+    def controller(self) -> DeadbandController:
+        """Return the deadband control loop, creating it on first use."""
+        if self._controller is None:
+            from .control import DeadbandController
+
+            self._controller = DeadbandController(self.hass)
+        return self._controller
+
+    @callback
+    def async_shutdown(self, event: Event | None = None) -> None:
+        """Release domain-wide resources when Home Assistant stops."""
+        self.refresher.async_shutdown()
+        self.scheduler.async_shutdown()
+        self.feed.async_shutdown()
+        if self._controller is not None:
+            self._controller.async_shutdown()
+
+    async def async_reload_entries(self, max_parallel: int) -> dict[str, Any]:
+        """Reload every loaded room entry, at most max_parallel at a time.
+
+        Each reload is the regular unload + setup of one entry; the hub and
+        the services stay in place, so only per-room state is rebuilt.
+        """
+        entries = [
+            entry
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if not entry.disabled_by
+        ]
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def _reload(entry_id: str) -> tuple[str, bool, float]:
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    ok = await self.hass.config_entries.async_reload(entry_id)
+                except HomeAssistantError as err:
+                    _LOGGER.error("Failed to reload entry %s: %s", entry_id, err)
+                    ok = False
+                return entry_id, ok, time.monotonic() - started
+
+        started = time.monotonic()
+        results = await asyncio.gather(*(_reload(entry.entry_id) for entry in entries))
+        elapsed = time.monotonic() - started
+
+        failed = [entry_id for entry_id, ok, _ in results if not ok]
+        slowest = max((duration for _, _, duration in results), default=0.0)
+        _LOGGER.info(
+            "Reloaded %d room entries in %.2f s (parallelism %d, slowest %.2f s, %d failed)",
+            len(results), elapsed, max_parallel, slowest, len(failed),
+        )
+
+        return {
+            "entries": len(results),
+            "failed": failed,
+            "duration_ms": round(elapsed * 1000, 1),
+            "slowest_ms": round(slowest * 1000, 1),
+            "max_parallel": max_parallel,
+        }
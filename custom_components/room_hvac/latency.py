@@ -0,0 +1,178 @@
+"""Downstream call latency per platform, and the timeouts derived from it."""
+from __future__ import annotations
+
+from bisect import insort
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    CALL_TIMEOUT_QUANTILE,
+    CALL_TIMEOUT_FACTOR,
+    CALL_TIMEOUT_MIN,
+    CALL_TIMEOUT_MAX,
+    CALL_TIMEOUT_MIN_SAMPLES,
+)
+
+# Devices without a registry entry are grouped together
+_UNKNOWN_PLATFORM = "unknown"
+
+
+class P2Quantile:
+    """Streaming estimate of one quantile in constant memory (P-square).
+
+    Five markers track the minimum, the maximum, the quantile itself and
+    two points half-way to it; each new sample moves the markers with a
+    piecewise-parabolic fit instead of storing the samples (Jain and
+    Chlamtac, 1985). The first five samples are kept as they are.
+    """
+
+    __slots__ = ("quantile", "count", "_heights", "_positions", "_desired", "_steps")
+
+    def __init__(self, quantile: float) -> None:
+        """Initialize the estimator."""
+        self.quantile = quantile
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self._desired = [0.0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4.0]
+        self._steps = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        """Fold one sample into the estimate."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            insort(heights, value)
+            return
+
+        # Cell the sample falls into; the extreme markers follow new extremes
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if value < heights[i + 1])
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._steps[i]
+
+        # Move the middle markers towards their desired positions
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        """Return marker i's height moved one step along the fitted parabola."""
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        """Return marker i's height moved one step towards its neighbour."""
+        q, n = self._heights, self._positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    def value(self) -> float | None:
+        """Return the current estimate, or None before the first sample."""
+        if not self.count:
+            return None
+        if self.count <= 5:
+            return self._heights[round(self.quantile * (self.count - 1))]
+        return self._heights[2]
+
+
+class _PlatformLatency:
+    """Latency estimates of the calls to one downstream platform."""
+
+    __slots__ = ("median", "tail", "timeouts")
+
+    def __init__(self) -> None:
+        """Initialize the estimates."""
+        self.median = P2Quantile(0.5)
+        self.tail = P2Quantile(CALL_TIMEOUT_QUANTILE)
+        self.timeouts = 0
+
+
+class LatencyTracker:
+    """Observed call latency per downstream platform (integration).
+
+    Each call to a device is timed and folded into its platform's streaming
+    estimates. The timeout for the next call is the tail quantile times a
+    factor, clamped to a floor and a ceiling; until a platform has been
+    seen often enough the ceiling applies. Memory is constant per platform.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._platforms: dict[str, str] = {}
+        self._latency: dict[str, _PlatformLatency] = {}
+
+    def platform(self, entity_id: str) -> str:
+        """Return the integration that provides a device, looked up once."""
+        platform = self._platforms.get(entity_id)
+        if platform is None:
+            entry = er.async_get(self.hass).async_get(entity_id)
+            platform = self._platforms[entity_id] = entry.platform if entry else _UNKNOWN_PLATFORM
+        return platform
+
+    def _for(self, entity_id: str) -> _PlatformLatency:
+        """Return the estimates of a device's platform."""
+        platform = self.platform(entity_id)
+        latency = self._latency.get(platform)
+        if latency is None:
+            latency = self._latency[platform] = _PlatformLatency()
+        return latency
+
+    def timeout(self, entity_id: str) -> float:
+        """Return how long the next call to a device may block its caller."""
+        return self._timeout(self._for(entity_id))
+
+    @staticmethod
+    def _timeout(latency: _PlatformLatency) -> float:
+        """Return the timeout a platform's estimates allow."""
+        tail = latency.tail
+        if tail.count < CALL_TIMEOUT_MIN_SAMPLES:
+            return CALL_TIMEOUT_MAX
+        return min(max(tail.value() * CALL_TIMEOUT_FACTOR, CALL_TIMEOUT_MIN), CALL_TIMEOUT_MAX)
+
+    def observe(self, entity_id: str, seconds: float) -> None:
+        """Record how long a call to a device took, late ones included."""
+        latency = self._for(entity_id)
+        latency.median.add(seconds)
+        latency.tail.add(seconds)
+
+    def timed_out(self, entity_id: str) -> None:
+        """Count a call that outlived its timeout."""
+        self._for(entity_id).timeouts += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the estimates and current timeout of every platform."""
+        stats = {}
+        for platform, latency in self._latency.items():
+            median, tail = latency.median.value(), latency.tail.value()
+            stats[platform] = {
+                "calls": latency.tail.count,
+                "p50_ms": round(median * 1000, 1) if median is not None else None,
+                "p99_ms": round(tail * 1000, 1) if tail is not None else None,
+                "timeouts": latency.timeouts,
+                "timeout_s": round(self._timeout(latency), 2),
+            }
+        return stats
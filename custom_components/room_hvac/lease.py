@@ -0,0 +1,115 @@
+"""Command-source leases that keep automations from fighting over a room."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import SCHEDULE_HVAC_MODE
+
+
+class Lease:
+    """One source's claim on a room, and the command it last asked for."""
+
+    __slots__ = ("source", "priority", "since", "expires", "command")
+
+    def __init__(self, source: str, priority: int, since: datetime) -> None:
+        """Initialize the claim."""
+        self.source = source
+        self.priority = priority
+        self.since = since
+        self.expires = since
+        self.command: dict[str, Any] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the claim for state attributes."""
+        return {
+            "source": self.source,
+            "priority": self.priority,
+            "expires": self.expires.isoformat(),
+        }
+
+
+class RoomLeases:
+    """Claims on one room by command sources; the highest priority holds it.
+
+    A claim names its source, a priority and a lifetime. The holder is the
+    live claim with the highest priority; on a tie the older claim keeps
+    the room, so sources of equal rank cannot take it from each other.
+    Claims that do not hold the room wait with their latest command until
+    they expire, and when the holder goes, the next one takes over and its
+    command is applied. Leases are not stored and end with a restart.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the leases."""
+        self._leases: dict[str, Lease] = {}
+        # Source whose command the room currently follows
+        self._current: str | None = None
+
+        # Commands not sent because another source held the room
+        self.rejected = 0
+
+    def _prune(self, now: datetime) -> None:
+        """Drop the claims that have run out."""
+        for source in [s for s, lease in self._leases.items() if lease.expires <= now]:
+            del self._leases[source]
+
+    def holder(self, now: datetime) -> Lease | None:
+        """Return the claim that holds the room, if any."""
+        self._prune(now)
+        if not self._leases:
+            return None
+        return max(self._leases.values(), key=lambda lease: (lease.priority, -lease.since.timestamp()))
+
+    def claim(
+        self, source: str, priority: int, ttl: float, command: dict[str, Any], now: datetime
+    ) -> bool:
+        """Record or renew a claim; return True if it holds the room now.
+
+        A claim's command fields are merged into the ones it gave before,
+        so a claim that waits keeps the whole state its source asked for; a
+        new mode drops the preset and target given for the old one. A claim
+        without a command only renews.
+        """
+        self._prune(now)
+        lease = self._leases.get(source)
+        if lease is None:
+            lease = self._leases[source] = Lease(source, priority, now)
+        lease.priority = priority
+        lease.expires = now + timedelta(seconds=ttl)
+        if SCHEDULE_HVAC_MODE in command:
+            lease.command.clear()
+        lease.command.update(command)
+
+        if self.holder(now) is not lease:
+            self.rejected += 1
+            return False
+        self._current = source
+        return True
+
+    def release(self, source: str, now: datetime) -> Lease | None:
+        """Drop a source's claim; return the claim that takes over, if one does."""
+        self._leases.pop(source, None)
+        return self.handover(now)
+
+    def handover(self, now: datetime) -> Lease | None:
+        """Return the claim that newly holds the room once the holder left."""
+        holder = self.holder(now)
+        source = holder.source if holder is not None else None
+        if source == self._current:
+            return None
+        self._current = source
+        return holder
+
+    def next_expiry(self) -> datetime | None:
+        """Return when the first claim runs out."""
+        return min((lease.expires for lease in self._leases.values()), default=None)
+
+    def waiting(self, now: datetime) -> list[str]:
+        """Return the sources whose claims wait for the room, highest first."""
+        holder = self.holder(now)
+        return [
+            lease.source
+            for lease in sorted(self._leases.values(), key=lambda lease: -lease.priority)
+            if lease is not holder
+        ]
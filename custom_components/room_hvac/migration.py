@@ -0,0 +1,106 @@
+"""Config entry schema migrations for room_hvac integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .const import (
+    CONF_AC_ENTITY_IDS,
+    CONF_FH_ENTITY_IDS,
+    CONF_AC_ENTITY_ID,
+    CONF_FH_ENTITY_ID,
+    CONF_FORCE_MODE,
+    CONF_AC_PRESETS,
+    CONF_FH_PRESETS,
+    CONF_TUNING,
+    CONF_TEMPERATURE_AGGREGATE,
+    DEFAULT_TUNING,
+    PRESET_SLOTS,
+    PRESET_ID,
+    PRESET_NAME,
+    PRESET_ICON,
+    PRESET_FAN_MODE,
+    PRESET_TEMPERATURE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _preset_id(index: int) -> str:
+    """Return the stable id for the preset at a given position.
+
+    Version 1 did not record which form slot a preset came from, and empty
+    slots were skipped, so the id follows the preset's position among the
+    stored presets: the first one gets slot_1 even if it was entered in a
+    later slot.
+    """
+    if index < len(PRESET_SLOTS):
+        return PRESET_SLOTS[index]
+    return f"slot_{index + 1}"
+
+
+def _as_list(value: Any) -> list[str]:
+    """Return a device group as a list of entity ids."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def migrate_v1_to_v2(data: dict[str, Any]) -> dict[str, Any]:
+    """Convert version 1 entry data to the version 2 schema.
+
+    Version 1 stored single devices (or, later, device lists) at the top level
+    and presets as dicts keyed by display name, with FH temperatures as
+    strings. Version 2 stores ordered preset records with stable ids and
+    numeric temperatures, plus a tuning block. Preset ids are positional,
+    see _preset_id.
+    """
+    ac_presets = []
+    for index, (name, preset) in enumerate(data.get(CONF_AC_PRESETS, {}).items()):
+        fan_mode = preset.get(PRESET_FAN_MODE)
+        if not fan_mode:
+            continue
+        ac_presets.append(
+            {
+                PRESET_ID: _preset_id(index),
+                PRESET_NAME: name,
+                PRESET_ICON: preset.get(PRESET_ICON) or "",
+                PRESET_FAN_MODE: fan_mode,
+            }
+        )
+
+    fh_presets = []
+    for index, (name, preset) in enumerate(data.get(CONF_FH_PRESETS, {}).items()):
+        try:
+            temperature = float(preset.get(PRESET_TEMPERATURE))
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "Dropping FH preset %s with invalid temperature %s",
+                name, preset.get(PRESET_TEMPERATURE),
+            )
+            continue
+        fh_presets.append(
+            {
+                PRESET_ID: _preset_id(index),
+                PRESET_NAME: name,
+                PRESET_ICON: preset.get(PRESET_ICON) or "",
+                PRESET_TEMPERATURE: temperature,
+            }
+        )
+
+    # Only values that differ from the defaults are stored
+    tuning = {}
+    aggregate = data.get(CONF_TEMPERATURE_AGGREGATE)
+    if aggregate and aggregate != DEFAULT_TUNING[CONF_TEMPERATURE_AGGREGATE]:
+        tuning[CONF_TEMPERATURE_AGGREGATE] = aggregate
+
+    return {
+        CONF_AC_ENTITY_IDS: _as_list(data.get(CONF_AC_ENTITY_IDS) or data.get(CONF_AC_ENTITY_ID)),
+        CONF_FH_ENTITY_IDS: _as_list(data.get(CONF_FH_ENTITY_IDS) or data.get(CONF_FH_ENTITY_ID)),
+        CONF_FORCE_MODE: bool(data.get(CONF_FORCE_MODE, False)),
+        CONF_AC_PRESETS: ac_presets,
+        CONF_FH_PRESETS: fh_presets,
+        CONF_TUNING: tuning,
+    }
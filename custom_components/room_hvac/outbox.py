@@ -0,0 +1,130 @@
+"""Persistent outbox for commands to unavailable downstream devices."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, OUTBOX_STORAGE_VERSION, OUTBOX_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+# The state attribute each collapsible command sets (the mode is the state itself)
+_COMMAND_ATTRIBUTES = {
+    "set_temperature": ATTR_TEMPERATURE,
+    "set_fan_mode": "fan_mode",
+    "set_swing_mode": "swing_mode",
+}
+
+
+def replay_batch(
+    commands: dict[str, dict[str, Any]], state: State
+) -> list[tuple[str, dict[str, Any]]]:
+    """Return the commands a device still needs, mode first.
+
+    Commands whose value the device already reports are dropped, and a
+    device that is to be off only gets the mode.
+    """
+    batch = []
+    mode = commands.get("set_hvac_mode")
+    if mode is not None:
+        if mode["hvac_mode"] != state.state:
+            batch.append(("set_hvac_mode", mode))
+        if mode["hvac_mode"] == HVACMode.OFF:
+            return batch
+
+    for service, data in commands.items():
+        if service == "set_hvac_mode":
+            continue
+        attribute = _COMMAND_ATTRIBUTES.get(service)
+        if attribute is not None and state.attributes.get(attribute) == data.get(attribute):
+            continue
+        batch.append((service, data))
+    return batch
+
+
+class CommandOutbox:
+    """Latest desired state of every downstream device that missed commands.
+
+    A command for an unavailable device is kept here instead of failing,
+    keyed by device and service, so a newer command for the same attribute
+    replaces the older one and a device that is away for a while collects
+    one command per attribute, not one per attempt. A successful command
+    for the same attribute drops the queued one. Entries are stored in one
+    debounced Store, so they survive a restart, and are taken by a room as
+    a single batch once the device is back.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the outbox."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, dict[str, Any]]]] = Store(
+            hass, OUTBOX_STORAGE_VERSION, f"{DOMAIN}.outbox"
+        )
+        self._pending: dict[str, dict[str, dict[str, Any]]] = {}
+
+        # Lifetime counters
+        self.queued = 0
+        self.collapsed = 0
+        self.replayed = 0
+
+    async def async_load(self) -> None:
+        """Load the commands still pending from before the restart."""
+        self._pending = await self._store.async_load() or {}
+        if self._pending:
+            _LOGGER.debug("Outbox holds commands for %s", sorted(self._pending))
+
+    @callback
+    def async_queue(self, entity_id: str, service: str, service_data: dict[str, Any]) -> None:
+        """Keep a command for an unavailable device, replacing an older one."""
+        commands = self._pending.setdefault(entity_id, {})
+        if service in commands:
+            self.collapsed += 1
+        commands[service] = dict(service_data)
+        self.queued += 1
+        self._schedule_save()
+
+    @callback
+    def async_discard(self, entity_id: str, service: str) -> None:
+        """Drop a queued command that a newer, delivered one superseded."""
+        commands = self._pending.get(entity_id)
+        if commands is None or commands.pop(service, None) is None:
+            return
+        if not commands:
+            del self._pending[entity_id]
+        self._schedule_save()
+
+    @callback
+    def async_take(self, entity_id: str) -> dict[str, dict[str, Any]]:
+        """Remove and return everything queued for a device."""
+        commands = self._pending.pop(entity_id, {})
+        if commands:
+            self.replayed += 1
+            self._schedule_save()
+        return commands
+
+    def has_pending(self, entity_id: str) -> bool:
+        """Return True if commands are queued for the device."""
+        return entity_id in self._pending
+
+    def pending_count(self, entity_ids: tuple[str, ...]) -> int:
+        """Return the number of commands queued for the given devices."""
+        return sum(len(self._pending.get(entity_id, ())) for entity_id in entity_ids)
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Write the outbox soon; bursts of commands are saved once."""
+        self._store.async_delay_save(lambda: self._pending, OUTBOX_SAVE_DELAY)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queued commands per device and lifetime counters."""
+        return {
+            "pending": {entity_id: sorted(commands) for entity_id, commands in self._pending.items()},
+            "queued": self.queued,
+            "collapsed": self.collapsed,
+            "replayed": self.replayed,
+        }
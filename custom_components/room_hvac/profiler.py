@@ -0,0 +1,195 @@
+"""On-demand profiler for room_hvac callbacks.
+
+The profiler swaps instrumented wrappers onto the entity class for the
+duration of a session and puts the original functions back afterwards, so
+nothing is measured (and nothing costs anything) while it is not running.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import types
+from time import perf_counter, thread_time
+from typing import Any, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CallStats:
+    """Aggregated timings for a single instrumented function."""
+
+    __slots__ = ("calls", "wall", "cpu", "max_wall")
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.max_wall = 0.0
+
+    def record(self, wall: float, cpu: float) -> None:
+        """Add one call to the aggregate."""
+        self.calls += 1
+        self.wall += wall
+        self.cpu += cpu
+        if wall > self.max_wall:
+            self.max_wall = wall
+
+
+@types.coroutine
+def _pass_through(value: Any) -> Any:
+    """Hand a value yielded by the wrapped coroutine to the event loop."""
+    return (yield value)
+
+
+def _wrap_sync(func: Callable[..., Any], stats: CallStats) -> Callable[..., Any]:
+    """Wrap a plain function or property getter."""
+
+    # functools.wraps also carries over markers such as HA's @callback flag
+    @functools.wraps(func)
+    def _profiled(*args: Any, **kwargs: Any) -> Any:
+        wall_start = perf_counter()
+        cpu_start = thread_time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(perf_counter() - wall_start, thread_time() - cpu_start)
+
+    return _profiled
+
+
+def _wrap_async(func: Callable[..., Any], stats: CallStats) -> Callable[..., Any]:
+    """Wrap a coroutine function.
+
+    Wall time covers the whole await. CPU time only counts the slices where the
+    coroutine is actually running on the loop, so time spent waiting on
+    downstream service calls is not charged to room_hvac.
+    """
+
+    @functools.wraps(func)
+    async def _profiled(*args: Any, **kwargs: Any) -> Any:
+        coro = func(*args, **kwargs)
+        wall_start = perf_counter()
+        cpu = 0.0
+        send_value: Any = None
+        pending_exc: BaseException | None = None
+        try:
+            while True:
+                cpu_start = thread_time()
+                try:
+                    if pending_exc is None:
+                        yielded = coro.send(send_value)
+                    else:
+                        exc, pending_exc = pending_exc, None
+                        yielded = coro.throw(exc)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    cpu += thread_time() - cpu_start
+                try:
+                    send_value = await _pass_through(yielded)
+                except BaseException as err:  # noqa: BLE001 - forwarded into the coroutine
+                    pending_exc = err
+                    send_value = None
+        finally:
+            stats.record(perf_counter() - wall_start, cpu)
+
+    return _profiled
+
+
+class IntegrationProfiler:
+    """Instrument the callbacks of one or more classes for a bounded session."""
+
+    def __init__(self, *targets: type) -> None:
+        """Initialize the profiler for the given classes."""
+        self._targets = targets
+        self._originals: list[tuple[type, str, Any]] = []
+        self._stats: dict[str, CallStats] = {}
+        self._started: float | None = None
+        self._elapsed = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Return True while the wrappers are installed."""
+        return self._started is not None
+
+    def start(self) -> None:
+        """Install wrappers on every function defined directly on the targets."""
+        if self.active:
+            return
+
+        for cls in self._targets:
+            for name, attr in list(vars(cls).items()):
+                # Skip dunders and the _attr_ backing properties HA generates
+                if name.startswith(("__", "_attr_")):
+                    continue
+                qualname = f"{cls.__name__}.{name}"
+
+                if isinstance(attr, property):
+                    if attr.fget is None:
+                        continue
+                    stats = self._stats.setdefault(qualname, CallStats())
+                    wrapped: Any = property(
+                        _wrap_sync(attr.fget, stats), attr.fset, attr.fdel, attr.__doc__
+                    )
+                elif inspect.iscoroutinefunction(attr):
+                    stats = self._stats.setdefault(qualname, CallStats())
+                    wrapped = _wrap_async(attr, stats)
+                elif inspect.isfunction(attr):
+                    stats = self._stats.setdefault(qualname, CallStats())
+                    wrapped = _wrap_sync(attr, stats)
+                else:
+                    continue
+
+                self._originals.append((cls, name, attr))
+                setattr(cls, name, wrapped)
+
+        self._started = perf_counter()
+        _LOGGER.debug("Profiler installed %d wrappers", len(self._originals))
+
+    def stop(self) -> None:
+        """Restore the original functions."""
+        if not self.active:
+            return
+
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+
+        self._elapsed = perf_counter() - self._started
+        self._started = None
+        _LOGGER.debug("Profiler removed all wrappers")
+
+    def report(self) -> dict[str, Any]:
+        """Return the aggregated results, busiest functions first."""
+        functions = [
+            {
+                "function": qualname,
+                "calls": stats.calls,
+                "wall_ms": round(stats.wall * 1000, 3),
+                "cpu_ms": round(stats.cpu * 1000, 3),
+                "max_wall_ms": round(stats.max_wall * 1000, 3),
+            }
+            for qualname, stats in self._stats.items()
+            if stats.calls
+        ]
+        functions.sort(key=lambda item: item["wall_ms"], reverse=True)
+        return {"duration_s": round(self._elapsed, 3), "functions": functions}
+
+    @staticmethod
+    def format_report(report: dict[str, Any]) -> str:
+        """Render a report as a fixed-width text table."""
+        lines = [
+            f"room_hvac profile over {report['duration_s']} s",
+            "",
+            f"{'function':<60} {'calls':>8} {'wall ms':>12} {'cpu ms':>12} {'max ms':>10}",
+        ]
+        for item in report["functions"]:
+            lines.append(
+                f"{item['function']:<60} {item['calls']:>8} {item['wall_ms']:>12.3f} "
+                f"{item['cpu_ms']:>12.3f} {item['max_wall_ms']:>10.3f}"
+            )
+        if not report["functions"]:
+            lines.append("(no instrumented calls)")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,153 @@
+"""On-demand refresh of stale downstream device states."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
+import logging
+
+from homeassistant.core import HomeAssistant, State, callback
+
+from .const import REFRESH_COALESCE_DELAY, REFRESH_MIN_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def state_age(state: State, now: datetime) -> float:
+    """Return how many seconds ago a device last reported its state.
+
+    Uses last_reported where available (it moves on every report, even an
+    unchanged one) and falls back to last_updated on older cores, where a
+    quiet device looks old however recently it reported. Rooms therefore
+    only use it for the state they find at setup, and then go by the
+    events they receive and the refreshes made here.
+    """
+    reported = getattr(state, "last_reported", None) or state.last_updated
+    return (now - reported).total_seconds()
+
+
+class RefreshCoordinator:
+    """Coalesces refresh requests for downstream devices across all rooms.
+
+    Rooms ask for devices whose cached state is too old to act on. Requests
+    arriving within REFRESH_COALESCE_DELAY are sent as one
+    homeassistant.update_entity call, and each device is refreshed at most
+    once per REFRESH_MIN_INTERVAL no matter how many rooms ask for it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        min_interval: float = REFRESH_MIN_INTERVAL,
+        delay: float = REFRESH_COALESCE_DELAY,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.hass = hass
+        self._min_interval = min_interval
+        self._delay = delay
+
+        # Devices waiting for the next batch, and the batch they will ride on
+        self._pending: set[str] = set()
+        self._batch: asyncio.Future[None] | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        # Batch future per device until its refresh completes
+        self._waiters: dict[str, asyncio.Future[None]] = {}
+        self._last_request: dict[str, float] = {}
+        # Loop time each device last answered a refresh
+        self._refreshed: dict[str, float] = {}
+
+        # Counters exposed through the hub for debugging
+        self.batches = 0
+        self.requested = 0
+        self.suppressed = 0
+
+    @callback
+    def async_request(self, entity_ids: Sequence[str]) -> list[asyncio.Future[None]]:
+        """Queue a refresh of the given devices and return what to wait on.
+
+        Devices already queued or in flight join that refresh; devices
+        refreshed less than min_interval ago are skipped.
+        """
+        now = self.hass.loop.time()
+        for entity_id in entity_ids:
+            if entity_id in self._waiters:
+                continue
+            if now - self._last_request.get(entity_id, -self._min_interval) < self._min_interval:
+                self.suppressed += 1
+                continue
+
+            if self._batch is None:
+                self._batch = self.hass.loop.create_future()
+                self._flush_handle = self.hass.loop.call_later(self._delay, self._flush)
+            self._pending.add(entity_id)
+            self._waiters[entity_id] = self._batch
+            self._last_request[entity_id] = now
+            self.requested += 1
+
+        waiters: list[asyncio.Future[None]] = []
+        for entity_id in entity_ids:
+            waiter = self._waiters.get(entity_id)
+            if waiter is not None and waiter not in waiters:
+                waiters.append(waiter)
+        return waiters
+
+    def refreshed_at(self, entity_id: str) -> float | None:
+        """Return when a device last answered a refresh, if it has.
+
+        An unchanged state fires no event, so this is the only sign that a
+        quiet device was polled and is still current.
+        """
+        return self._refreshed.get(entity_id)
+
+    async def async_refresh(self, entity_ids: Sequence[str], timeout: float) -> None:
+        """Refresh the given devices and wait (bounded) for the result."""
+        waiters = self.async_request(entity_ids)
+        if waiters:
+            await asyncio.wait(waiters, timeout=timeout)
+
+    @callback
+    def _flush(self) -> None:
+        """Send the pending batch as a single update_entity call."""
+        entity_ids = sorted(self._pending)
+        batch = self._batch
+        self._pending = set()
+        self._batch = None
+        self._flush_handle = None
+        self.batches += 1
+        self.hass.async_create_task(self._async_update(entity_ids, batch))
+
+    async def _async_update(self, entity_ids: list[str], batch: asyncio.Future[None]) -> None:
+        """Ask Home Assistant to poll the devices, then release the waiters."""
+        _LOGGER.debug("Refreshing stale devices: %s", entity_ids)
+        try:
+            await self.hass.services.async_call(
+                "homeassistant",
+                "update_entity",
+                {"entity_id": entity_ids},
+                blocking=True,
+            )
+        except Exception as e:
+            _LOGGER.warning("Refresh of %s failed: %s", entity_ids, e)
+        else:
+            now = self.hass.loop.time()
+            for entity_id in entity_ids:
+                self._refreshed[entity_id] = now
+        finally:
+            for entity_id in entity_ids:
+                if self._waiters.get(entity_id) is batch:
+                    del self._waiters[entity_id]
+            if not batch.done():
+                batch.set_result(None)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop any batch that has not been sent yet."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._batch is not None and not self._batch.done():
+            self._batch.set_result(None)
+        self._batch = None
+        self._pending.clear()
+        self._waiters.clear()
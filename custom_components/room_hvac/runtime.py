@@ -0,0 +1,65 @@
+"""Compact per-device runtime state for room_hvac rooms.
+
+Kept free of Home Assistant imports so the memory benchmark can load it on
+its own.
+"""
+from __future__ import annotations
+
+import sys
+from typing import Callable
+
+
+class DeviceRuntime:
+    """Fixed-layout runtime state of one downstream device in a room.
+
+    Replaces the per-room dicts that used to be keyed by entity_id strings
+    (listeners, last internal update, correction flag): one slotted record
+    per (room, role, device), with the entity_id interned once. It also
+    caches the device's latest temperature reading, whether it is
+    available and when it last sent an event, all kept from its events.
+    """
+
+    __slots__ = (
+        "entity_id",
+        "role",
+        "unsubscribe",
+        "last_internal_update",
+        "correcting",
+        "late_context",
+        "temperature",
+        "last_seen",
+        "available",
+    )
+
+    def __init__(self, entity_id: str, role: str) -> None:
+        """Initialize the record."""
+        self.entity_id = sys.intern(entity_id)
+        self.role = sys.intern(role)
+        self.unsubscribe: Callable[[], None] | None = None
+        self.last_internal_update = 0.0
+        self.correcting = False
+        # Context of our latest command that outlived its timeout
+        self.late_context: str | None = None
+        # Latest reported current temperature; kept while the device is away
+        self.temperature: float | None = None
+        # Loop time of the device's latest event; None until it has a state
+        self.last_seen: float | None = None
+        # False while the device reports unavailable
+        self.available = True
+
+    def reset(self) -> None:
+        """Drop the listener reference and transient flags."""
+        self.unsubscribe = None
+        self.last_internal_update = 0.0
+        self.correcting = False
+        self.late_context = None
+
+
+def build_devices(groups: dict[str, list[str]]) -> dict[str, DeviceRuntime]:
+    """Build the runtime records of a room, keyed by interned entity_id."""
+    devices: dict[str, DeviceRuntime] = {}
+    for role, entity_ids in groups.items():
+        for entity_id in entity_ids:
+            device = DeviceRuntime(entity_id, role)
+            devices[device.entity_id] = device
+    return devices
@@ -0,0 +1,221 @@
+"""Domain-wide comfort schedule wheel for room_hvac rooms."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_right, insort
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from datetime import datetime, timedelta
+import logging
+import random
+from typing import Any
+
+from homeassistant.const import WEEKDAYS
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    SCHEDULE_DAYS,
+    SCHEDULE_TIME,
+    SCHEDULE_PRESTART,
+    SCHEDULE_DUE_IN,
+    SCHEDULE_DISPATCH_RATE,
+    SCHEDULE_DISPATCH_JITTER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+ScheduleHandler = Callable[[dict[str, Any]], Awaitable[None]]
+# Starts a coroutine as one of the room's own tasks (see tasks.py); None once it is shut down
+TaskSpawner = Callable[[Coroutine[Any, Any, Any], str], "asyncio.Task[Any] | None"]
+
+
+def compile_schedule(records: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
+    """Expand stored schedule records into actions keyed by minute of the week.
+
+    A record applies on each of its days at its "HH:MM" time; when two
+    records land on the same minute the later one wins.
+    """
+    slots: dict[int, dict[str, Any]] = {}
+    for record in records:
+        hour, minute = (int(part) for part in record[SCHEDULE_TIME].split(":")[:2])
+        for day in record[SCHEDULE_DAYS]:
+            slots[WEEKDAYS.index(day) * MINUTES_PER_DAY + hour * 60 + minute] = record
+    return slots
+
+
+def compile_prestart(
+    records: list[dict[str, Any]], max_lead: int, step: int
+) -> dict[int, dict[str, Any]]:
+    """Return early-start checks every step minutes in the max_lead window before each record."""
+    slots: dict[int, dict[str, Any]] = {}
+    for record in records:
+        for slot in compile_schedule([record]):
+            for lead in range(step, max_lead + 1, step):
+                slots[(slot - lead) % MINUTES_PER_WEEK] = {
+                    SCHEDULE_PRESTART: record,
+                    SCHEDULE_DUE_IN: lead,
+                }
+    return slots
+
+
+class ScheduleWheel:
+    """One weekly timer wheel driving the schedules of every room.
+
+    Buckets are keyed by minute of the week; rooms due at the same minute
+    share a bucket, and only one Home Assistant timer exists at any time,
+    armed for the next occupied bucket. Due rooms are dispatched through a
+    queue in random order, spaced by the dispatch rate plus jitter, so a
+    fleet of rooms switching at 07:00 does not hit the vendor APIs at once.
+    Each action runs as a task of its room, so unloading the room cancels
+    and awaits it like the room's other work.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = SCHEDULE_DISPATCH_RATE,
+        jitter: float = SCHEDULE_DISPATCH_JITTER,
+    ) -> None:
+        """Initialize the wheel."""
+        self.hass = hass
+        self._rate = rate
+        self._jitter = jitter
+
+        # minute of week -> {room key: action}, plus the occupied minutes in order
+        self._buckets: dict[int, dict[str, dict[str, Any]]] = {}
+        self._slots: list[int] = []
+        self._rooms: dict[str, tuple[tuple[int, ...], ScheduleHandler, TaskSpawner]] = {}
+
+        self._timer: CALLBACK_TYPE | None = None
+        self._armed_slot: int | None = None
+
+        self._queue: deque[tuple[str, dict[str, Any]]] = deque()
+        self._worker: asyncio.Task[None] | None = None
+
+    @callback
+    def async_set(
+        self,
+        key: str,
+        schedule: dict[int, dict[str, Any]],
+        handler: ScheduleHandler,
+        spawn: TaskSpawner,
+    ) -> None:
+        """Register (or replace) the compiled schedule of a room.
+
+        The handler applies a due action; spawn starts it as a room task.
+        """
+        self._remove(key)
+        if schedule:
+            for slot, action in schedule.items():
+                bucket = self._buckets.get(slot)
+                if bucket is None:
+                    bucket = self._buckets[slot] = {}
+                    insort(self._slots, slot)
+                bucket[key] = action
+            self._rooms[key] = (tuple(schedule), handler, spawn)
+        self._arm()
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Unregister a room's schedule."""
+        self._remove(key)
+        self._arm()
+
+    def _remove(self, key: str) -> None:
+        """Drop a room from its buckets without re-arming."""
+        slots, _, _ = self._rooms.pop(key, ((), None, None))
+        for slot in slots:
+            bucket = self._buckets[slot]
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[slot]
+                self._slots.remove(slot)
+        self._queue = deque(item for item in self._queue if item[0] != key)
+
+    def next_due(self, key: str) -> datetime | None:
+        """Return when a room's schedule fires next (early-start checks excluded)."""
+        slots, _, _ = self._rooms.get(key, ((), None, None))
+        slots = [slot for slot in slots if SCHEDULE_PRESTART not in self._buckets[slot][key]]
+        if not slots:
+            return None
+        now = dt_util.now()
+        return min(self._slot_time(slot, now) for slot in slots)
+
+    @staticmethod
+    def _slot_time(slot: int, now: datetime) -> datetime:
+        """Return the next local time strictly after now that matches a slot."""
+        week_start = dt_util.start_of_local_day(now) - timedelta(days=now.weekday())
+        when = week_start + timedelta(minutes=slot)
+        if when <= now:
+            when += timedelta(days=7)
+        return when
+
+    @callback
+    def _arm(self) -> None:
+        """Arm the single timer for the next occupied bucket."""
+        if self._timer is not None:
+            self._timer()
+            self._timer = None
+            self._armed_slot = None
+        if not self._slots:
+            return
+
+        now = dt_util.now()
+        minute = now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+        index = bisect_right(self._slots, minute)
+        slot = self._slots[index % len(self._slots)]
+
+        self._armed_slot = slot
+        self._timer = async_track_point_in_time(self.hass, self._fire, self._slot_time(slot, now))
+
+    @callback
+    def _fire(self, _now: datetime) -> None:
+        """Queue every room due at the armed bucket and re-arm."""
+        self._timer = None
+        due = list(self._buckets.get(self._armed_slot, {}).items())
+        random.shuffle(due)
+        self._queue.extend(due)
+        _LOGGER.debug("Schedule wheel fired for %d rooms", len(due))
+
+        if due and (self._worker is None or self._worker.done()):
+            self._worker = self.hass.async_create_background_task(
+                self._async_dispatch(), f"{__name__} dispatch"
+            )
+        self._arm()
+
+    async def _async_dispatch(self) -> None:
+        """Hand queued actions to their rooms at a bounded, jittered rate."""
+        while self._queue:
+            key, action = self._queue.popleft()
+            entry = self._rooms.get(key)
+            if entry is not None:
+                _, handler, spawn = entry
+                spawn(self._async_run(key, handler, action), "schedule")
+            if self._queue:
+                await asyncio.sleep(1 / self._rate + random.uniform(0, self._jitter))
+
+    async def _async_run(self, key: str, handler: ScheduleHandler, action: dict[str, Any]) -> None:
+        """Apply one scheduled action, logging rather than propagating failures."""
+        # The room may have been removed since the action was dispatched
+        if key not in self._rooms:
+            return
+        try:
+            await handler(action)
+        except Exception as e:
+            _LOGGER.error("Scheduled action for %s failed: %s", key, e)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the timer and any pending dispatches."""
+        if self._timer is not None:
+            self._timer()
+            self._timer = None
+        self._queue.clear()
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
@@ -0,0 +1,69 @@
+"""Runtime counter sensors for room_hvac integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .accounting import RoomRuntime, runtime_key
+from .const import (
+    DOMAIN,
+    DATA_HUB,
+    AC_HVAC_MODES,
+    FH_HVAC_MODES,
+    CONF_AC_ENTITY_IDS,
+    CONF_FH_ENTITY_IDS,
+)
+
+# Counters are read from memory, so polling them is cheap
+SCAN_INTERVAL = timedelta(minutes=1)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up runtime sensors for the modes the room's device groups serve."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    runtime = hass.data[DATA_HUB].runtime.room(entry.entry_id)
+    
+    modes = []
+    if data.get(CONF_AC_ENTITY_IDS):
+        modes.extend(sorted(AC_HVAC_MODES))
+    if data.get(CONF_FH_ENTITY_IDS):
+        modes.extend(sorted(FH_HVAC_MODES))
+    
+    async_add_entities(
+        RoomHVACRuntimeSensor(entry.entry_id, runtime, runtime_key(mode)) for mode in modes
+    )
+
+
+class RoomHVACRuntimeSensor(SensorEntity):
+    """Total runtime of a room's device group in one HVAC mode."""
+    
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_suggested_display_precision = 2
+    
+    def __init__(self, entry_id: str, runtime: RoomRuntime, key: str) -> None:
+        """Initialize the runtime sensor."""
+        self._runtime = runtime
+        self._key = key
+        role, _, mode = key.partition("_")
+        self._attr_name = f"Room HVAC {role.upper()} {mode.replace('_', ' ')} runtime"
+        self._attr_unique_id = f"room_hvac_{entry_id}_runtime_{key}"
+    
+    @property
+    def native_value(self) -> float:
+        """Return the runtime in hours, including a segment still running."""
+        return round(self._runtime.total(self._key, self.hass.loop.time()) / 3600, 4)
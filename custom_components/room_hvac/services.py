@@ -0,0 +1,205 @@
+"""Domain services for room_hvac integration."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    DATA_HUB,
+    SERVICE_PROFILE,
+    SERVICE_DUMP_TRACE,
+    SERVICE_RELOAD_ALL,
+    SERVICE_SET_POWER_BUDGET,
+    SERVICE_SET_SHARED_POLICY,
+    ATTR_DURATION,
+    ATTR_POLICY,
+    ATTR_MAX_PARALLEL,
+    DEFAULT_PROFILE_DURATION,
+    MAX_PROFILE_DURATION,
+    DEFAULT_RELOAD_PARALLELISM,
+    MAX_RELOAD_PARALLELISM,
+    BUDGET_MAX_AC,
+    BUDGET_MAX_FH,
+    BUDGET_MAX_POWER,
+    SHARED_POLICIES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+        ),
+    }
+)
+
+DUMP_TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+    }
+)
+
+RELOAD_ALL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_MAX_PARALLEL, default=DEFAULT_RELOAD_PARALLELISM): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_RELOAD_PARALLELISM)
+        ),
+    }
+)
+
+# 0 clears a limit
+POWER_BUDGET_SCHEMA = vol.Schema(
+    {
+        vol.Optional(BUDGET_MAX_AC): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(BUDGET_MAX_FH): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(BUDGET_MAX_POWER): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+SHARED_POLICY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_POLICY): vol.In(SHARED_POLICIES),
+    }
+)
+
+
+async def _async_write_dump(hass: HomeAssistant, kind: str, suffix: str, text: str) -> str:
+    """Write a diagnostic dump to a timestamped file in the config directory."""
+    path = hass.config.path(
+        f"{DOMAIN}_{kind}_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.{suffix}"
+    )
+
+    def _write() -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    await hass.async_add_executor_job(_write)
+    return path
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the room_hvac domain services."""
+
+    async def async_handle_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile integration callbacks for a fixed window and dump the results."""
+        # Imported here so the profiler is never loaded unless asked for
+        from .climate import RoomHVACClimateEntity
+        from .profiler import IntegrationProfiler
+
+        hub = hass.data[DATA_HUB]
+        if hub.profiler is not None:
+            raise HomeAssistantError("A room_hvac profiling session is already running")
+
+        duration = call.data[ATTR_DURATION]
+        profiler = IntegrationProfiler(RoomHVACClimateEntity)
+        hub.profiler = profiler
+
+        _LOGGER.info("Profiling room_hvac callbacks for %s seconds", duration)
+        try:
+            profiler.start()
+            # Listeners hold bound methods captured at subscribe time; rebind them
+            for entity in hub.entities.values():
+                entity._subscribe_devices()
+            await asyncio.sleep(duration)
+        finally:
+            profiler.stop()
+            for entity in hub.entities.values():
+                entity._subscribe_devices()
+            hub.profiler = None
+
+        report = profiler.report()
+        path = await _async_write_dump(hass, "profile", "txt", IntegrationProfiler.format_report(report))
+        _LOGGER.info("Profile written to %s", path)
+
+        report["path"] = path
+        return report
+
+    async def async_handle_dump_trace(call: ServiceCall) -> ServiceResponse:
+        """Dump the routing trace of the selected rooms (all rooms by default)."""
+        hub = hass.data[DATA_HUB]
+        wanted = call.data.get(ATTR_ENTITY_ID)
+
+        traces = {
+            entity.entity_id: entity.trace.as_list()
+            for entity in hub.entities.values()
+            if wanted is None or entity.entity_id in wanted
+        }
+
+        path = await _async_write_dump(hass, "trace", "json", json.dumps(traces, indent=2, default=str))
+        _LOGGER.info("Routing trace for %d rooms written to %s", len(traces), path)
+
+        return {"path": path, "rooms": traces}
+
+    async def async_handle_reload_all(call: ServiceCall) -> ServiceResponse:
+        """Reload all room entries concurrently with bounded parallelism."""
+        return await hass.data[DATA_HUB].async_reload_entries(call.data[ATTR_MAX_PARALLEL])
+
+    async def async_handle_set_power_budget(call: ServiceCall) -> ServiceResponse:
+        """Change the building-wide power budget and return its statistics."""
+        budget = hass.data[DATA_HUB].budget
+        budget.async_set_limits({key: value or None for key, value in call.data.items()})
+        _LOGGER.info("Power budget limits set to %s", budget.limits)
+        return budget.stats()
+
+    async def async_handle_set_shared_policy(call: ServiceCall) -> ServiceResponse:
+        """Change how shared devices combine room demands and return them."""
+        hub = hass.data[DATA_HUB]
+        hub.arbiter.async_set_policy(call.data[ATTR_POLICY])
+        _LOGGER.info("Shared device policy set to %s", hub.arbiter.policy)
+        # Re-send every room's demands, one room at a time, so each shared
+        # device gets a single command for the new merge
+        for entity in list(hub.entities.values()):
+            await entity.async_resync_shared()
+        return hub.arbiter.stats()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_TRACE,
+        async_handle_dump_trace,
+        schema=DUMP_TRACE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RELOAD_ALL,
+        async_handle_reload_all,
+        schema=RELOAD_ALL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_POWER_BUDGET,
+        async_handle_set_power_budget,
+        schema=POWER_BUDGET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SHARED_POLICY,
+        async_handle_set_shared_policy,
+        schema=SHARED_POLICY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,59 @@
+"""Constant-memory smoothing for external room temperature readings."""
+from __future__ import annotations
+
+
+class SmoothedReading:
+    """Exponential moving average with a publish gate.
+
+    Every sample updates the average; a new value is only published when it
+    has moved by at least min_delta from the last published value and at
+    least min_interval seconds have passed since then. Keeps three numbers,
+    no sample history.
+    """
+
+    __slots__ = ("alpha", "min_delta", "min_interval", "value", "published", "published_at")
+
+    def __init__(self, alpha: float, min_delta: float, min_interval: float) -> None:
+        """Initialize the reading."""
+        self.alpha = alpha
+        self.min_delta = min_delta
+        self.min_interval = min_interval
+        self.value: float | None = None
+        self.published: float | None = None
+        self.published_at = 0.0
+
+    def add(self, sample: float, now: float) -> bool:
+        """Fold a sample into the average; return True if it should be published."""
+        if self.value is None:
+            self.value = sample
+        else:
+            self.value += self.alpha * (sample - self.value)
+        return self.publish(now)
+
+    def publish(self, now: float) -> bool:
+        """Publish the average if the gate allows it; return True if it did."""
+        if self.value is None:
+            return False
+        if self.published is not None:
+            if abs(self.value - self.published) < self.min_delta:
+                return False
+            if now - self.published_at < self.min_interval:
+                return False
+
+        self.published = round(self.value, 2)
+        self.published_at = now
+        return True
+
+    def held_for(self, now: float) -> float | None:
+        """Return how long a changed average is held back by min_interval, if at all."""
+        if self.value is None or self.published is None:
+            return None
+        if abs(self.value - self.published) < self.min_delta:
+            return None
+        return max(self.min_interval - (now - self.published_at), 0.0)
+
+    def reset(self) -> None:
+        """Forget the average, e.g. when every sensor becomes unavailable."""
+        self.value = None
+        self.published = None
+        self.published_at = 0.0
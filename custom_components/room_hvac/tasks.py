@@ -0,0 +1,85 @@
+"""Registry of the background tasks a room_hvac room starts."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Coroutine
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TaskRegistry:
+    """Tracks every task one room starts, so removal can stop them all.
+
+    Tasks are created on the event loop and forgotten as soon as they
+    finish. Shutting the registry down cancels whatever is still running,
+    waits for it to unwind and refuses new work, so nothing keeps acting
+    on an entry after it was unloaded. Errors are counted, not logged:
+    tasks either log their own failures or are awaited by a caller.
+    """
+
+    def __init__(self, hass: HomeAssistant, owner: str) -> None:
+        """Initialize the registry."""
+        self.hass = hass
+        self._owner = owner
+        self._tasks: dict[asyncio.Task[Any], str] = {}
+        self._closed = False
+
+        # Lifetime counters
+        self.started = 0
+        self.cancelled = 0
+        self.failed = 0
+
+    @callback
+    def create(self, coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task[Any] | None:
+        """Start and track a task; returns None once the registry is shut down."""
+        if self._closed:
+            _LOGGER.debug("Not starting %s for %s: shutting down", name, self._owner)
+            coro.close()
+            return None
+        task = self.hass.async_create_task(coro, f"{self._owner} {name}")
+        self.started += 1
+        if not task.done():
+            self._tasks[task] = name
+        task.add_done_callback(self._task_done)
+        return task
+
+    @callback
+    def _task_done(self, task: asyncio.Task[Any]) -> None:
+        """Forget a finished task and count how it ended."""
+        self._tasks.pop(task, None)
+        if task.cancelled():
+            self.cancelled += 1
+        elif task.exception() is not None:
+            self.failed += 1
+
+    def __len__(self) -> int:
+        """Return the number of running tasks."""
+        return len(self._tasks)
+
+    def running(self) -> dict[str, int]:
+        """Return the running tasks counted by name."""
+        return dict(Counter(self._tasks.values()))
+
+    async def async_shutdown(self) -> None:
+        """Cancel every running task and wait until all of them have ended."""
+        self._closed = True
+        tasks = [task for task in self._tasks if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            _LOGGER.debug("Cancelled %d tasks of %s", len(tasks), self._owner)
+
+    def stats(self) -> dict[str, Any]:
+        """Return running tasks and lifetime counters."""
+        return {
+            "running": self.running(),
+            "started": self.started,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+        }
@@ -0,0 +1,117 @@
+"""Online thermal model of a room, learned from observed temperatures."""
+from __future__ import annotations
+
+from array import array
+
+
+class RateEstimator:
+    """Least-squares rate of temperature change over a sliding window.
+
+    Samples are (elapsed hours, temperature change) pairs between two
+    consecutive readings taken in the same mode. They live in a fixed
+    array-backed ring buffer, and the sums for a regression through the
+    origin are updated incrementally as pairs enter and leave the window,
+    so each update is O(1) in time and memory.
+    """
+
+    __slots__ = ("_pairs", "_size", "_count", "_next", "_sxx", "_sxy")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the estimator with room for size pairs."""
+        self._pairs = array("d", bytes(16 * size))
+        self._size = size
+        self._count = 0
+        self._next = 0
+        self._sxx = 0.0
+        self._sxy = 0.0
+
+    def add(self, hours: float, delta: float) -> None:
+        """Add one observed change, evicting the oldest when full."""
+        index = 2 * self._next
+        if self._count == self._size:
+            old_x = self._pairs[index]
+            self._sxx -= old_x * old_x
+            self._sxy -= old_x * self._pairs[index + 1]
+        else:
+            self._count += 1
+
+        self._pairs[index] = hours
+        self._pairs[index + 1] = delta
+        self._sxx += hours * hours
+        self._sxy += hours * delta
+        self._next = (self._next + 1) % self._size
+
+    def __len__(self) -> int:
+        """Return the number of pairs in the window."""
+        return self._count
+
+    @property
+    def rate(self) -> float | None:
+        """Return degrees per hour, or None until enough pairs are seen."""
+        if self._count < self._size // 4 or self._sxx <= 0:
+            return None
+        return self._sxy / self._sxx
+
+
+class ThermalModel:
+    """Heat-up and cool-down rates of one room, per HVAC mode.
+
+    Readings are folded in as they arrive; a pair is only formed between
+    two readings taken in the same mode at least min_interval apart, so
+    mode switches and noisy sensor ticks never skew the rates.
+    """
+
+    __slots__ = ("_estimators", "_size", "_min_interval", "_last_time", "_last_temp", "_last_mode")
+
+    def __init__(self, size: int, min_interval: float) -> None:
+        """Initialize the model."""
+        self._estimators: dict[str, RateEstimator] = {}
+        self._size = size
+        self._min_interval = min_interval
+        self._last_time = 0.0
+        self._last_temp: float | None = None
+        self._last_mode: str | None = None
+
+    def observe(self, mode: str, temperature: float, now: float) -> None:
+        """Fold a room temperature reading taken in a committed mode."""
+        if self._last_temp is not None and mode == self._last_mode:
+            elapsed = now - self._last_time
+            if elapsed < self._min_interval:
+                return
+            estimator = self._estimators.get(mode)
+            if estimator is None:
+                estimator = self._estimators[mode] = RateEstimator(self._size)
+            estimator.add(elapsed / 3600, temperature - self._last_temp)
+
+        self._last_time = now
+        self._last_temp = temperature
+        self._last_mode = mode
+
+    def break_series(self) -> None:
+        """Start a new series; the next reading pairs with nothing before it."""
+        self._last_temp = None
+        self._last_mode = None
+
+    def rate(self, mode: str) -> float | None:
+        """Return the learned rate for a mode in degrees per hour."""
+        estimator = self._estimators.get(mode)
+        return estimator.rate if estimator is not None else None
+
+    def lead_time(self, mode: str, current: float, target: float, rising: bool) -> float | None:
+        """Return seconds the mode needs to move current to target, if known.
+
+        rising says whether the mode raises the temperature (heating) or
+        lowers it (cooling). Returns 0 when the room is already there and
+        None until the mode has been seen moving the temperature that way.
+        """
+        gap = target - current if rising else current - target
+        if gap <= 0:
+            return 0.0
+        rate = self.rate(mode)
+        if rate is None:
+            return None
+        if not rising:
+            rate = -rate
+        if rate <= 0:
+            return None
+        return gap / rate * 3600
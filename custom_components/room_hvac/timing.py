@@ -0,0 +1,35 @@
+"""Phase timing of room_hvac entry setup."""
+from __future__ import annotations
+
+import time
+
+
+class SetupTimer:
+    """Wall-clock durations of the named phases of one entry's setup.
+
+    Phases are marked in the order they finish; each mark closes the phase
+    that began at the previous mark (or at creation). Durations are in
+    milliseconds, for diagnostics and the startup benchmark.
+    """
+
+    __slots__ = ("phases", "_started", "_last")
+
+    def __init__(self) -> None:
+        """Start timing."""
+        self._started = self._last = time.perf_counter()
+        self.phases: dict[str, float] = {}
+
+    def mark(self, phase: str) -> None:
+        """Close a phase at the current time."""
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000, 2)
+        self._last = now
+
+    @property
+    def total_ms(self) -> float:
+        """Return the time from creation to the last mark."""
+        return round((self._last - self._started) * 1000, 2)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return every phase plus the total."""
+        return {**self.phases, "total": self.total_ms}
@@ -0,0 +1,98 @@
+"""Bounded in-memory routing trace for room_hvac rooms."""
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any
+
+from .const import TRACE_BUFFER_SIZE
+
+
+class TraceRecord:
+    """A single routing decision or downstream command."""
+
+    __slots__ = (
+        "timestamp",
+        "trigger",
+        "device",
+        "service",
+        "args",
+        "outcome",
+        "latency",
+        "context_id",
+    )
+
+    def __init__(
+        self,
+        timestamp: float,
+        trigger: str,
+        device: str | None,
+        service: str | None,
+        args: dict[str, Any] | None,
+        outcome: str,
+        latency: float | None,
+        context_id: str | None,
+    ) -> None:
+        """Initialize the record."""
+        self.timestamp = timestamp
+        self.trigger = trigger
+        self.device = device
+        self.service = service
+        self.args = args
+        self.outcome = outcome
+        self.latency = latency
+        self.context_id = context_id
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a JSON-serialisable dict."""
+        return {
+            "timestamp": self.timestamp,
+            "trigger": self.trigger,
+            "device": self.device,
+            "service": self.service,
+            "args": self.args,
+            "outcome": self.outcome,
+            "latency_ms": None if self.latency is None else round(self.latency * 1000, 1),
+            "context_id": self.context_id,
+        }
+
+
+class RoutingTrace:
+    """Fixed-size ring buffer of trace records for one room.
+
+    Recording is a single deque append; the oldest record is dropped once the
+    buffer is full, so memory stays constant no matter how busy the room is.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, maxlen: int = TRACE_BUFFER_SIZE) -> None:
+        """Initialize an empty trace."""
+        self._records: deque[TraceRecord] = deque(maxlen=maxlen)
+
+    def __len__(self) -> int:
+        """Return the number of buffered records."""
+        return len(self._records)
+
+    def record(
+        self,
+        trigger: str,
+        device: str | None = None,
+        service: str | None = None,
+        args: dict[str, Any] | None = None,
+        outcome: str = "ok",
+        latency: float | None = None,
+        context_id: str | None = None,
+    ) -> None:
+        """Append a record, evicting the oldest one when full."""
+        self._records.append(
+            TraceRecord(time.time(), trigger, device, service, args, outcome, latency, context_id)
+        )
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return all buffered records, oldest first."""
+        return [record.as_dict() for record in self._records]
+
+    def clear(self) -> None:
+        """Drop all buffered records."""
+        self._records.clear()
@@ -0,0 +1,63 @@
+"""Mode transition state for room_hvac rooms."""
+from __future__ import annotations
+
+import asyncio
+from enum import StrEnum
+
+from homeassistant.core import Event
+
+
+class TransitionPhase(StrEnum):
+    """Phase of a room's HVAC mode transition."""
+
+    IDLE = "idle"
+    STOPPING_OLD = "stopping_old"
+    STARTING_NEW = "starting_new"
+    CONFIRMING = "confirming"
+
+
+class ModeTransition:
+    """One in-flight switch of a room to a new HVAC mode.
+
+    While a transition runs, the room's committed hvac_mode stays at the old
+    value; it only changes once the new device group has confirmed. Downstream
+    events seen in the meantime are absorbed (echoes from the devices being
+    switched) or queued (anything else) and replayed after the commit.
+    """
+
+    __slots__ = (
+        "target",
+        "start_ids",
+        "phase",
+        "task",
+        "pending",
+        "confirmed",
+        "queued",
+        "superseded",
+        "absorbed",
+        "publish",
+    )
+
+    def __init__(self, target: str, start_ids: tuple[str, ...], publish: bool = True) -> None:
+        """Initialize the transition.
+
+        With publish False the caller writes state (and runs force-mode
+        validation) itself once it has applied the rest of its change.
+        """
+        self.target = target
+        self.start_ids = start_ids
+        self.phase = TransitionPhase.IDLE
+        self.task: asyncio.Task[None] | None = None
+        self.pending: set[str] = set()
+        self.confirmed = asyncio.Event()
+        self.queued: dict[str, Event] = {}
+        self.superseded = False
+        self.absorbed = 0
+        self.publish = publish
+
+    def confirm(self, entity_id: str, state: str) -> None:
+        """Mark a member of the new group as having reached the target mode."""
+        if state == self.target and entity_id in self.pending:
+            self.pending.discard(entity_id)
+            if not self.pending:
+                self.confirmed.set()
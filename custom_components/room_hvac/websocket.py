@@ -0,0 +1,34 @@
+"""Websocket commands of the room_hvac integration."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_HUB, WS_TYPE_SUBSCRIBE
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command({vol.Required("type"): WS_TYPE_SUBSCRIBE})
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stream all rooms: one compact snapshot, then batched field deltas."""
+
+    @callback
+    def forward(message: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], message))
+
+    feed = hass.data[DATA_HUB].feed
+    connection.subscriptions[msg["id"]] = feed.async_subscribe(forward)
+    connection.send_result(msg["id"])
+    forward({"snapshot": feed.snapshot()})